@@ -0,0 +1,38 @@
+"""
+Created on October 18, 2026
+@author: Lance A. Endres
+
+Measures the speed (points per second) of PoissonDiskSampling.Sample as the number of samples grows.  The scalar
+method scales with the square of the number of samples, so it is only run for the smaller sizes.
+"""
+import shapely
+import random
+import time
+
+from   lendres.algorithms.PoissonDiskSampling                        import PoissonDiskSampling
+
+
+minDistance      = 1.0
+radii            = [25, 50, 100, 200, 400]
+maxScalarRadius  = 100
+
+
+def RunBenchmark(method, radius):
+    # A circle with many vertices is used to represent a complex field boundary.
+    polygon   = shapely.Point(0, 0).buffer(radius, quad_segs=500)
+
+    random.seed(1)
+    startTime = time.perf_counter()
+    points    = PoissonDiskSampling.Sample(polygon, minDistance, method=method)
+    elapsed   = time.perf_counter() - startTime
+
+    return len(points), elapsed
+
+
+print("{0:<12}{1:>12}{2:>12}{3:>16}".format("Method", "Samples", "Seconds", "Points/Second"))
+for radius in radii:
+    for method in ["vectorized", "scalar"]:
+        if method == "scalar" and radius > maxScalarRadius:
+            continue
+        numberOfPoints, elapsed = RunBenchmark(method, radius)
+        print("{0:<12}{1:>12}{2:>12.3f}{3:>16.0f}".format(method, numberOfPoints, elapsed, numberOfPoints/elapsed))
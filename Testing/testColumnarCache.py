@@ -0,0 +1,137 @@
+"""
+Created on October 18, 2026
+@author: Lance A. Endres
+"""
+import pandas                                                        as pd
+import numpy                                                         as np
+import os
+import tempfile
+import time
+
+from   lendres.io.ColumnarCache                                      import ColumnarCache
+from   lendres.data.DataComparison                                   import DataComparison
+
+import unittest
+
+
+class TestColumnarCache(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.file      = os.path.join(self.directory.name, "data.csv")
+        self.cache     = ColumnarCache(os.path.join(self.directory.name, "cache"))
+        pd.DataFrame({"Time" : np.arange(5.0), "Speed" : [1, 2, 3, 4, 5], "Label" : ["a", "b", None, "d", "e"]}).to_csv(self.file, index=False)
+
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+
+    def testReadCsv(self):
+        expected = pd.read_csv(self.file)
+        self.assertIsNone(self.cache.Load(self.file))
+
+        # The first read parses the file, the second is loaded from the cache.
+        pd.testing.assert_frame_equal(self.cache.ReadCsv(self.file), expected)
+        cached = self.cache.Load(self.file)
+        pd.testing.assert_frame_equal(cached, expected)
+        self.assertFalse(cached["Time"].to_numpy().flags.owndata)
+
+        # Modifying the loaded data does not change the cache.
+        cached.loc[0, "Time"] = 100.0
+        self.assertEqual(self.cache.Load(self.file)["Time"].iloc[0], 0.0)
+
+        # Different arguments are cached separately.
+        projected = self.cache.ReadCsv(self.file, usecols=["Time", "Label"], dtype={"Label" : "category"}, index_col="Time")
+        pd.testing.assert_frame_equal(self.cache.Load(self.file, usecols=["Time", "Label"], dtype={"Label" : "category"}, index_col="Time"), projected)
+
+
+    def testTextColumns(self):
+        dataFrame = pd.DataFrame({
+            "Time"     : np.arange(4.0),
+            "Label"    : ["a", None, "c", "a"],
+            "Grade"    : pd.Categorical(["low", "high", None, "low"], categories=["low", "high"], ordered=True),
+            "Name"     : pd.array(["x", "y", None, "z"], dtype="string")
+        })
+        self.cache.Save(dataFrame, self.file)
+        pd.testing.assert_frame_equal(self.cache.Load(self.file), dataFrame)
+
+        # Nothing in the cache needs to be unpickled.
+        for folder, directories, files in os.walk(self.cache.directory):
+            for file in files:
+                if file.endswith(".npy"):
+                    np.load(os.path.join(folder, file), allow_pickle=False)
+
+        # Object values that are not text are not cached.
+        mixed = pd.DataFrame({"Time" : np.arange(2.0), "Value" : [1, "a"]})
+        self.assertFalse(self.cache.CanSave(mixed))
+        self.assertRaises(Exception, self.cache.Save, mixed, self.file)
+
+
+    def testReplaceEntry(self):
+        self.cache.ReadCsv(self.file)
+        cached = self.cache.Load(self.file)
+
+        # Saving again must not change the data that is already loaded (memory mapped).
+        self.cache.Save(pd.DataFrame({"Time" : np.arange(5.0) + 10, "Speed" : np.zeros(5, dtype=int)}), self.file)
+        self.assertEqual(cached["Time"].tolist(), [0.0, 1.0, 2.0, 3.0, 4.0])
+        self.assertEqual(self.cache.Load(self.file)["Time"].iloc[0], 10.0)
+
+        # Only the newest version of the entry is kept.
+        entries = [os.path.join(self.cache.directory, name) for name in os.listdir(self.cache.directory)]
+        self.assertEqual(len(entries), 1)
+        self.assertEqual(len([name for name in os.listdir(entries[0]) if os.path.isdir(os.path.join(entries[0], name))]), 1)
+
+
+    def testCallableArguments(self):
+        # Functions cannot be told apart, so reads with them are not cached.
+        self.assertFalse(self.cache.CanCache(usecols=lambda column : column == "Time"))
+        self.assertTrue(self.cache.CanCache(usecols=["Time"], dtype={"Speed" : np.float32}, na_values={"Label"}))
+
+        time  = self.cache.ReadCsv(self.file, usecols=lambda column : column == "Time")
+        speed = self.cache.ReadCsv(self.file, usecols=lambda column : column == "Speed")
+        self.assertEqual(list(time.columns), ["Time"])
+        self.assertEqual(list(speed.columns), ["Speed"])
+        self.assertFalse(os.path.exists(self.cache.directory) and os.listdir(self.cache.directory))
+        self.assertRaises(Exception, self.cache.Save, time, self.file, usecols=lambda column : column == "Time")
+
+
+    def testSaveCsv(self):
+        # Read in chunks of two rows, so the missing label and the integer column types are combined across chunks.
+        for arguments in [{}, {"index_col" : "Time", "dtype" : {"Label" : "category"}}]:
+            self.cache.SaveCsv(self.file, chunkSize=2, **arguments)
+            pd.testing.assert_frame_equal(self.cache.Load(self.file, **arguments), pd.read_csv(self.file, **arguments))
+
+        # Each chunk is appended to the column files, which are memory mapped when loaded.
+        self.assertFalse(self.cache.Load(self.file)["Time"].to_numpy().flags.owndata)
+
+
+    def testSourceChanged(self):
+        self.cache.ReadCsv(self.file)
+
+        pd.DataFrame({"Time" : np.arange(3.0), "Speed" : [7, 8, 9]}).to_csv(self.file, index=False)
+        os.utime(self.file, ns=(time.time_ns(), time.time_ns() + 10**9))
+        self.assertIsNone(self.cache.Load(self.file))
+        self.assertEqual(self.cache.ReadCsv(self.file)["Speed"].tolist(), [7, 8, 9])
+
+        self.cache.Clear()
+        self.assertIsNone(self.cache.Load(self.file))
+
+
+    def testDataComparison(self):
+        dataComparison = DataComparison("Time", directory=self.directory.name, cacheDirectory=self.cache.directory)
+        dataComparison.LoadFile("data.csv", "First")
+        dataComparison.LoadFiles(["data.csv"], ["Second"])
+        self.assertIsNotNone(self.cache.Load(self.file))
+        self.assertEqual(dataComparison.GetValue(1, "Speed", 3.0), 4)
+
+        # Files read with a "usecols" function are not cached.
+        dataComparison.LoadFiles(["data.csv", "data.csv"], ["Third", "Fourth"], usecols=lambda column : column == "Speed", maxWorkers=1)
+        dataComparison.LoadFiles(["data.csv"], ["Fifth"], usecols=lambda column : column == "Label")
+        self.assertEqual(list(dataComparison.dataSets[2].columns), ["Time", "Speed"])
+        self.assertEqual(list(dataComparison.dataSets[4].columns), ["Time", "Label"])
+        self.assertEqual(len(os.listdir(self.cache.directory)), 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -3,8 +3,12 @@ Created on July 20, 2023
 @author: Lance A. Endres
 """
 import pandas                                                        as pd
+import numpy                                                         as np
+import matplotlib.pyplot                                             as plt
 import os
+import mmap
 import math
+import tempfile
 
 from   lendres.io.ConsoleHelper                                      import ConsoleHelper
 from   lendres.data.DataComparison                                   import DataComparison
@@ -14,6 +18,19 @@ import unittest
 
 pd.set_option('display.max_columns', None)
 
+
+def GetMaximumSpeed(dataSet):
+    return dataSet["Speed"].max()
+
+
+def IsMemoryMapped(dataSet):
+    # Data sets loaded from the cache are memory mapped, data sets that are pickled are not.
+    values = dataSet["Time"].to_numpy()
+    while values is not None and not isinstance(values, mmap.mmap):
+        values = getattr(values, "base", None)
+    return values is not None
+
+
 class TestDataComparison(unittest.TestCase):
 
     @classmethod
@@ -85,5 +102,167 @@ class TestDataComparison(unittest.TestCase):
         self.assertAlmostEqual(self.dataComparison.GetValue(1, self.velColumn, 11), 75.1645423, places=3)
 
 
+
+class TestDataComparisonResample(unittest.TestCase):
+
+    def setUp(self):
+        self.dataComparison = DataComparison(independentColumn="Time")
+        self.dataComparison.AddDataSet(pd.DataFrame({"Time" : [0.0, 1.0, 2.0, 3.0], "a" : [0.0, 10.0, 20.0, 30.0], "b" : [1.0, 2.0, 3.0, 4.0]}), "Fast")
+        self.dataComparison.AddDataSet(pd.DataFrame({"Time" : [0.5, 2.5], "a" : [5.0, 25.0], "b" : [0.0, 1.0]}), "Slow")
+
+
+    def testUnionGrid(self):
+        resampled = self.dataComparison.Resample()
+        self.assertEqual(list(resampled.columns), ["Time", "Fast a", "Fast b", "Slow a", "Slow b"])
+        np.testing.assert_array_equal(resampled["Time"], [0.0, 0.5, 1.0, 2.0, 2.5, 3.0])
+        np.testing.assert_allclose(resampled["Fast a"], [0.0, 5.0, 10.0, 20.0, 25.0, 30.0])
+        np.testing.assert_allclose(resampled["Slow a"], [np.nan, 5.0, 10.0, 20.0, 25.0, np.nan])
+
+        # The result matches GetValue at the sample points.
+        for time, value in zip(resampled["Time"], resampled["Fast b"]):
+            if time in [0.0, 1.0, 2.0, 3.0]:
+                self.assertEqual(value, self.dataComparison.GetValue(0, "b", time))
+
+
+    def testGrids(self):
+        resampled = self.dataComparison.Resample("a", grid="reference", reference=1, method="previous")
+        np.testing.assert_array_equal(resampled["Time"], [0.5, 2.5])
+        np.testing.assert_array_equal(resampled["Fast a"], [0.0, 20.0])
+
+        resampled = self.dataComparison.Resample("b", grid="step", step=0.75, method="nearest", dataSets=[0])
+        np.testing.assert_allclose(resampled["Time"], [0.0, 0.75, 1.5, 2.25, 3.0])
+        np.testing.assert_array_equal(resampled["Fast b"], [1.0, 2.0, 2.0, 3.0, 4.0])
+
+        self.assertRaises(Exception, self.dataComparison.Resample, grid="step")
+        self.assertRaises(Exception, self.dataComparison.Resample, grid="other")
+        self.assertRaises(Exception, self.dataComparison.Resample, method="cubic")
+
+
+    def testQuery(self):
+        times  = [-1.0, 0.0, 0.7, 2.5, 3.0]
+        values = self.dataComparison.Query(times, ["b", "a"])
+        self.assertEqual(values.shape, (2, 5, 2))
+
+        # The default method returns the same values as GetValue.
+        for time, row in zip(times[1:], values[0, 1:]):
+            self.assertEqual(row[0], self.dataComparison.GetValue(0, "b", time))
+            self.assertEqual(row[1], self.dataComparison.GetValue(0, "a", time))
+        np.testing.assert_array_equal(values[1, :, 1], [np.nan, np.nan, 5.0, 25.0, np.nan])
+
+        table = self.dataComparison.Query(times, ["b", "a"], dataSets=[1], method="linear", output="dataframe")
+        self.assertEqual(list(table.columns), ["Data Set", "Time", "Column", "Value"])
+        self.assertEqual(len(table), 10)
+        self.assertEqual(table["Data Set"].unique().tolist(), ["Slow"])
+        self.assertEqual(table.iloc[4].tolist()[:3], ["Slow", 0.7, "b"])
+        self.assertAlmostEqual(table.iloc[4]["Value"], 0.1)
+        self.assertAlmostEqual(table.iloc[5]["Value"], 7.0)
+
+        self.assertRaises(Exception, self.dataComparison.Query, times, output="list")
+
+
+    def testLoadFiles(self):
+        with tempfile.TemporaryDirectory() as directory:
+            for i in range(3):
+                pd.DataFrame({"Time" : np.arange(10.0), "a" : np.arange(10.0)*i, "b" : np.ones(10)}).to_csv(os.path.join(directory, "run" + str(i) + ".csv"), index=False)
+
+            dataComparison = DataComparison(independentColumn="Time", directory=directory)
+            files          = ["run0.csv", "run1.csv", "run2.csv"]
+            statistics     = dataComparison.LoadFiles(files, usecols=["a"], dtype={"a" : np.float32}, maxWorkers=2)
+
+            self.assertEqual(dataComparison.dataSetNames, ["run0", "run1", "run2"])
+            self.assertEqual(list(dataComparison.dataSets[2].columns), ["Time", "a"])
+            self.assertEqual(dataComparison.dataSets[2]["a"].dtype, np.float32)
+            self.assertEqual(dataComparison.GetValue(2, "a", 4.0), 8.0)
+            self.assertEqual(statistics["Rows"].tolist(), [10, 10, 10])
+            self.assertTrue((statistics["Time (s)"] >= 0).all())
+
+            # A function that selects the columns.  The independent column is still read.
+            dataComparison = DataComparison(independentColumn="Time", directory=directory)
+            dataComparison.LoadFiles(files, usecols="b".__eq__, executorType="process", maxWorkers=2)
+            self.assertEqual(list(dataComparison.dataSets[0].columns), ["Time", "b"])
+
+            self.assertRaises(Exception, dataComparison.LoadFiles, ["run0.csv", "missing.csv"])
+            self.assertRaises(Exception, dataComparison.LoadFiles, files, names=["one"])
+
+
+class TestDataComparisonFiles(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        data           = pd.DataFrame({"Time" : np.arange(0, 100, 0.5), "Speed" : np.arange(200.0)**2, "Torque" : np.arange(200)})
+        data.to_csv(os.path.join(self.directory.name, "run.csv"), index=False)
+
+        self.dataComparison = DataComparison("Time", directory=self.directory.name, cacheDirectory=os.path.join(self.directory.name, "cache"))
+        self.dataComparison.LoadLazyFile("run.csv", "Lazy")
+        self.dataComparison.LoadFile("run.csv", "Eager")
+
+
+    def tearDown(self):
+        plt.close("all")
+        self.directory.cleanup()
+
+
+    def testApplyParallel(self):
+        def AddPower(dataSet):
+            dataSet["Power"] = dataSet["Speed"] * dataSet["Torque"]
+            return dataSet.name
+
+        # The lazy data set is always sent to the processes as a reference to the cache, the data set loaded through
+        # the cache only when requested.
+        results = self.dataComparison.ApplyParallel(GetMaximumSpeed, executorType="process", maxWorkers=2)
+        self.assertEqual(results, [199.0**2, 199.0**2])
+        self.assertEqual(self.dataComparison.ApplyParallel(IsMemoryMapped, executorType="process", maxWorkers=2), [True, False])
+        self.assertEqual(self.dataComparison.ApplyParallel(IsMemoryMapped, executorType="process", maxWorkers=2, useCacheReferences=True), [True, True])
+
+        # Modified values are copied to the processes.
+        self.dataComparison.dataSets[1]["Speed"] *= 100
+        results = self.dataComparison.ApplyParallel(GetMaximumSpeed, executorType="process", maxWorkers=2)
+        self.assertEqual(results, [199.0**2, 100*199.0**2])
+        self.dataComparison.dataSets[1]["Speed"] /= 100
+
+        self.assertEqual(self.dataComparison.ApplyParallel(AddPower, maxWorkers=2), ["Lazy", "Eager"])
+        self.assertEqual(self.dataComparison.GetValue(0, "Power", 1.0), 8.0)
+        self.assertEqual(self.dataComparison.GetValue(1, "Power", 1.0), 8.0)
+
+        # Once modified, the data sets no longer match the cache and are copied to the processes.
+        self.assertEqual(self.dataComparison.ApplyParallel(IsMemoryMapped, executorType="process", maxWorkers=2, useCacheReferences=True), [False, False])
+
+        # The error raised by the function is passed on with the name of the data set added.
+        def Fail(dataSet):
+            raise ValueError("bad data")
+        with self.assertRaises(ValueError) as context:
+            self.dataComparison.ApplyParallel(lambda dataSet: Fail(dataSet) if dataSet.name == "Eager" else None)
+        self.assertIn("Eager", "".join(context.exception.__notes__))
+
+
+    def testDecimatedPlots(self):
+        data = pd.DataFrame({"Time" : np.arange(200000)*0.001, "Speed" : np.sin(np.arange(200000)*0.01), "Torque" : np.zeros(200000)})
+        data.loc[123456, "Speed"] = 5.0
+        self.dataComparison.AddDataSet(data, "Long")
+
+        figure, axes = self.dataComparison.NewComparisonPlot("Speed")
+        line         = axes.get_lines()[2]
+        self.assertLess(len(line.get_xdata()), 2*axes.get_window_extent().width + 3)
+        self.assertEqual(np.max(line.get_ydata()), 5.0)
+
+        # Zooming in decimates again from the full data.
+        axes.set_xlim(123.0, 124.0)
+        self.assertEqual(len(line.get_xdata()), 1003)
+        self.assertEqual(np.max(line.get_ydata()), 5.0)
+
+        plt.figure()
+        figure, axes = self.dataComparison.NewComparisonPlot("Speed", decimate=False)
+        self.assertEqual(len(axes.get_lines()[2].get_xdata()), 200000)
+
+        figure = self.dataComparison.CreateMultiAxisComparisonPlot(["Speed", "Torque"], ["Speed", "Torque"], xLimits=(10, 20))
+        self.assertEqual(len(figure.axes[0].get_lines()[0].get_xdata()), 23)
+        self.assertLess(len(figure.axes[0].get_lines()[2].get_xdata()), 10003)
+
+        # A tuple of columns is plotted on one axes.
+        plt.figure()
+        figure = self.dataComparison.CreateMultiAxisComparisonPlot([("Speed", "Torque")], ["Speed and Torque"], xLimits=(10, 20))
+        self.assertEqual([line.get_label() for line in figure.axes[0].get_lines()[:2]], ["Lazy Speed", "Lazy Torque"])
+
+
 if __name__ == "__main__":
     unittest.main()
\ No newline at end of file
@@ -3,6 +3,7 @@ Created on December 27, 2021
 @author: Lance A. Endres
 """
 import DataSetLoading
+import pandas                                                        as pd
 
 from   lendres.io.ConsoleHelper                                      import ConsoleHelper
 
@@ -108,6 +109,43 @@ class TestDataHelper(unittest.TestCase):
         self.insuranceDataHelper.ConvertCategoryToNumeric("smoker", "yes")
 
 
+    def testOptimizeMemory(self):
+        original = self.insuranceDataHelper.data.copy()
+        report   = self.insuranceDataHelper.OptimizeMemory(verboseLevel=self.verboseLevel)
+        data     = self.insuranceDataHelper.data
+
+        self.assertEqual(str(data["age"].dtype), "int8")
+        self.assertEqual(str(data["region"].dtype), "category")
+        self.assertEqual(str(data["charges"].dtype), "float64")
+        self.assertLess(report.loc["Total", "After (bytes)"], report.loc["Total", "Before (bytes)"])
+        self.assertEqual(report.loc["Total", "After (bytes)"], data.memory_usage(index=False, deep=True).sum())
+
+        # The values are not changed.
+        for column in original.columns:
+            self.assertTrue((data[column].astype(original[column].dtype) == original[column]).all())
+
+        # Text with many unique values is changed to a string type.
+        dataHelper = self.insuranceDataHelper.Copy()
+        dataHelper.data["name"]  = ["name " + str(i) for i in range(len(dataHelper.data))]
+        dataHelper.data.loc[0, "name"] = None
+        report     = dataHelper.OptimizeMemory(verboseLevel=self.verboseLevel)
+        self.assertIsInstance(dataHelper.data["name"].dtype, pd.StringDtype)
+        self.assertTrue(pd.isna(dataHelper.data.loc[0, "name"]))
+        self.assertEqual(dataHelper.data.loc[1, "name"], "name 1")
+        self.assertEqual(report.loc["name", "After (bytes)"], dataHelper.data["name"].memory_usage(index=False, deep=True))
+
+        # Nullable floats keep their missing values.
+        dataHelper.data["score"] = pd.array([0.5, None] + [1.0]*(len(dataHelper.data)-2), dtype="Float64")
+        dataHelper.OptimizeMemory(verboseLevel=self.verboseLevel)
+        self.assertEqual(dataHelper.data["score"].dtype, pd.Float32Dtype())
+        self.assertIs(dataHelper.data.loc[1, "score"], pd.NA)
+        self.assertEqual(dataHelper.data.loc[0, "score"], 0.5)
+
+        dataHelper.data["name"]  = dataHelper.data["name"].astype(object)
+        dataHelper.OptimizeMemory(stringType="string[python]", verboseLevel=self.verboseLevel)
+        self.assertEqual(dataHelper.data["name"].dtype, pd.StringDtype("python"))
+
+
     @unittest.skipIf(skipTests, "Skipped print final test.")
     def testPrintFinal(self):
         dataHelper, dependentVariable = DataSetLoading.GetCreditCardCustomerData(verboseLevel=self.verboseLevel)
@@ -0,0 +1,68 @@
+"""
+Created on October 18, 2026
+@author: Lance A. Endres
+"""
+import pandas                                                        as pd
+import numpy                                                         as np
+import os
+import warnings
+
+from   lendres.data.DataProfile                                      import DataProfile
+
+import unittest
+
+
+class TestDataProfile(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.data             = pd.read_csv(os.path.join(os.path.dirname(os.path.abspath(__file__)), "Data", "used_cars_data.csv"))
+        cls.data["Location"] = cls.data["Location"].astype("category")
+        cls.profile          = DataProfile(cls.data)
+
+
+    def testMatchesPandas(self):
+        self.assertEqual(self.profile.shape, self.data.shape)
+        pd.testing.assert_series_equal(self.profile.notAvailableCounts, self.data.isna().sum())
+        pd.testing.assert_series_equal(self.profile.uniqueCounts, self.data.nunique())
+        pd.testing.assert_frame_equal(self.profile.numericSummary, self.data.describe(), check_exact=False, rtol=1e-9)
+        self.assertEqual(self.profile.TotalNotAvailable, self.data.isna().sum().sum())
+        self.assertEqual(self.profile.GetDataTypes()["Dtype"].tolist(), self.data.dtypes.tolist())
+
+        expected = self.data.describe(include=["category"])
+        self.assertEqual(self.profile.categorySummary["Location"].tolist(), expected["Location"].tolist())
+
+        valueCounts = self.profile.valueCounts["Location"]
+        pd.testing.assert_series_equal(valueCounts, self.data["Location"].value_counts()[valueCounts.index])
+
+
+    def testEdgeCases(self):
+        data    = pd.DataFrame({
+            "empty"    : [np.nan, np.nan, np.nan],
+            "single"   : [np.nan, 2.0, np.nan],
+            "category" : pd.Categorical([None, None, None], categories=["a", "b"]),
+            "text"     : ["x", None, "x"]
+        })
+        profile = DataProfile(data)
+
+        pd.testing.assert_series_equal(profile.uniqueCounts, data.nunique())
+        pd.testing.assert_series_equal(profile.notAvailableCounts, data.isna().sum())
+        pd.testing.assert_frame_equal(profile.numericSummary, data.describe())
+        self.assertEqual(profile.categorySummary["category"].tolist()[:2], [0, 0])
+
+        # Integers that are not exact as floats.
+        data    = pd.DataFrame({"a" : [2**60, 2**60+1, 5], "b" : pd.array([2**60, None, 2**60+1], dtype="Int64")})
+        pd.testing.assert_series_equal(DataProfile(data).uniqueCounts, data.nunique())
+
+        # Equal infinities are the same value.
+        data    = pd.DataFrame({"a" : [np.inf, np.inf, 1.0, np.nan, -np.inf, -np.inf]})
+        with warnings.catch_warnings():
+            warnings.simplefilter("error", RuntimeWarning)
+            profile = DataProfile(data)
+        pd.testing.assert_series_equal(profile.uniqueCounts, data.nunique())
+        pd.testing.assert_series_equal(profile.numericSummary.loc[["count", "min", "max"], "a"], data.describe().loc[["count", "min", "max"], "a"])
+        self.assertEqual(profile.numericSummary.loc[["25%", "50%", "75%"], "a"].tolist(), [-np.inf, 1.0, np.inf])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,98 @@
+"""
+Created on October 18, 2026
+@author: Lance A. Endres
+"""
+import pandas                                                        as pd
+import numpy                                                         as np
+import matplotlib.pyplot                                             as plt
+import os
+import pickle
+import tempfile
+
+from   lendres.data.DataComparison                                   import DataComparison
+from   lendres.data.LazyDataSet                                      import LazyDataSet
+
+import unittest
+
+
+class TestLazyDataSet(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.data      = pd.DataFrame({"Time" : np.arange(0, 100, 0.5), "Speed" : np.arange(200.0)**2, "Torque" : np.arange(200)})
+        self.data.to_csv(os.path.join(self.directory.name, "run.csv"), index=False)
+
+        self.dataComparison = DataComparison("Time", directory=self.directory.name, cacheDirectory=os.path.join(self.directory.name, "cache"))
+        self.dataComparison.LoadLazyFile("run.csv", "Lazy")
+        self.dataComparison.LoadFile("run.csv", "Eager")
+
+
+    def tearDown(self):
+        plt.close("all")
+        self.directory.cleanup()
+
+
+    def testDataSet(self):
+        lazy = self.dataComparison.dataSets[0]
+        self.assertIsInstance(lazy, LazyDataSet)
+        self.assertEqual(lazy.name, "Lazy")
+        self.assertEqual(len(lazy), 200)
+        self.assertEqual(lazy.columns, ["Time", "Speed", "Torque"])
+
+        window = lazy.GetWindow(10.0, 12.0, "Speed")
+        self.assertEqual(list(window.columns), ["Time", "Speed"])
+        pd.testing.assert_frame_equal(window, self.data.iloc[20:25][["Time", "Speed"]])
+
+        lazy["Power"] = lazy["Speed"] * lazy["Torque"]
+        self.assertEqual(lazy.GetWindow(1.0, 1.0)["Power"].iloc[0], 8.0)
+        self.assertRaises(Exception, lazy.__setitem__, "Short", [1, 2])
+
+
+    def testDataComparison(self):
+        for time in [0.0, 12.5, 99.5]:
+            self.assertEqual(self.dataComparison.GetValue(0, "Speed", time), self.dataComparison.GetValue(1, "Speed", time))
+
+        pd.testing.assert_frame_equal(self.dataComparison.GetWindow(0, (None, 1.0)), self.dataComparison.GetWindow(1, (None, 1.0)))
+
+        # The lazy data set's own search index is used.
+        self.assertIs(self.dataComparison.GetSortedIndex(0), self.dataComparison.dataSets[0].GetSortedIndex())
+
+        resampled = self.dataComparison.Resample("Torque", grid="step", step=0.25)
+        np.testing.assert_allclose(resampled["Lazy Torque"], resampled["Eager Torque"])
+
+        # The rows on either side of the limits are included so the lines reach the edges of the axes.
+        plt.figure()
+        figure, axes = self.dataComparison.NewComparisonPlot("Speed", xLimits=(10.0, 20.0))
+        for line in axes.get_lines():
+            self.assertEqual(len(line.get_xdata()), 23)
+
+        self.assertRaises(Exception, DataComparison("Time", directory=self.directory.name).LoadLazyFile, "run.csv", "Lazy")
+
+
+    def testChunks(self):
+        # The file is cached in several chunks and a text column is missing from the first ones.
+        data           = self.data.assign(Label=[None]*150 + ["a", "b"]*25)
+        data.to_csv(os.path.join(self.directory.name, "labels.csv"), index=False)
+        self.dataComparison.LoadLazyFile("labels.csv", "Chunked", chunkSize=60)
+
+        lazy = self.dataComparison.dataSets[2]
+        self.assertEqual(len(lazy), 200)
+        pd.testing.assert_frame_equal(lazy.GetWindow(None, None), data)
+        self.assertEqual(lazy.GetWindow(75.0, 75.5)["Label"].tolist(), ["a", "b"])
+
+
+    def testPickle(self):
+        lazy     = self.dataComparison.dataSets[0]
+        pickled  = pickle.dumps(lazy)
+        self.assertLess(len(pickled), 1000)
+        restored = pickle.loads(pickled)
+        self.assertEqual(restored.name, "Lazy")
+        pd.testing.assert_frame_equal(restored.GetWindow(5.0, 6.0), lazy.GetWindow(5.0, 6.0))
+
+        # Once a column is added, the data no longer matches the cache and is pickled with the data set.
+        lazy["Power"] = 1.0
+        self.assertEqual(pickle.loads(pickle.dumps(lazy)).columns, ["Time", "Speed", "Torque", "Power"])
+
+
+if __name__ == "__main__":
+    unittest.main()
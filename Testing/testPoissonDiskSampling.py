@@ -0,0 +1,187 @@
+"""
+Created on October 18, 2026
+@author: Lance A. Endres
+"""
+import numpy                                                         as np
+import shapely
+import random
+
+from   lendres.algorithms.PoissonDiskSampling                        import PoissonDiskSampling
+from   lendres.algorithms.PolygonContainment                         import PolygonContainment
+from   lendres.algorithms.MultiResolutionPointGrid                   import MultiResolutionPointGrid
+
+import unittest
+
+
+class TestPoissonDiskSampling(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.polygon     = shapely.Polygon([(0, 0), (40, 0), (40, 10), (20, 25), (0, 20)])
+        cls.minDistance = 2.0
+
+
+    def setUp(self):
+        random.seed(1)
+
+
+    def CheckPoints(self, points, minDistanceFromEdge, firstPointChecked=True):
+        points = np.asarray(points)
+        self.assertGreater(len(points), 10)
+
+        # All points must be inside the polygon and far enough from the edge.  The scalar method does not check the
+        # distance from the edge for the initial point.
+        self.assertTrue(np.all(shapely.contains_xy(self.polygon, points[:, 0], points[:, 1])))
+        checked   = points if firstPointChecked else points[1:]
+        distances = shapely.distance(self.polygon.exterior, shapely.points(checked))
+        self.assertTrue(np.all(distances >= minDistanceFromEdge - 1e-9))
+
+        # No two points can be closer than the minimum distance.
+        differences = points[:, None, :] - points[None, :, :]
+        distances   = np.sqrt(np.sum(differences**2, axis=-1))
+        np.fill_diagonal(distances, np.inf)
+        self.assertGreaterEqual(distances.min(), self.minDistance)
+
+
+    def testScalar(self):
+        points = PoissonDiskSampling.Sample(self.polygon, self.minDistance, method="scalar")
+        self.CheckPoints(points, self.minDistance, firstPointChecked=False)
+
+
+    def testVectorized(self):
+        points = PoissonDiskSampling.Sample(self.polygon, self.minDistance, minDistanceFromEdge=1.0)
+        self.CheckPoints(points, 1.0)
+
+        # The default return type is the same for both methods.
+        self.assertIsInstance(points, list)
+        self.assertIsInstance(points[0], list)
+        self.assertIsInstance(PoissonDiskSampling.Sample(self.polygon, self.minDistance, method="scalar"), list)
+
+        points = PoissonDiskSampling.Sample(self.polygon, self.minDistance, seed=1, asArray=True)
+        self.assertEqual(points.shape[1], 2)
+
+
+    def testSeeded(self):
+        for method in ["scalar", "vectorized"]:
+            random.seed(3)
+            points1 = PoissonDiskSampling.Sample(self.polygon, self.minDistance, method=method)
+            random.seed(3)
+            points2 = PoissonDiskSampling.Sample(self.polygon, self.minDistance, method=method)
+            np.testing.assert_array_equal(points1, points2)
+
+
+    def testSeedArgument(self):
+        points1 = PoissonDiskSampling.Sample(self.polygon, self.minDistance, seed=5)
+        points2 = PoissonDiskSampling.Sample(self.polygon, self.minDistance, seed=np.random.default_rng(5))
+        np.testing.assert_array_equal(points1, points2)
+
+        points1 = PoissonDiskSampling.Sample(self.polygon, self.minDistance, method="scalar", seed=5)
+        points2 = PoissonDiskSampling.Sample(self.polygon, self.minDistance, method="scalar", seed=5)
+        np.testing.assert_array_equal(points1, points2)
+
+
+    def testTiled(self):
+        points1 = PoissonDiskSampling.SampleTiled(self.polygon, self.minDistance, tileSize=10, maxWorkers=1, seed=2)
+        self.CheckPoints(points1, self.minDistance)
+
+        # The result must not depend on the number of processes.
+        points2 = PoissonDiskSampling.SampleTiled(self.polygon, self.minDistance, tileSize=10, maxWorkers=2, seed=2)
+        np.testing.assert_array_equal(points1, points2)
+
+
+    def testHolesAndMultiPolygon(self):
+        hole     = [(10, 5), (30, 5), (30, 12), (10, 12)]
+        polygon  = shapely.MultiPolygon([shapely.Polygon([(0, 0), (40, 0), (40, 20), (0, 20)], holes=[hole]), shapely.box(50, 0, 60, 10)])
+        points   = PoissonDiskSampling.Sample(polygon, 1.0, seed=1, asArray=True)
+
+        # Both parts must be filled and no point can be in or near the hole.
+        self.assertTrue(np.any(points[:, 0] > 50))
+        self.assertTrue(np.all(shapely.distance(shapely.Polygon(hole).exterior, shapely.points(points)) >= 1.0 - 1e-9))
+        self.assertFalse(np.any(shapely.contains_xy(shapely.Polygon(hole), points[:, 0], points[:, 1])))
+
+        self.assertRaises(Exception, PoissonDiskSampling.Sample, polygon, 1.0, method="scalar")
+
+
+    def testVariableDensity(self):
+        # The minimum distance grows from 1 on the left to 4 on the right.
+        function = lambda x, y : 1.0 + 3.0*x/40.0
+        points   = PoissonDiskSampling.Sample(self.polygon, function, minDistanceRange=(1.0, 4.0), seed=1, asArray=True)
+        radii    = function(points[:, 0], points[:, 1])
+
+        distances   = np.sqrt(np.sum((points[:, None, :] - points[None, :, :])**2, axis=-1))
+        np.fill_diagonal(distances, np.inf)
+        self.assertTrue(np.all(distances >= np.maximum(radii[:, None], radii[None, :]) - 1e-9))
+
+        # The left side must be more densely sampled than the right side.
+        self.assertGreater(np.count_nonzero(points[:, 0] < 10), 2*np.count_nonzero(points[:, 0] > 30))
+
+        # A raster of minimum distances.
+        raster = np.array([[1.0, 1.0], [3.0, 3.0]])
+        points = PoissonDiskSampling.Sample(self.polygon, raster, seed=1, asArray=True)
+        self.assertGreater(np.count_nonzero(points[:, 0] < 20), np.count_nonzero(points[:, 0] > 20))
+
+        self.assertRaises(Exception, PoissonDiskSampling.Sample, self.polygon, function)
+
+
+    def testExtend(self):
+        # Sample the polygon, then add a box to the right side of it.
+        points    = PoissonDiskSampling.Sample(self.polygon, self.minDistance, seed=1, asArray=True)
+        addition  = shapely.box(40, 0, 60, 10)
+        polygon   = shapely.union(self.polygon, addition)
+        newPoints = PoissonDiskSampling.Extend(polygon, points, self.minDistance, region=addition, seed=1)
+
+        self.assertGreater(len(newPoints), 10)
+        self.assertTrue(np.all(newPoints[:, 0] >= 40))
+        self.assertTrue(np.all(shapely.contains_xy(polygon, newPoints[:, 0], newPoints[:, 1])))
+
+        allPoints = np.vstack((points, newPoints))
+        distances = np.sqrt(np.sum((allPoints[:, None, :] - allPoints[None, :, :])**2, axis=-1))
+        np.fill_diagonal(distances, np.inf)
+        self.assertGreaterEqual(distances.min(), self.minDistance)
+
+        # Fixed points that are closer together than the minimum distance.  The new points must stay away from all of them.
+        fixedPoints = np.array([[10.0, 10.0], [10.3, 10.2], [10.1, 10.4], [30.0, 5.0]])
+        newPoints   = PoissonDiskSampling.Extend(self.polygon, fixedPoints, self.minDistance, seed=1)
+        distances   = np.sqrt(np.sum((newPoints[:, None, :] - fixedPoints[None, :, :])**2, axis=-1))
+        self.assertGreaterEqual(distances.min(), self.minDistance)
+        self.CheckPoints(newPoints, self.minDistance)
+
+
+class TestPolygonContainment(unittest.TestCase):
+
+    def testMatchesExactTest(self):
+        polygon     = shapely.Polygon([(0, 0), (40, 0), (40, 40), (0, 40)], holes=[[(10, 10), (30, 10), (20, 30)]])
+        containment = PolygonContainment(polygon, 2.0, maxCells=16)
+
+        randomNumberGenerator = np.random.default_rng(1)
+        points   = randomNumberGenerator.uniform(-5, 45, size=(5000, 2))
+        expected = shapely.contains_xy(polygon.buffer(-2.0, quad_segs=16), points[:, 0], points[:, 1])
+        np.testing.assert_array_equal(containment.Contains(points[:, 0], points[:, 1]), expected)
+
+
+    def testEmptyRegion(self):
+        containment = PolygonContainment(shapely.box(0, 0, 1, 1), 2.0)
+        self.assertTrue(containment.IsEmpty)
+        self.assertRaises(Exception, containment.RandomPoints, np.random.default_rng(1))
+
+
+    def testMultiResolutionPointGrid(self):
+        # A large ratio of radii, so the large candidates are checked against many levels of small points.
+        randomNumberGenerator = np.random.default_rng(1)
+        grid       = MultiResolutionPointGrid((0, 0, 50, 50), (0.1, 10.0))
+        points     = randomNumberGenerator.uniform(0, 50, (4000, 2))
+        radii      = np.exp(randomNumberGenerator.uniform(np.log(0.1), np.log(10.0), 4000))
+        grid.InsertFree(points, radii)
+
+        candidates = randomNumberGenerator.uniform(0, 50, (2000, 2))
+        radii      = np.exp(randomNumberGenerator.uniform(np.log(0.1), np.log(10.0), 2000))
+        free       = grid.AreFree(candidates, radii)
+
+        # Compare to checking every point.
+        distances  = np.sqrt(np.sum((candidates[:, None, :] - grid.Points[None, :, :])**2, axis=-1))
+        expected   = ~np.any(distances < np.maximum(radii[:, None], grid.Radii[None, :]), axis=1)
+        np.testing.assert_array_equal(free, expected)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -5,6 +5,7 @@ Created on Febuary 16, 2022
 import numpy                                                    as np
 
 from   lendres.algorithms.Search                                import Search
+from   lendres.algorithms.SortedIndex                           import SortedIndex
 import unittest
 
 # More information at:
@@ -76,6 +77,24 @@ class TestBoundingBinarySearch(unittest.TestCase):
 
 
 
+    # @unittest.skip
+    def testManyMatchesSingle(self):
+        items  = [-2, 0.01, 1, 2, 5, 16, 21, 10000]
+        result = Search.BoundingBinarySearchMany(items, self.points, returnedUnits="indices")
+
+        for item, row in zip(items, result):
+            expected = Search.BoundingBinarySearch(item, self.points, returnedUnits="indices")
+            np.testing.assert_array_equal(row, expected)
+
+        # The last point is an exact match.
+        np.testing.assert_array_equal(Search.BoundingBinarySearchMany(22, self.points)[0], [7, 7])
+
+        result = Search.BoundingBinarySearchMany(items, self.points, returnedUnits="values")
+        np.testing.assert_array_equal(result[3], [1, 3])
+        np.testing.assert_array_equal(result[4], [5, 5])
+        self.assertTrue(np.all(np.isnan(result[[0, 1, 7]])))
+
+
 class TestFindIndicesByValues(unittest.TestCase):
 
     @classmethod
@@ -105,6 +124,96 @@ class TestFindIndicesByValues(unittest.TestCase):
         self.assertEqual(result[3], 10)
         self.assertEqual(len(result), 4)
 
+        # A maximum count of zero returns all the matches.
+        self.assertEqual(len(Search.FindIndicesByValues(self.strings, "b", maxCount=0)), 6)
+        self.assertEqual(len(Search.FindIndicesByManyValues(self.strings, ["b"], maxCount=0)["b"]), 6)
+
+
+    # @unittest.skip
+    def testFindArrays(self):
+        numbers = np.array(self.numbers*200)
+        result  = Search.FindIndicesByValues(numbers, 11)
+        self.assertEqual(len(result), 600)
+        self.assertEqual(result[:3], [2, 3, 7])
+
+        result = Search.FindIndicesByValues(numbers, 11, maxCount=500)
+        self.assertEqual(len(result), 500)
+        self.assertEqual(result[-1], Search.FindIndicesByValues(numbers, 11)[499])
+
+        self.assertEqual(Search.FindIndicesByValues(numbers, "a"), [])
+
+
+    # @unittest.skip
+    def testFindManyValues(self):
+        result = Search.FindIndicesByManyValues(self.strings, ["b", "a", "z"])
+        self.assertEqual(result["b"], Search.FindIndicesByValues(self.strings, "b"))
+        self.assertEqual(result["a"], [0, 8, 9])
+        self.assertEqual(result["z"], [])
+
+        result = Search.FindIndicesByManyValues(np.array(self.numbers), [3, 11], maxCount=2)
+        self.assertEqual(result[3], [1, 11])
+        self.assertEqual(result[11], [2, 3])
+
+
+    # @unittest.skip
+    def testInvertedIndex(self):
+        index = Search.CreateInvertedIndex(self.strings)
+        self.assertEqual(index.GetIndices("b").tolist(), Search.FindIndicesByValues(self.strings, "b"))
+        self.assertEqual(index.GetIndices("b", maxCount=4).tolist(), [1, 3, 4, 10])
+        self.assertEqual(len(index.GetIndices("z")), 0)
+        self.assertEqual(index.GetCounts()["d"], 2)
+
+        numbers = np.array(self.numbers)
+        index   = Search.CreateInvertedIndex(numbers)
+        self.assertEqual(index.GetIndices(11).tolist(), [2, 3, 7])
+
+        # Changing the data in place requires invalidating the index.
+        numbers[0] = 11
+        index.Invalidate()
+        self.assertEqual(index.GetIndices(11).tolist(), [0, 2, 3, 7])
+        self.assertNotIn(1, index)
+
+
+
+class TestSortedIndex(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.sortedIndex = SortedIndex([1, 3, 5, 8, 11, 14, 18, 22])
+
+
+    # @unittest.skip
+    def testNotSorted(self):
+        self.assertRaises(Exception, SortedIndex, [1, 3, 2])
+
+
+    # @unittest.skip
+    def testBound(self):
+        np.testing.assert_array_equal(self.sortedIndex.Bound(16), [5, 6])
+        np.testing.assert_array_equal(self.sortedIndex.Bound([2, 5]), [[0, 1], [2, 2]])
+        self.assertTrue(np.all(np.isnan(self.sortedIndex.Bound(-2))))
+
+
+    # @unittest.skip
+    def testFloorAndCeiling(self):
+        np.testing.assert_array_equal(self.sortedIndex.Floor([0, 1, 2, 22, 30]), [np.nan, 0, 0, 7, 7])
+        np.testing.assert_array_equal(self.sortedIndex.Ceiling([0, 1, 2, 22, 30]), [0, 0, 1, 7, np.nan])
+        self.assertEqual(self.sortedIndex.Floor(9), 3)
+        self.assertEqual(self.sortedIndex.Ceiling(9), 4)
+
+
+    # @unittest.skip
+    def testNearest(self):
+        np.testing.assert_array_equal(self.sortedIndex.Nearest([-5, 2, 4.5, 7, 100, np.nan]), [0, 0, 2, 3, 7, np.nan])
+
+
+    # @unittest.skip
+    def testRange(self):
+        values = self.sortedIndex.Values
+        np.testing.assert_array_equal(values[self.sortedIndex.Range(3, 11)], [3, 5, 8, 11])
+        np.testing.assert_array_equal(values[self.sortedIndex.Range(2.5, 4)], [3])
+        self.assertEqual(len(values[self.sortedIndex.Range(15, 16)]), 0)
+
 
 if __name__ == "__main__":
     unittest.main()
\ No newline at end of file
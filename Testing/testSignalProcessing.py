@@ -0,0 +1,263 @@
+"""
+Created on October 18, 2026
+@author: Lance A. Endres
+"""
+import numpy                                                         as np
+import pandas                                                        as pd
+from   scipy.signal                                                  import find_peaks
+import scipy.signal
+import heapq
+
+from   lendres.signalprocessing.SignalProcessing                     import SignalProcessing
+from   lendres.signalprocessing.StreamingPeakDetector                import StreamingPeakDetector
+from   lendres.signalprocessing.SpectralAnalysis                     import SpectralAnalysis
+from   lendres.signalprocessing.FilterBank                           import FilterBank
+from   lendres.signalprocessing.Decimation                           import Decimation
+from   lendres.demonstration.FunctionGenerator                       import FunctionGenerator
+
+import unittest
+
+
+class TestSignalProcessing(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        randomNumberGenerator = np.random.default_rng(2)
+        x                     = np.arange(2000)
+        cls.data              = pd.DataFrame({"Channel " + str(i) : np.sin(x/(10+i)) + 0.3*randomNumberGenerator.normal(size=len(x)) for i in range(4)})
+
+        # Rounding creates peaks of equal height to check the order of ties.
+        cls.data["Channel 0"] = np.round(cls.data["Channel 0"], 1)
+
+
+    def testGetPeaks(self):
+        y = self.data["Channel 0"].to_numpy()
+        for sortBy in ["localheight", "globalheight"]:
+            for number in [0, 6, "all"]:
+                indices, values = SignalProcessing.GetPeaks(y, number, sortBy)
+
+                # The previous implementation.
+                peaks, properties = find_peaks(y, distance=4, prominence=0.1)
+                sortValues        = properties["prominences"] if sortBy == "localheight" else y[peaks]
+                expected          = heapq.nlargest(len(peaks) if number == "all" else number, zip(sortValues, peaks))
+
+                self.assertEqual(indices, [peak for value, peak in expected])
+                np.testing.assert_array_equal(values, y[indices])
+
+
+    def testGetPeaksForChannels(self):
+        for executorType in ["thread", "process"]:
+            results = SignalProcessing.GetPeaksForChannels(self.data, number=5, executorType=executorType, maxWorkers=2)
+            self.assertEqual(results.columns.tolist(), ["Channel", "Index", "Height", "Prominence"])
+            self.assertEqual(len(results), 20)
+
+            for channel in self.data.columns:
+                indices, values = SignalProcessing.GetPeaks(self.data[channel].to_numpy(), 5)
+                channelResults  = results[results["Channel"] == channel]
+                self.assertEqual(channelResults["Index"].tolist(), indices)
+                np.testing.assert_array_equal(channelResults["Height"], values)
+
+        results = SignalProcessing.GetPeaksForChannels(self.data.to_numpy(), number="all", maxWorkers=1)
+        self.assertEqual(results["Channel"].unique().tolist(), [0, 1, 2, 3])
+
+
+    def testGetPeaksDecimated(self):
+        randomNumberGenerator = np.random.default_rng(3)
+        x                     = np.arange(200000)
+        y                     = 0.1*np.cumsum(randomNumberGenerator.normal(size=len(x))) + 3*np.sin(x/300) + 0.05*randomNumberGenerator.normal(size=len(x))
+
+        # Large peaks at the ends check the searches that reach the ends of the signal.
+        y[[5, len(y)-3]] += 50
+
+        for sortBy, wlen, blockSize, arguments in [("localheight", 1001, None, {}), ("globalheight", 301, 40, {"distance" : 50}), ("localheight", 5001, 100, {"height" : 0.0})]:
+            expected = SignalProcessing.GetPeaks(y, 12, sortBy, wlen=wlen, **arguments)
+            result   = SignalProcessing.GetPeaksDecimated(y, 12, sortBy, wlen, blockSize, **arguments)
+            self.assertEqual(result[0], expected[0])
+            np.testing.assert_array_equal(result[1], expected[1])
+
+        self.assertRaises(Exception, SignalProcessing.GetPeaksDecimated, y, 12)
+
+
+class TestStreamingPeakDetector(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        randomNumberGenerator = np.random.default_rng(1)
+        x                     = np.arange(20000)
+        cls.signal            = np.cumsum(randomNumberGenerator.normal(size=len(x))) + 5*np.sin(x/40)
+        cls.chunkSizes        = randomNumberGenerator.integers(1, 500, size=len(x))
+
+
+    def RunStream(self, signal, detector):
+        peaks       = []
+        prominences = []
+
+        start = 0
+        for chunkSize in self.chunkSizes:
+            if start >= len(signal):
+                break
+            chunkPeaks, properties = detector.Process(signal[start:start+chunkSize])
+            peaks.append(chunkPeaks)
+            prominences.append(properties["prominences"])
+            start += chunkSize
+
+        chunkPeaks, properties = detector.Finish()
+        peaks.append(chunkPeaks)
+        prominences.append(properties["prominences"])
+
+        return np.concatenate(peaks), np.concatenate(prominences)
+
+
+    def testMatchesBatch(self):
+        for distance, prominence, wlen in [(None, 1.0, 51), (10, 0.5, 301), (60.5, 2.0, 1001)]:
+            expected, properties   = find_peaks(self.signal, distance=distance, prominence=prominence, wlen=wlen)
+            peaks, prominences     = self.RunStream(self.signal, StreamingPeakDetector(wlen, distance, prominence))
+
+            np.testing.assert_array_equal(peaks, expected)
+            np.testing.assert_allclose(prominences, properties["prominences"])
+
+
+    def testPlateaus(self):
+        # Rounding creates flat peaks that can be split between chunks.
+        signal                 = np.round(self.signal)
+        expected, properties   = find_peaks(signal, prominence=1.0, wlen=101, height=0.0)
+        peaks, prominences     = self.RunStream(signal, StreamingPeakDetector(101, prominence=1.0, height=0.0))
+
+        np.testing.assert_array_equal(peaks, expected)
+        np.testing.assert_allclose(prominences, properties["prominences"])
+
+
+    def testBoundedMemory(self):
+        detector = StreamingPeakDetector(201, 10, 1.0)
+        for i in range(0, len(self.signal), 1000):
+            detector.Process(self.signal[i:i+1000])
+            self.assertLess(len(detector.buffer), 2000)
+
+
+    def testInvalidArguments(self):
+        self.assertRaises(Exception, StreamingPeakDetector, None)
+        self.assertRaises(Exception, StreamingPeakDetector, 101, 0.5)
+
+        detector = StreamingPeakDetector(101)
+        detector.Finish()
+        self.assertRaises(Exception, detector.Process, self.signal)
+
+
+
+class TestSpectralAnalysis(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        # Sine waves of 4, 2, 2, and 1 Hz with amplitudes of 9, 6, 4, and 3.  The first one also has a slope.
+        cls.data = FunctionGenerator.GetMultipleSineWaveDataFrame()
+
+
+    def testFFT(self):
+        spectrum = SpectralAnalysis.FFT(self.data, independentColumn="x", window="boxcar", detrend="linear")
+        self.assertEqual(spectrum.columns.tolist(), ["Frequency", "y0", "y1", "y2", "y3"])
+
+        frequencies = SpectralAnalysis.GetDominantFrequencies(spectrum, number=1)
+        np.testing.assert_allclose(frequencies["Frequency"], [4, 2, 2, 1], atol=0.25)
+        np.testing.assert_allclose(frequencies["Value"], [9, 6, 4, 3], rtol=0.1)
+
+        # An array with a sample rate gives the same result.
+        array = SpectralAnalysis.FFT(self.data[["y0", "y1", "y2", "y3"]].to_numpy(), sampleRate=999/4, window="boxcar", detrend="linear")
+        np.testing.assert_allclose(array.to_numpy(), spectrum.to_numpy())
+
+        self.assertRaises(Exception, SpectralAnalysis.FFT, self.data)
+
+
+    def testWelchAndSpectrogram(self):
+        densities = SpectralAnalysis.Welch(self.data, ["y1", "y3"], independentColumn="x", segmentLength=500)
+        peaks     = densities["Frequency"].to_numpy()[densities[["y1", "y3"]].to_numpy().argmax(axis=0)]
+        np.testing.assert_allclose(peaks, [2, 1], atol=0.5)
+
+        frequencies, times, spectrograms = SpectralAnalysis.Spectrogram(self.data, independentColumn="x", segmentLength=250)
+        self.assertEqual(list(spectrograms.keys()), ["y0", "y1", "y2", "y3"])
+        self.assertEqual(spectrograms["y0"].shape, (len(frequencies), len(times)))
+
+        # The windows are reused.
+        self.assertIs(SpectralAnalysis.GetWindow("hann", 250), SpectralAnalysis.GetWindow("hann", 250))
+
+
+
+class TestFilterBank(unittest.TestCase):
+
+    def testStreamMatchesBatch(self):
+        data       = FunctionGenerator.GetMultipleSineWaveDataFrame()
+        sampleRate = 999/4
+
+        filterBank = FilterBank(sampleRate, independentColumn="x")
+        filterBank.AddFilter("low", "lowpass", 1.5)
+        filterBank.AddFilter("band", "bandpass", (1.5, 3.0), order=2)
+
+        # Filter the whole signal, then filter it in chunks.  An empty first chunk must not set the initial state.
+        expected   = filterBank.Process(data)
+        filterBank.Reset()
+        chunks     = [data.iloc[:0]] + [data.iloc[i:i+77] for i in range(0, len(data), 77)]
+        results    = list(filterBank.Stream(chunks))
+
+        for name in filterBank.Names:
+            result = pd.concat([chunkResults[name] for chunkResults in results])
+            np.testing.assert_allclose(result.to_numpy(), expected[name].to_numpy())
+            np.testing.assert_array_equal(result["x"], data["x"])
+
+        # The 2 Hz signal is passed by the band pass filter and the 1 Hz signal is removed.
+        band = expected["band"].iloc[500:]
+        self.assertGreater(band["y1"].std(), 3.0)
+        self.assertLess(band["y3"].std(), 1.0)
+
+
+    def testArrays(self):
+        filterBank = FilterBank(100, initialCondition="zero")
+        filterBank.AddFilter("high", "highpass", 10)
+
+        signal = np.random.default_rng(1).normal(size=(1000, 3))
+        result = np.concatenate([filterBank.Process(signal[i:i+100], "high") for i in range(0, 1000, 100)])
+        np.testing.assert_allclose(result, scipy.signal.sosfilt(filterBank.filters["high"], signal, axis=0))
+
+        self.assertRaises(Exception, filterBank.Process, signal[:, :2], "high")
+        self.assertRaises(Exception, filterBank.AddFilter, "notch", "notch", 10)
+
+
+
+class TestDecimation(unittest.TestCase):
+
+    def testMinMaxIndices(self):
+        rng     = np.random.default_rng(2)
+        y       = rng.normal(size=50000)
+        y[1234] = 10.0
+        y[4321] = -10.0
+        y[777]  = np.nan
+
+        for x in [None, np.cumsum(rng.uniform(0, 1, len(y))**3)]:
+            indices = Decimation.MinMaxIndices(y, 500, x)
+            self.assertLessEqual(len(indices), 1002)
+            self.assertTrue(np.all(np.diff(indices) > 0))
+            self.assertEqual(indices[0], 0)
+            self.assertEqual(indices[-1], len(y)-1)
+            self.assertIn(1234, indices)
+            self.assertIn(4321, indices)
+
+        # The minimum and maximum of every bucket are kept.
+        indices = Decimation.MinMaxIndices(y, 100)
+        minimums, maximums = Decimation.MinMaxEnvelope(y, 500)
+        bucket  = indices // 500
+        for i in range(100):
+            kept = y[indices[bucket == i]]
+            self.assertEqual(np.nanmin(kept), np.nanmin(y[i*500:(i+1)*500]))
+            self.assertEqual(np.nanmax(kept), np.nanmax(y[i*500:(i+1)*500]))
+
+        # Long signals are processed in several groups of buckets.
+        y       = rng.normal(size=3000000)
+        indices = Decimation.MinMaxIndices(y, 1000)
+        minimums, maximums = Decimation.MinMaxEnvelope(y, 3000)
+        np.testing.assert_array_equal(np.minimum.reduceat(y[indices], np.searchsorted(indices, np.arange(0, len(y), 3000))), minimums)
+        np.testing.assert_array_equal(np.maximum.reduceat(y[indices], np.searchsorted(indices, np.arange(0, len(y), 3000))), maximums)
+
+        # Short signals are not decimated.
+        np.testing.assert_array_equal(Decimation.MinMaxIndices(y[:100], 100), np.arange(100))
+
+
+if __name__ == "__main__":
+    unittest.main()
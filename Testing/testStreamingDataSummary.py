@@ -0,0 +1,72 @@
+"""
+Created on October 18, 2026
+@author: Lance A. Endres
+"""
+import pandas                                                        as pd
+import numpy                                                         as np
+import os
+
+from   lendres.data.StreamingDataSummary                             import StreamingDataSummary
+from   lendres.algorithms.HyperLogLog                                import HyperLogLog
+
+import unittest
+
+
+class TestStreamingDataSummary(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.file = os.path.join(os.path.dirname(os.path.abspath(__file__)), "Data", "used_cars_data.csv")
+        cls.data = pd.read_csv(cls.file)
+
+
+    def GetSummary(self, chunkSize, **kwargs):
+        summary = StreamingDataSummary(**kwargs)
+        with pd.read_csv(self.file, chunksize=chunkSize) as reader:
+            for chunk in reader:
+                summary.Update(chunk)
+        return summary
+
+
+    def testMatchesFullData(self):
+        summary = self.GetSummary(999)
+
+        self.assertEqual(summary.Shape, self.data.shape)
+        pd.testing.assert_frame_equal(summary.GetHead(), self.data.head())
+        pd.testing.assert_series_equal(summary.GetNotAvailableCounts()[0], self.data.isna().sum())
+        pd.testing.assert_series_equal(summary.GetUniqueCounts(), self.data.nunique())
+        self.assertEqual(summary.GetDataTypes()["Dtype"].tolist(), self.data.dtypes.tolist())
+
+        # The rows are fewer than the quantile sample size, so the percentiles are exact.
+        pd.testing.assert_frame_equal(summary.Describe(), self.data.describe(), check_exact=False, rtol=1e-9)
+
+        sample = summary.GetSample()
+        self.assertEqual(len(sample), 10)
+        pd.testing.assert_frame_equal(sample, self.data.loc[sample.index])
+
+
+    def testEstimates(self):
+        summary = self.GetSummary(500, quantileSampleSize=1000, maximumUniqueValues=100)
+
+        self.assertEqual(len(summary.reservoir), 1000)
+        self.assertIn("Name", summary.GetEstimatedColumns())
+        self.assertAlmostEqual(summary.GetUniqueCounts()["Name"], self.data["Name"].nunique(), delta=0.05*self.data["Name"].nunique())
+
+        describe = summary.Describe()
+        expected = self.data.describe()
+        pd.testing.assert_frame_equal(describe.loc[["count", "mean", "std", "min", "max"]], expected.loc[["count", "mean", "std", "min", "max"]], check_exact=False, rtol=1e-9)
+        np.testing.assert_allclose(describe.loc["50%"], expected.loc["50%"], rtol=0.25)
+
+
+    def testHyperLogLog(self):
+        first  = HyperLogLog()
+        second = HyperLogLog()
+        first.Add(np.arange(30000))
+        second.Add(np.arange(20000, 50000).astype(float))
+        first.Merge(second)
+        self.assertAlmostEqual(first.Count(), 50000, delta=1000)
+        self.assertRaises(Exception, first.Merge, HyperLogLog(10))
+
+
+if __name__ == "__main__":
+    unittest.main()
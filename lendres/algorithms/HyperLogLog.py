@@ -0,0 +1,123 @@
+"""
+Created on October 18, 2026
+@author: Lance A. Endres
+"""
+import numpy                                     as np
+import pandas                                    as pd
+
+
+class HyperLogLog():
+    """
+    Estimates the number of distinct values in data that is too large to keep a set of the values (for example, a file
+    that is read in chunks).
+
+    Each value is hashed.  The first "precision" bits of the hash select a register and the register keeps the largest
+    number of leading zeros seen in the rest of the hash.  The number of distinct values is estimated from the registers.
+    The memory used is 2**precision bytes, no matter how many values are added, and the relative error is about
+    1.04/sqrt(2**precision) (0.8% for the default precision).
+
+    Estimates can be merged, so data can be split and processed separately.
+    """
+
+
+    def __init__(self, precision:int=14):
+        """
+        Constructor.
+
+        Parameters
+        ----------
+        precision : int, optional
+            The number of bits used to select a register (4 to 18). The default is 14.
+
+        Returns
+        -------
+        None.
+        """
+        if precision < 4 or precision > 18:
+            raise Exception("The precision must be between 4 and 18.")
+
+        self.precision = precision
+        self.registers = np.zeros(2**precision, dtype=np.uint8)
+
+
+    def Add(self, values):
+        """
+        Adds values.  Missing values (NaN/None) are ignored.
+
+        Parameters
+        ----------
+        values : array like
+            The values to add.
+
+        Returns
+        -------
+        None.
+        """
+        values = pd.Series(values).dropna()
+        if len(values) == 0:
+            return
+
+        # Integers are hashed as floats so that the same number hashes the same if the type changes (for example, when
+        # a later chunk of a file has missing values and is read as floats).
+        if pd.api.types.is_numeric_dtype(values) and not pd.api.types.is_bool_dtype(values):
+            values = values.astype(float)
+
+        hashes    = pd.util.hash_pandas_object(values, index=False).to_numpy()
+        bits      = 64 - self.precision
+        registers = (hashes >> np.uint64(bits)).astype(np.int64)
+        remainder = hashes & np.uint64((1 << bits) - 1)
+
+        # The rank is the position of the first set bit of the remainder (the number of leading zeros plus one).
+        np.maximum.at(self.registers, registers, (bits - self.__BitLength(remainder) + 1).astype(np.uint8))
+
+
+    def Merge(self, other):
+        """
+        Adds the values of another estimate to this one.
+
+        Parameters
+        ----------
+        other : HyperLogLog
+            An estimate with the same precision.
+
+        Returns
+        -------
+        None.
+        """
+        if other.precision != self.precision:
+            raise Exception("Only estimates with the same precision can be merged.")
+        np.maximum(self.registers, other.registers, out=self.registers)
+
+
+    def Count(self) -> float:
+        """
+        Gets the estimated number of distinct values.
+
+        Returns
+        -------
+        : float
+            The estimate.
+        """
+        m        = len(self.registers)
+        alpha    = 0.7213 / (1 + 1.079/m)
+        estimate = alpha * m**2 / np.sum(2.0**-self.registers.astype(float))
+
+        # For small counts, many registers are still empty and counting them (linear counting) is more accurate.
+        empty    = np.count_nonzero(self.registers == 0)
+        if estimate <= 2.5*m and empty > 0:
+            estimate = m * np.log(m / empty)
+
+        return float(estimate)
+
+
+    def __BitLength(self, values:np.ndarray) -> np.ndarray:
+        """
+        Gets the number of bits required to represent each value (zero for zero).
+        """
+        values = values.copy()
+        length = np.zeros(len(values), dtype=np.int64)
+        for shift in (32, 16, 8, 4, 2, 1):
+            large          = values >= np.uint64(1 << shift)
+            length[large] += shift
+            values[large] >>= np.uint64(shift)
+        return length + (values > 0)
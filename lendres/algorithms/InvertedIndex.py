@@ -0,0 +1,141 @@
+"""
+Created on October 18, 2026
+@author: Lance A. Endres
+"""
+import numpy                                     as np
+import pandas                                    as pd
+
+
+class InvertedIndex():
+    """
+    An index from each distinct value in a data set to the indices (positions) of the entries that have that value.
+
+    The index is built in a single pass over the data.  The values are factorized (hashed into integer codes), then a
+    stable sort of the codes groups the positions of each value together.  The positions of a value are a slice of the
+    sorted array, so a look up is a dictionary access and does not copy or scan the data.
+
+    If the data changes, call Invalidate.  The index is rebuilt the next time it is used.
+    """
+
+
+    def __init__(self, data):
+        """
+        Constructor.
+
+        Parameters
+        ----------
+        data : array like
+            The data to index (for example, a column of labels).  Missing values (NaN/None) are not indexed.
+
+        Returns
+        -------
+        None.
+        """
+        self.data      = data
+        self.positions = None
+        self.offsets   = None
+        self.lookUp    = None
+
+
+    def __len__(self):
+        return len(self.data)
+
+
+    def __contains__(self, value):
+        self.__Build()
+        return value in self.lookUp
+
+
+    @property
+    def Values(self) -> list:
+        """
+        Gets the distinct values in the order they first appear in the data.
+
+        Returns
+        -------
+        list
+        """
+        self.__Build()
+        return list(self.lookUp.keys())
+
+
+    def Invalidate(self, data=None):
+        """
+        Marks the index as out of date so it is rebuilt the next time it is used.
+
+        Parameters
+        ----------
+        data : array like, optional
+            New data to index.  If None, the existing data (which may have been modified in place) is indexed again.
+            The default is None.
+
+        Returns
+        -------
+        None.
+        """
+        if data is not None:
+            self.data = data
+        self.positions = None
+
+
+    def GetIndices(self, value, maxCount=None) -> np.ndarray:
+        """
+        Gets the indices of the entries that match a value.
+
+        Parameters
+        ----------
+        value : string, numeric
+            The value to look up.
+        maxCount : integer, optional
+            The maximum number of indices to return.  The default is None, which returns all of them.
+
+        Returns
+        -------
+        : numpy.ndarray
+            The indices in ascending order.  The array is a read only view of the index.  It is empty if the value is
+            not in the data.
+        """
+        self.__Build()
+        code = self.lookUp.get(value)
+        if code is None:
+            return self.positions[:0]
+
+        start = self.offsets[code]
+        stop  = self.offsets[code+1]
+        if maxCount is not None:
+            stop = min(stop, start+maxCount)
+        return self.positions[start:stop]
+
+
+    def GetCounts(self) -> dict:
+        """
+        Gets the number of entries of each value.
+
+        Returns
+        -------
+        : dictionary
+            The keys are the values and the values are the counts.
+        """
+        self.__Build()
+        return dict(zip(self.lookUp.keys(), np.diff(self.offsets).tolist()))
+
+
+    def __Build(self):
+        """
+        Builds the index if it does not exist or was invalidated.
+        """
+        if self.positions is not None:
+            return
+
+        data           = pd.Series(self.data, dtype=object) if isinstance(self.data, (list, tuple)) else self.data
+        codes, uniques = pd.factorize(data)
+        codes          = np.asarray(codes)
+
+        # Missing values have a code of -1.  Shifting by one puts them in group zero, which is then skipped.
+        positions      = np.argsort(codes, kind="stable")
+        counts         = np.bincount(codes+1, minlength=len(uniques)+1)
+
+        self.positions = positions[counts[0]:]
+        self.positions.flags.writeable = False
+        self.offsets   = np.concatenate(([0], np.cumsum(counts[1:])))
+        self.lookUp    = {value : code for code, value in enumerate(uniques.tolist())}
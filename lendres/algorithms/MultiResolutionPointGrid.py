@@ -0,0 +1,316 @@
+"""
+Created on October 18, 2026
+@author: Lance A. Endres
+"""
+import numpy            as np
+
+
+class MultiResolutionPointGrid():
+    """
+    A set of background grids used to accelerate minimum distance checks between points that each have their own
+    minimum distance (radius).
+
+    Two points are too close if the distance between them is less than the larger of their radii.
+
+    A single grid sized for the smallest radius would have to search a very large neighborhood for the largest
+    radius.  Instead, the radii are split into levels that each cover a factor of two (rMin*2^L to rMin*2^(L+1)).
+    Every level has its own grid with a cell diagonal equal to the smallest radius of the level, so each cell still
+    holds at most one point, and a neighborhood search only has to cover a few cells for radii of the same level.
+
+    A candidate is checked against the points of its own and the coarser levels with a search of a few cells, because
+    the larger radius of the two is within the band of the point's level.  Points of finer levels are checked through
+    counts of the points in coarser cells (a pyramid for each level).  The search starts with the cells of the
+    candidate's level and only divides the occupied cells that are partly inside the candidate's radius, so the cost
+    grows with the ratio of the radii instead of its square.
+
+    Like PointGrid, the points are stored in a growable NumPy buffer and the cells hold indices into it.
+    """
+
+
+    def __init__(self, bounds:tuple, minDistanceRange:tuple, initialCapacity:int=1024):
+        """
+        Constructor.
+
+        Parameters
+        ----------
+        bounds : tuple
+            The bounds of the area covered by the grid as (minX, minY, maxX, maxY).
+        minDistanceRange : tuple
+            The smallest and largest minimum distance (radius) a point can have.
+        initialCapacity : int, optional
+            The number of points the buffer can hold before it has to grow. The default is 1024.
+
+        Returns
+        -------
+        None.
+        """
+        self.minX           = bounds[0]
+        self.minY           = bounds[1]
+        self.rMin           = float(minDistanceRange[0])
+        self.rMax           = float(minDistanceRange[1])
+
+        if self.rMin <= 0 or self.rMax < self.rMin:
+            raise Exception("The minimum distance range is not valid.")
+
+        numberOfLevels      = int(np.floor(np.log2(self.rMax/self.rMin))) + 1
+        self.levelDistances = self.rMin * 2.0**np.arange(numberOfLevels)
+        self.cellSizes      = self.levelDistances / np.sqrt(2)
+
+        # Each level is padded by the neighborhood that is searched on it (the band of radii of the level) so no
+        # neighborhood has to be clipped.
+        self.paddings       = [int(np.ceil(2*distance/cellSize)) for distance, cellSize in zip(self.levelDistances, self.cellSizes)]
+        self.sizes          = [(max(int(np.ceil((bounds[2]-bounds[0])/cellSize)), 1), max(int(np.ceil((bounds[3]-bounds[1])/cellSize)), 1)) for cellSize in self.cellSizes]
+        self.levels         = [np.zeros((width+2*padding, height+2*padding), dtype=np.int64) for (width, height), padding in zip(self.sizes, self.paddings)]
+        self.levelCounts    = np.zeros(numberOfLevels, dtype=np.int64)
+
+        # The number of points of each level in the cells of the coarser levels.  Entry [level][k-1] has cells 2^k times
+        # the size of the level's cells.  The cell of a point is found by shifting the index of its cell on its own level,
+        # so a point is always in the children of the cell it is counted in.
+        self.pyramids       = [
+            [np.zeros((((width-1) >> k) + 1, ((height-1) >> k) + 1), dtype=np.int64) for k in range(1, numberOfLevels-level)]
+            for level, (width, height) in enumerate(self.sizes)
+        ]
+
+        # Row zero of the buffers is a sentinel that empty cells point to.  See PointGrid.
+        self.buffer         = np.full((max(initialCapacity, 1)+1, 2), np.nan)
+        self.radii          = np.zeros(max(initialCapacity, 1)+1)
+        self.numberOfPoints = 0
+
+
+    @property
+    def Points(self) -> np.ndarray:
+        """
+        Gets the points in the grid, in the order they were added.  The array is a view of the internal buffer.
+
+        Returns
+        -------
+        np.ndarray
+        """
+        return self.buffer[1:self.numberOfPoints+1]
+
+
+    @property
+    def Radii(self) -> np.ndarray:
+        """
+        Gets the minimum distances (radii) of the points in the grid.  The array is a view of the internal buffer.
+
+        Returns
+        -------
+        np.ndarray
+        """
+        return self.radii[1:self.numberOfPoints+1]
+
+
+    def GetLevels(self, radii:np.ndarray) -> np.ndarray:
+        """
+        Gets the level that stores points with the specified radii.
+
+        Parameters
+        ----------
+        radii : np.ndarray
+            The minimum distances of the points.
+
+        Returns
+        -------
+        : np.ndarray
+            The levels.
+        """
+        return np.clip(np.floor(np.log2(np.asarray(radii)/self.rMin)).astype(int), 0, len(self.levels)-1)
+
+
+    def __GetCellIndices(self, points:np.ndarray, level:int, padded:bool=True) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Gets the cell indices of the points on a level.  The indices include the padding unless "padded" is False.
+        """
+        width, height = self.sizes[level]
+        padding       = self.paddings[level] if padded else 0
+        xIndices      = np.clip(((points[:, 0] - self.minX) / self.cellSizes[level]).astype(int), 0, width-1) + padding
+        yIndices      = np.clip(((points[:, 1] - self.minY) / self.cellSizes[level]).astype(int), 0, height-1) + padding
+        return xIndices, yIndices
+
+
+    def Insert(self, points:np.ndarray, radii:np.ndarray) -> np.ndarray:
+        """
+        Adds points to the grid.  The points are assumed to already satisfy the minimum distance requirement.
+
+        Parameters
+        ----------
+        points : np.ndarray
+            A point or an array of points of shape (n, 2).
+        radii : np.ndarray
+            The minimum distances of the points.
+
+        Returns
+        -------
+        indices : np.ndarray
+            The indices of the added points in Points.
+        """
+        points   = np.atleast_2d(points)
+        radii    = np.clip(np.broadcast_to(np.asarray(radii, dtype=float), (len(points),)), self.rMin, self.rMax)
+        required = self.numberOfPoints + len(points) + 1
+
+        # Grow the buffers by doubling so the cost of copying is amortized over all the insertions.
+        if required > len(self.buffer):
+            size         = max(required, 2*len(self.buffer))
+            buffer       = np.full((size, 2), np.nan)
+            buffer[:self.numberOfPoints+1] = self.buffer[:self.numberOfPoints+1]
+            newRadii     = np.zeros(size)
+            newRadii[:self.numberOfPoints+1] = self.radii[:self.numberOfPoints+1]
+            self.buffer  = buffer
+            self.radii   = newRadii
+
+        indices = np.arange(self.numberOfPoints, self.numberOfPoints+len(points))
+        self.buffer[indices+1] = points
+        self.radii[indices+1]  = radii
+        self.numberOfPoints   += len(points)
+
+        levels = self.GetLevels(radii)
+        for level in np.unique(levels):
+            mask               = levels == level
+            xIndices, yIndices = self.__GetCellIndices(points[mask], level)
+            self.levels[level][xIndices, yIndices] = indices[mask] + 1
+            self.levelCounts[level] += np.count_nonzero(mask)
+
+            xIndices, yIndices = self.__GetCellIndices(points[mask], level, padded=False)
+            for k, counts in enumerate(self.pyramids[level], 1):
+                np.add.at(counts, (xIndices >> k, yIndices >> k), 1)
+
+        return indices
+
+
+    def AreFree(self, candidates:np.ndarray, radii:np.ndarray) -> np.ndarray:
+        """
+        Checks which candidate points are far enough away from all the points in the grid.
+
+        Parameters
+        ----------
+        candidates : np.ndarray
+            An array of points of shape (n, 2).
+        radii : np.ndarray
+            The minimum distances of the candidates.
+
+        Returns
+        -------
+        free : np.ndarray
+            A boolean array that is True where the candidate is far enough away from all the points in the grid.
+        """
+        radii  = np.clip(np.asarray(radii, dtype=float), self.rMin, self.rMax)
+        free   = np.ones(len(candidates), dtype=bool)
+        levels = self.GetLevels(radii)
+
+        for level, cells in enumerate(self.levels):
+            if self.levelCounts[level] == 0:
+                continue
+
+            # For candidates on this level or a finer one, the larger radius is less than twice the level distance, so
+            # only the padding has to be searched.
+            mask = free & (levels <= level)
+            if np.any(mask):
+                reach              = self.paddings[level]
+                offsets            = np.arange(-reach, reach+1)
+                xIndices, yIndices = self.__GetCellIndices(candidates[mask], level)
+
+                neighborIndices    = cells[xIndices[:, None, None] + offsets[None, :, None], yIndices[:, None, None] + offsets[None, None, :]]
+                distancesSquared   = np.sum((self.buffer[neighborIndices] - candidates[mask][:, None, None, :])**2, axis=-1)
+                limitsSquared      = np.maximum(self.radii[neighborIndices], radii[mask][:, None, None])**2
+
+                free[mask] = ~np.any(distancesSquared < limitsSquared, axis=(1, 2))
+
+            # The candidates on coarser levels have the larger radius, so they are checked through the pyramid.
+            for candidateLevel in np.unique(levels[levels > level]):
+                mask       = free & (levels == candidateLevel)
+                if np.any(mask):
+                    free[mask] = ~self.__HasPointWithin(candidates[mask], radii[mask], level, candidateLevel-level)
+
+        return free
+
+
+    def __HasPointWithin(self, candidates:np.ndarray, radii:np.ndarray, level:int, k:int) -> np.ndarray:
+        """
+        Checks which candidates have a point of a level closer than their radius.  The search starts on the pyramid
+        cells that are 2^k times the size of the level's cells.
+        """
+        found              = np.zeros(len(candidates), dtype=bool)
+        cellSize           = self.cellSizes[level] * 2**k
+        xIndices, yIndices = self.__GetCellIndices(candidates, level, padded=False)
+
+        # All the cells within the largest radius of the candidate cells, as (candidate, x index, y index) entries.
+        reach              = int(np.ceil(radii.max()/cellSize))
+        xOffsets, yOffsets = np.meshgrid(np.arange(-reach, reach+1), np.arange(-reach, reach+1), indexing="ij")
+        owners             = np.repeat(np.arange(len(candidates)), xOffsets.size)
+        xCells             = ((xIndices >> k)[:, None] + xOffsets.ravel()).ravel()
+        yCells             = ((yIndices >> k)[:, None] + yOffsets.ravel()).ravel()
+
+        while len(owners) > 0:
+            if k == 0:
+                # The cells of the level hold one point each, so the distances are checked directly.
+                neighborIndices  = self.levels[level][xCells + self.paddings[level], yCells + self.paddings[level]]
+                distancesSquared = np.sum((self.buffer[neighborIndices] - candidates[owners])**2, axis=-1)
+                found[owners[distancesSquared < radii[owners]**2]] = True
+                break
+
+            counts   = self.pyramids[level][k-1]
+            inGrid   = (xCells >= 0) & (xCells < counts.shape[0]) & (yCells >= 0) & (yCells < counts.shape[1])
+            owners, xCells, yCells = owners[inGrid], xCells[inGrid], yCells[inGrid]
+            occupied = counts[xCells, yCells] > 0
+            owners, xCells, yCells = owners[occupied], xCells[occupied], yCells[occupied]
+
+            # The nearest and farthest distances from the candidate to the cell.  The cell is enlarged slightly so that
+            # rounding of the cell indices of the points cannot cause a point to be missed.
+            tolerance  = 1e-9 * cellSize
+            xLow       = self.minX + xCells*cellSize - tolerance - candidates[owners, 0]
+            xHigh      = self.minX + (xCells+1)*cellSize + tolerance - candidates[owners, 0]
+            yLow       = self.minY + yCells*cellSize - tolerance - candidates[owners, 1]
+            yHigh      = self.minY + (yCells+1)*cellSize + tolerance - candidates[owners, 1]
+            nearest    = np.maximum(np.maximum(xLow, -xHigh), 0)**2 + np.maximum(np.maximum(yLow, -yHigh), 0)**2
+            farthest   = np.maximum(-xLow, xHigh)**2 + np.maximum(-yLow, yHigh)**2
+            limits     = radii[owners]**2
+
+            # A cell completely inside the radius has a point that is too close.  A cell completely outside the radius
+            # is skipped.  The other cells are divided into their four children.
+            found[owners[farthest < limits]] = True
+            partial    = (nearest < limits) & (farthest >= limits) & ~found[owners]
+            owners     = np.repeat(owners[partial], 4)
+            xCells     = (2*xCells[partial, None] + np.array([0, 1, 0, 1])).ravel()
+            yCells     = (2*yCells[partial, None] + np.array([0, 0, 1, 1])).ravel()
+            k         -= 1
+            cellSize  /= 2
+
+        return found
+
+
+    def InsertFree(self, candidates:np.ndarray, radii:np.ndarray) -> np.ndarray:
+        """
+        Adds the candidates that are far enough away from the points in the grid and from each other.
+
+        The candidates are accepted in order, so a candidate is rejected if it is too close to a candidate that
+        was accepted before it.
+
+        Parameters
+        ----------
+        candidates : np.ndarray
+            An array of points of shape (n, 2).
+        radii : np.ndarray
+            The minimum distances of the candidates.
+
+        Returns
+        -------
+        indices : np.ndarray
+            The indices of the accepted points in Points.
+        """
+        radii      = np.clip(np.asarray(radii, dtype=float), self.rMin, self.rMax)
+        free       = self.AreFree(candidates, radii)
+        candidates = candidates[free]
+        radii      = radii[free]
+
+        if len(candidates) > 1:
+            distancesSquared = np.sum((candidates[:, None, :] - candidates[None, :, :])**2, axis=-1)
+            tooClose         = (distancesSquared < np.maximum(radii[:, None], radii[None, :])**2).tolist()
+            keep             = [0]
+            for i in range(1, len(candidates)):
+                if not any(tooClose[i][j] for j in keep):
+                    keep.append(i)
+            candidates = candidates[keep]
+            radii      = radii[keep]
+
+        return self.Insert(candidates, radii)
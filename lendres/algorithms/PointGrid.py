@@ -0,0 +1,221 @@
+"""
+Created on October 18, 2026
+@author: Lance A. Endres
+"""
+import numpy            as np
+
+
+class PointGrid():
+    """
+    A background grid used to accelerate minimum distance checks between points.
+
+    The cell size is chosen so that the cell diagonal equals the minimum distance.  Therefore, each cell can hold at
+    most one point and only the 5x5 block of cells around a location needs to be checked to find any point closer
+    than the minimum distance.  The cells are stored in a NumPy array so the neighborhoods of many candidate points
+    can be checked in a single, vectorized operation.
+
+    The grid also stores the points.  They are kept in a preallocated NumPy buffer that doubles in size when it is
+    full and the cells hold indices into that buffer.
+    """
+
+
+    def __init__(self, bounds:tuple, minDistance:float, initialCapacity:int=1024):
+        """
+        Constructor.
+
+        Parameters
+        ----------
+        bounds : tuple
+            The bounds of the area covered by the grid as (minX, minY, maxX, maxY).
+        minDistance : float
+            The minimum distance allowed between points.
+        initialCapacity : int, optional
+            The number of points the buffer can hold before it has to grow. The default is 1024.
+
+        Returns
+        -------
+        None.
+        """
+        self.minX               = bounds[0]
+        self.minY               = bounds[1]
+        self.minDistance        = minDistance
+        self.minDistanceSquared = minDistance**2
+        self.cellSize           = minDistance / np.sqrt(2)
+
+        self.width              = max(int(np.ceil((bounds[2] - bounds[0]) / self.cellSize)), 1)
+        self.height             = max(int(np.ceil((bounds[3] - bounds[1]) / self.cellSize)), 1)
+
+        # The grid is padded with two cells on each side so the 5x5 neighborhood of any cell inside the bounds
+        # never has to be clipped.  The cells store the buffer index of the point plus one so that zero means empty.
+        self.cells              = np.zeros((self.width+4, self.height+4), dtype=np.int64)
+
+        # Row zero of the buffer is a NaN sentinel that empty cells point to.  NaN never compares as being close
+        # to anything, so empty cells do not need to be masked.
+        self.buffer             = np.full((max(initialCapacity, 1)+1, 2), np.nan)
+        self.numberOfPoints     = 0
+
+        # Indices of points that could not be placed in a cell because it was occupied.  See InsertExisting.
+        self.overflow           = np.zeros(0, dtype=np.int64)
+
+
+    @property
+    def Points(self) -> np.ndarray:
+        """
+        Gets the points in the grid, in the order they were added.  The array is a view of the internal buffer.
+
+        Returns
+        -------
+        np.ndarray
+        """
+        return self.buffer[1:self.numberOfPoints+1]
+
+
+    def GetCellIndices(self, points:np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Gets the (padded) cell indices of the points.
+
+        Parameters
+        ----------
+        points : np.ndarray
+            An array of points of shape (n, 2).
+
+        Returns
+        -------
+        : tuple[np.ndarray, np.ndarray]
+            The x and y indices of the cells that contain the points.
+        """
+        points = np.atleast_2d(points)
+        xIndices = np.clip(((points[:, 0] - self.minX) / self.cellSize).astype(int), 0, self.width-1) + 2
+        yIndices = np.clip(((points[:, 1] - self.minY) / self.cellSize).astype(int), 0, self.height-1) + 2
+        return xIndices, yIndices
+
+
+    def Insert(self, points:np.ndarray) -> np.ndarray:
+        """
+        Adds points to the grid.  The points are assumed to already satisfy the minimum distance requirement.
+
+        Parameters
+        ----------
+        points : np.ndarray
+            A point or an array of points of shape (n, 2).
+
+        Returns
+        -------
+        indices : np.ndarray
+            The indices of the added points in Points.
+        """
+        points   = np.atleast_2d(points)
+        required = self.numberOfPoints + len(points) + 1
+
+        # Grow the buffer by doubling so the cost of copying is amortized over all the insertions.
+        if required > len(self.buffer):
+            buffer = np.full((max(required, 2*len(self.buffer)), 2), np.nan)
+            buffer[:self.numberOfPoints+1] = self.buffer[:self.numberOfPoints+1]
+            self.buffer = buffer
+
+        indices = np.arange(self.numberOfPoints, self.numberOfPoints+len(points))
+        self.buffer[indices+1] = points
+        self.numberOfPoints   += len(points)
+
+        xIndices, yIndices = self.GetCellIndices(points)
+        self.cells[xIndices, yIndices] = indices + 1
+
+        return indices
+
+
+    def InsertExisting(self, points:np.ndarray) -> np.ndarray:
+        """
+        Adds points that do not necessarily satisfy the minimum distance requirement, for example, fixed points that
+        new points must stay away from.
+
+        A point that lands in an occupied cell is kept in an overflow list.  Candidates are checked against the overflow
+        points directly, so the minimum distance to every existing point is still honored.
+
+        Parameters
+        ----------
+        points : np.ndarray
+            A point or an array of points of shape (n, 2).
+
+        Returns
+        -------
+        indices : np.ndarray
+            The indices of the added points in Points.
+        """
+        points             = np.atleast_2d(points)
+        xIndices, yIndices = self.GetCellIndices(points)
+        previous           = self.cells[xIndices, yIndices]
+
+        # Only the first point in each cell is stored in the cell.  Any others, and any point that landed in a cell
+        # that was already occupied, go to the overflow list.
+        placed             = np.zeros(len(points), dtype=bool)
+        placed[np.unique(xIndices*self.cells.shape[1] + yIndices, return_index=True)[1]] = True
+        placed            &= previous == 0
+
+        indices            = self.Insert(points)
+        self.cells[xIndices, yIndices] = previous
+        self.cells[xIndices[placed], yIndices[placed]] = indices[placed] + 1
+        self.overflow      = np.concatenate((self.overflow, indices[~placed]))
+
+        return indices
+
+
+    def AreFree(self, candidates:np.ndarray) -> np.ndarray:
+        """
+        Checks which candidate points are at least the minimum distance away from all the points in the grid.
+
+        Parameters
+        ----------
+        candidates : np.ndarray
+            An array of points of shape (n, 2).
+
+        Returns
+        -------
+        : np.ndarray
+            A boolean array that is True where the candidate is far enough away from all the points in the grid.
+        """
+        xIndices, yIndices = self.GetCellIndices(candidates)
+        offsets            = np.arange(-2, 3)
+
+        # Gather the 5x5 neighborhood of every candidate at once.  The shape is (n, 5, 5, 2).
+        neighbors          = self.buffer[self.cells[xIndices[:, None, None] + offsets[None, :, None], yIndices[:, None, None] + offsets[None, None, :]]]
+        distancesSquared   = np.sum((neighbors - candidates[:, None, None, :])**2, axis=-1)
+
+        free               = ~np.any(distancesSquared < self.minDistanceSquared, axis=(1, 2))
+
+        if len(self.overflow) > 0:
+            overflowPoints = self.buffer[self.overflow+1]
+            free          &= ~np.any(np.sum((overflowPoints[None, :, :] - candidates[:, None, :])**2, axis=-1) < self.minDistanceSquared, axis=1)
+
+        return free
+
+
+    def InsertFree(self, candidates:np.ndarray) -> np.ndarray:
+        """
+        Adds the candidates that are far enough away from the points in the grid and from each other.
+
+        The candidates are accepted in order, so a candidate is rejected if it is too close to a candidate that
+        was accepted before it.
+
+        Parameters
+        ----------
+        candidates : np.ndarray
+            An array of points of shape (n, 2).
+
+        Returns
+        -------
+        indices : np.ndarray
+            The indices of the accepted points in Points.
+        """
+        candidates = candidates[self.AreFree(candidates)]
+
+        # The surviving candidates only need to be checked against each other.  There are at most a few dozen, so
+        # the pairwise distances are computed at once and the acceptance is done with a small loop.
+        if len(candidates) > 1:
+            tooClose = (np.sum((candidates[:, None, :] - candidates[None, :, :])**2, axis=-1) < self.minDistanceSquared).tolist()
+            keep     = [0]
+            for i in range(1, len(candidates)):
+                if not any(tooClose[i][j] for j in keep):
+                    keep.append(i)
+            candidates = candidates[keep]
+
+        return self.Insert(candidates)
@@ -6,9 +6,32 @@ import numpy            as np
 from   shapely.geometry import Point
 import shapely
 import random
+import os
+from   typing                                                        import Callable
+from   concurrent.futures                                            import ProcessPoolExecutor
+
+from   lendres.algorithms.PointGrid                                  import PointGrid
+from   lendres.algorithms.MultiResolutionPointGrid                   import MultiResolutionPointGrid
+from   lendres.algorithms.PolygonContainment                         import PolygonContainment
 
 
 class PoissonDiskSampling():
+    """
+    Poisson disk sampling of the area inside of a polygon.
+
+    Two methods are available:
+        vectorized : All the candidates around a point are generated and tested at once using NumPy and the vectorized
+            shapely functions.  This is much faster for large polygons.
+        scalar : The original implementation that tests one candidate at a time.  It is kept so that results seeded
+            with "random.seed" can be reproduced.
+
+    Large polygons can be split into tiles that are sampled in parallel with SampleTiled.
+
+    The vectorized method also supports polygons with holes, multi-polygons, and a minimum distance that varies
+    over the polygon (variable density).
+
+    An existing set of points can be extended into a new or changed area with Extend.
+    """
 
 
     @classmethod
@@ -45,10 +68,83 @@ class PoissonDiskSampling():
 
 
     @classmethod
-    def Sample(cls, polygon:shapely.Polygon, minDistance:float, minDistanceFromEdge:float=None, numSamplesBeforeRejection:int=30):
+    def Sample(
+            cls,
+            polygon:                   shapely.Polygon | shapely.MultiPolygon,
+            minDistance:               float | Callable | np.ndarray,
+            minDistanceFromEdge:       float                          = None,
+            numSamplesBeforeRejection: int                            = 30,
+            method:                    str                            = "vectorized",
+            seed:                      int | np.random.Generator      = None,
+            minDistanceRange:          tuple                          = None,
+            asArray:                   bool                           = False
+        ):
+        """
+        Generates points inside of a polygon that are no closer to each other than a minimum distance.
+
+        Parameters
+        ----------
+        polygon : shapely.Polygon | shapely.MultiPolygon
+            The polygon to fill with points.  The vectorized method keeps points out of holes and away from their
+            edges and fills every part of a multi-polygon.  The scalar method only supports a polygon.
+        minDistance : float | Callable | np.ndarray
+            The minimum distance between points.  For variable density (vectorized method only), it can be:
+                Callable : A function f(x, y) that takes arrays of coordinates and returns an array of the local minimum
+                    distances.  "minDistanceRange" must also be provided.
+                np.ndarray : A raster of local minimum distances with shape (nx, ny) that evenly covers the bounds of the
+                    polygon.  Element [i, j] covers the i-th column (x) and j-th row (y).
+            With a variable minimum distance, two points must be at least the larger of their minimum distances apart.
+        minDistanceFromEdge : float, optional
+            The minimum distance between a point and the edge of the polygon.  If None, minDistance (or the smallest
+            minimum distance for variable density) is used. The default is None.
+        numSamplesBeforeRejection : int, optional
+            The number of candidates generated around each point. The default is 30.
+        method : str, optional
+            The sampling engine.
+                vectorized : Candidates are generated and tested in batches with NumPy.
+                scalar : Candidates are generated and tested one at a time.  Reproduces the output of earlier versions
+                    for a given "random.seed."
+            The default is "vectorized".
+        seed : int | np.random.Generator, optional
+            Seed or generator for the random numbers.  If None, the numbers are drawn from the "random" module so
+            that "random.seed" controls the output.  The scalar method only accepts an integer seed. The default is None.
+        minDistanceRange : tuple, optional
+            The smallest and largest values returned by a callable "minDistance."  Values outside of the range are
+            clipped to it.  Not used for other types of "minDistance." The default is None.
+        asArray : bool, optional
+            If True, the points are returned as an array of shape (n, 2) instead of a list. The default is False.
+
+        Returns
+        -------
+        : list or np.ndarray
+            The sample points as a list of [x, y] lists or, if "asArray" is True, an array of shape (n, 2).
+        """
+        distanceFunction = None
+        if not np.isscalar(minDistance):
+            distanceFunction, minDistanceRange = cls.__CreateDistanceFunction(minDistance, minDistanceRange, polygon.bounds)
+
         if minDistanceFromEdge is None:
-            minDistanceFromEdge = minDistance
+            minDistanceFromEdge = minDistance if distanceFunction is None else minDistanceRange[0]
+
+        match method:
+            case "vectorized":
+                randomNumberGenerator = cls.__GetRandomNumberGenerator(seed)
+                points = cls.__SampleVectorized(polygon, minDistance, minDistanceFromEdge, numSamplesBeforeRejection, randomNumberGenerator, distanceFunction, minDistanceRange)
+                return points if asArray else points.tolist()
+            case "scalar":
+                if isinstance(seed, np.random.Generator):
+                    raise Exception("The scalar method requires an integer seed.")
+                if distanceFunction is not None or not isinstance(polygon, shapely.Polygon):
+                    raise Exception("The scalar method only supports a polygon and a constant minimum distance.")
+                randomGenerator = random if seed is None else random.Random(seed)
+                points = cls.__SampleScalar(polygon, minDistance, minDistanceFromEdge, numSamplesBeforeRejection, randomGenerator)
+                return np.array(points, dtype=float).reshape(-1, 2) if asArray else points
+            case _:
+                raise Exception("The 'method' parameter is not valid.")
+
 
+    @classmethod
+    def __SampleScalar(cls, polygon:shapely.Polygon, minDistance:float, minDistanceFromEdge:float, numSamplesBeforeRejection:int, randomGenerator:random.Random):
         # Function to generate Poisson Disk points.
         minX, minY, maxX, maxY = polygon.bounds
 
@@ -61,18 +157,18 @@ class PoissonDiskSampling():
         samplePoints = []
 
         # Add initial point.
-        initialPoint = [random.uniform(minX, maxX), random.uniform(minY, maxY)]
+        initialPoint = [randomGenerator.uniform(minX, maxX), randomGenerator.uniform(minY, maxY)]
         while not polygon.contains(Point(initialPoint)):
-            initialPoint = [random.uniform(minX, maxX), random.uniform(minY, maxY)]
+            initialPoint = [randomGenerator.uniform(minX, maxX), randomGenerator.uniform(minY, maxY)]
         cls.__AddPoint(initialPoint, samplePoints, processList, grid, minX, minY, gridSize)
 
         # Process points and generate new points around existing points.
         while processList:
-            currentPoint = random.choice(processList)
+            currentPoint = randomGenerator.choice(processList)
             processList.remove(currentPoint)
             for _ in range(numSamplesBeforeRejection):
-                angle    = random.uniform(0, 2 * np.pi)
-                radius   = random.uniform(minDistance, 2 * minDistance)
+                angle    = randomGenerator.uniform(0, 2 * np.pi)
+                radius   = randomGenerator.uniform(minDistance, 2 * minDistance)
                 newPoint = [
                     currentPoint[0] + radius * np.cos(angle),
                     currentPoint[1] + radius * np.sin(angle)
@@ -83,4 +179,315 @@ class PoissonDiskSampling():
                     if polygon.exterior.distance(pointNewPoint) >= minDistanceFromEdge:
                         cls.__AddPoint(newPoint, samplePoints, processList, grid, minX, minY, gridSize)
 
-        return samplePoints
\ No newline at end of file
+        return samplePoints
+
+
+    @classmethod
+    def SampleTiled(
+            cls,
+            polygon:                   shapely.Polygon,
+            minDistance:               float,
+            minDistanceFromEdge:       float                          = None,
+            numSamplesBeforeRejection: int                            = 30,
+            tileSize:                  float                          = None,
+            maxWorkers:                int                            = None,
+            seed:                      int | np.random.Generator      = None
+        ) -> np.ndarray:
+        """
+        Generates points inside of a polygon by splitting it into tiles that are sampled in parallel processes.
+
+        Each tile is sampled independently with the vectorized method.  Points on either side of a tile border can be
+        closer than the minimum distance, so the tiles are then merged in order and any point that is too close to a
+        point of an earlier tile is removed.  Finally, the gaps left along the borders are filled by continuing the
+        sampling from the points near the borders.  The minimum distance is therefore guaranteed for the whole polygon.
+
+        The result only depends on the seed and the tile size, not on the number of workers.
+
+        Parameters
+        ----------
+        polygon : shapely.Polygon
+            The polygon to fill with points.
+        minDistance : float
+            The minimum distance between points.
+        minDistanceFromEdge : float, optional
+            The minimum distance between a point and the edge of the polygon.  If None, minDistance is used. The default is None.
+        numSamplesBeforeRejection : int, optional
+            The number of candidates generated around each point. The default is 30.
+        tileSize : float, optional
+            The width and height of the tiles.  If None, the bounds are split into about two tiles per worker. The default is None.
+        maxWorkers : int, optional
+            The number of processes.  If None, the number of processors is used.  If 1, the tiles are sampled in
+            this process. The default is None.
+        seed : int | np.random.Generator, optional
+            Seed or generator for the random numbers.  If None, the seed is drawn from the "random" module. The default is None.
+
+        Returns
+        -------
+        : np.ndarray
+            The sample points as an array of shape (n, 2).
+        """
+        if not np.isscalar(minDistance):
+            raise Exception("The tiled sampling only supports a constant minimum distance.")
+
+        if minDistanceFromEdge is None:
+            minDistanceFromEdge = minDistance
+
+        if maxWorkers is None:
+            maxWorkers = os.cpu_count() or 1
+
+        containment            = PolygonContainment(polygon, minDistanceFromEdge)
+        minX, minY, maxX, maxY = polygon.bounds
+
+        if tileSize is None:
+            tilesPerSide = int(np.ceil(np.sqrt(2*maxWorkers)))
+            tileSize     = max(maxX - minX, maxY - minY) / tilesPerSide
+
+        # The tiles are clipped from the shrunk region so the edge distance only applies to the edges of the polygon.
+        tileRegions = []
+        for x0 in np.arange(minX, maxX, tileSize):
+            for y0 in np.arange(minY, maxY, tileSize):
+                tileRegion = shapely.intersection(containment.Region, shapely.box(x0, y0, x0+tileSize, y0+tileSize))
+                if not tileRegion.is_empty and tileRegion.area > 0:
+                    tileRegions.append(tileRegion)
+
+        # One child seed per tile plus one for the border pass.
+        seedSequences = cls.__GetSeedSequence(seed).spawn(len(tileRegions)+1)
+        arguments     = (tileRegions, [minDistance]*len(tileRegions), [numSamplesBeforeRejection]*len(tileRegions), seedSequences[:-1])
+
+        if maxWorkers == 1 or len(tileRegions) < 2:
+            tilePoints = list(map(cls._SampleTile, *arguments))
+        else:
+            with ProcessPoolExecutor(max_workers=maxWorkers) as executor:
+                tilePoints = list(executor.map(cls._SampleTile, *arguments))
+
+        # Merge the tiles in order.  Points of a tile never conflict with each other, so each tile only has to be checked
+        # against the tiles before it.
+        grid = PointGrid(polygon.bounds, minDistance, initialCapacity=sum(len(points) for points in tilePoints))
+        for points in tilePoints:
+            grid.Insert(points[grid.AreFree(points)])
+
+        # Continue sampling from the points close to the tile borders to fill the gaps left by removed points.
+        points     = grid.Points
+        xDistance  = np.abs(np.mod(points[:, 0] - minX + tileSize/2, tileSize) - tileSize/2)
+        yDistance  = np.abs(np.mod(points[:, 1] - minY + tileSize/2, tileSize) - tileSize/2)
+        activeList = np.flatnonzero((xDistance < 2*minDistance) | (yDistance < 2*minDistance)).tolist()
+
+        cls.__Fill(containment, grid, activeList, minDistance, numSamplesBeforeRejection, np.random.default_rng(seedSequences[-1]))
+
+        return grid.Points.copy()
+
+
+    @classmethod
+    def _SampleTile(cls, region:shapely.Geometry, minDistance:float, numSamplesBeforeRejection:int, seedSequence:np.random.SeedSequence) -> np.ndarray:
+        """
+        Samples one tile.  The region is already shrunk by the distance from the edge.  This is the function run by
+        the worker processes, so it must be accessible by name (not private).
+        """
+        return cls.__SampleVectorized(region, minDistance, 0, numSamplesBeforeRejection, np.random.default_rng(seedSequence))
+
+
+    @classmethod
+    def Extend(
+            cls,
+            polygon:                   shapely.Polygon | shapely.MultiPolygon,
+            existingPoints:            np.ndarray,
+            minDistance:               float,
+            region:                    shapely.Geometry               = None,
+            minDistanceFromEdge:       float                          = None,
+            numSamplesBeforeRejection: int                            = 30,
+            seed:                      int | np.random.Generator      = None
+        ) -> np.ndarray:
+        """
+        Adds points to an existing set of points without moving any of the existing points.
+
+        This is used when the polygon is edited (for example, part of a field is added) or when there are fixed points
+        (for example, existing wells) that new points have to stay away from.  Only the area to fill and the existing
+        points close to it are used, so the cost depends on the size of the change rather than the size of the polygon.
+
+        The existing points close to the area to fill are used to continue the sampling into the area, so the new points
+        join the existing ones without a seam.  A seed point is also added to every part of the area that no existing
+        point reaches.  The existing points do not have to satisfy the minimum distance between themselves.
+
+        When the polygon is enlarged, use the difference between the new and old polygons as the region.  Expand it by
+        about twice the minimum distance if the gap left along the old edge should also be filled.
+
+        Parameters
+        ----------
+        polygon : shapely.Polygon | shapely.MultiPolygon
+            The (new) polygon.  New points are kept inside of it and away from its edges.
+        existingPoints : np.ndarray
+            The existing points as an array of shape (n, 2).  They are not returned.
+        minDistance : float
+            The minimum distance between points.
+        region : shapely.Geometry, optional
+            The area to add points to.  If None, the whole polygon is used. The default is None.
+        minDistanceFromEdge : float, optional
+            The minimum distance between a new point and the edge of the polygon.  If None, minDistance is used. The default is None.
+        numSamplesBeforeRejection : int, optional
+            The number of candidates generated around each point. The default is 30.
+        seed : int | np.random.Generator, optional
+            Seed or generator for the random numbers.  If None, the seed is drawn from the "random" module. The default is None.
+
+        Returns
+        -------
+        : np.ndarray
+            The new points as an array of shape (m, 2).
+        """
+        if not np.isscalar(minDistance):
+            raise Exception("Extending a point set only supports a constant minimum distance.")
+
+        if minDistanceFromEdge is None:
+            minDistanceFromEdge = minDistance
+
+        fillRegion = PolygonContainment.ShrinkPolygon(polygon, minDistanceFromEdge)
+        if region is not None:
+            fillRegion = shapely.intersection(fillRegion, region)
+
+        if fillRegion.is_empty or fillRegion.area == 0:
+            return np.empty((0, 2))
+
+        # Only the existing points that can conflict with, or grow into, the area to fill are needed.
+        margin                 = 2*minDistance
+        minX, minY, maxX, maxY = fillRegion.bounds
+        bounds                 = (minX-margin, minY-margin, maxX+margin, maxY+margin)
+        existingPoints         = np.asarray(existingPoints, dtype=float).reshape(-1, 2)
+        nearby                 = existingPoints[(existingPoints[:, 0] >= bounds[0]) & (existingPoints[:, 0] <= bounds[2]) &
+                                                (existingPoints[:, 1] >= bounds[1]) & (existingPoints[:, 1] <= bounds[3])]
+
+        randomNumberGenerator  = cls.__GetRandomNumberGenerator(seed)
+        containment            = PolygonContainment(fillRegion)
+        grid                   = PointGrid(bounds, minDistance, initialCapacity=2*len(nearby)+1024)
+        grid.InsertExisting(nearby)
+
+        activeList = np.flatnonzero(shapely.dwithin(fillRegion, shapely.points(nearby), margin)).tolist()
+        activeList.extend(grid.InsertFree(containment.RandomPoints(randomNumberGenerator)).tolist())
+
+        cls.__Fill(containment, grid, activeList, minDistance, numSamplesBeforeRejection, randomNumberGenerator)
+
+        return grid.Points[len(nearby):].copy()
+
+
+    @classmethod
+    def __SampleVectorized(
+            cls,
+            polygon:                   shapely.Polygon | shapely.MultiPolygon,
+            minDistance:               float,
+            minDistanceFromEdge:       float,
+            numSamplesBeforeRejection: int,
+            randomNumberGenerator:     np.random.Generator,
+            distanceFunction:          Callable                       = None,
+            minDistanceRange:          tuple                          = None
+        ):
+        # The containment test is built once.  It shrinks the polygon by the distance from the edge, so one test
+        # replaces both the containment and the distance to edge checks.
+        containment = PolygonContainment(polygon, minDistanceFromEdge)
+
+        # Start from a point in every part of the region.
+        seedPoints  = containment.RandomPoints(randomNumberGenerator)
+
+        if distanceFunction is None:
+            grid       = PointGrid(polygon.bounds, minDistance)
+            activeList = grid.InsertFree(seedPoints).tolist()
+        else:
+            grid       = MultiResolutionPointGrid(polygon.bounds, minDistanceRange)
+            activeList = grid.InsertFree(seedPoints, distanceFunction(seedPoints[:, 0], seedPoints[:, 1])).tolist()
+
+        cls.__Fill(containment, grid, activeList, minDistance, numSamplesBeforeRejection, randomNumberGenerator, distanceFunction)
+
+        return grid.Points.copy()
+
+
+    @classmethod
+    def __Fill(
+            cls,
+            containment:               PolygonContainment,
+            grid:                      PointGrid | MultiResolutionPointGrid,
+            activeList:                list,
+            minDistance:               float,
+            numSamplesBeforeRejection: int,
+            randomNumberGenerator:     np.random.Generator,
+            distanceFunction:          Callable                       = None
+        ):
+        """
+        Generates new points around the active points until no active points remain.
+
+        The active list holds indices into the points stored by the grid.  A point is removed by swapping it with the
+        last entry and popping, so removal does not require a search.
+
+        With a variable minimum distance, the candidates are generated using the minimum distance of the active point
+        and each candidate is checked using its own minimum distance.
+        """
+        while activeList:
+            position             = randomNumberGenerator.integers(len(activeList))
+            currentIndex         = activeList[position]
+            activeList[position] = activeList[-1]
+            activeList.pop()
+
+            radius       = minDistance if distanceFunction is None else grid.Radii[currentIndex]
+            candidates   = cls.__GetCandidates(grid.Points[currentIndex], radius, numSamplesBeforeRejection, randomNumberGenerator)
+            candidates   = candidates[containment.Contains(candidates[:, 0], candidates[:, 1])]
+
+            if distanceFunction is None:
+                activeList.extend(grid.InsertFree(candidates).tolist())
+            else:
+                activeList.extend(grid.InsertFree(candidates, distanceFunction(candidates[:, 0], candidates[:, 1])).tolist())
+
+
+    @classmethod
+    def __CreateDistanceFunction(cls, minDistance:Callable|np.ndarray, minDistanceRange:tuple, bounds:tuple) -> tuple[Callable, tuple]:
+        """
+        Creates a function that returns the local minimum distance from a callable or a raster.  The function clips the
+        values to the range of minimum distances.
+        """
+        if callable(minDistance):
+            if minDistanceRange is None:
+                raise Exception("The 'minDistanceRange' must be provided when 'minDistance' is a function.")
+            rMin, rMax = minDistanceRange
+            return (lambda x, y : np.clip(np.broadcast_to(minDistance(x, y), np.shape(x)), rMin, rMax)), (rMin, rMax)
+
+        raster = np.asarray(minDistance, dtype=float)
+        if raster.ndim != 2:
+            raise Exception("A minimum distance raster must be a two dimensional array.")
+
+        minX, minY, maxX, maxY = bounds
+        width, height          = raster.shape
+
+        def RasterLookUp(x, y):
+            xIndices = np.clip(((np.asarray(x) - minX) / (maxX - minX) * width).astype(int),  0, width-1)
+            yIndices = np.clip(((np.asarray(y) - minY) / (maxY - minY) * height).astype(int), 0, height-1)
+            return raster[xIndices, yIndices]
+
+        return RasterLookUp, (raster.min(), raster.max())
+
+
+    @classmethod
+    def __GetRandomNumberGenerator(cls, seed:int|np.random.Generator) -> np.random.Generator:
+        """
+        Creates a NumPy random number generator.  Without a seed, it is seeded from the "random" module so that
+        "random.seed" controls the output.
+        """
+        if seed is None:
+            seed = random.getrandbits(64)
+        return np.random.default_rng(seed)
+
+
+    @classmethod
+    def __GetSeedSequence(cls, seed:int|np.random.Generator) -> np.random.SeedSequence:
+        """
+        Creates a seed sequence that independent seeds can be spawned from.
+        """
+        if isinstance(seed, np.random.Generator):
+            seed = seed.integers(2**63)
+        elif seed is None:
+            seed = random.getrandbits(64)
+        return np.random.SeedSequence(seed)
+
+
+    @classmethod
+    def __GetCandidates(cls, point:np.ndarray, minDistance:float, numberOfCandidates:int, randomNumberGenerator:np.random.Generator) -> np.ndarray:
+        """
+        Generates candidates in the annulus between minDistance and 2*minDistance around a point.
+        """
+        angles = randomNumberGenerator.uniform(0, 2*np.pi, numberOfCandidates)
+        radii  = randomNumberGenerator.uniform(minDistance, 2*minDistance, numberOfCandidates)
+        return point + np.column_stack((radii*np.cos(angles), radii*np.sin(angles)))
@@ -0,0 +1,202 @@
+"""
+Created on October 18, 2026
+@author: Lance A. Endres
+"""
+import numpy            as np
+import shapely
+
+
+class PolygonContainment():
+    """
+    Accelerates repeated point in polygon tests against the same polygon.
+
+    The test region is the polygon shrunk inward by the minimum distance from the edge (polygon.buffer(-distance)).
+    Therefore, a single containment test replaces both the containment test and the distance to edge test.
+
+    The region is covered by a coarse raster where each cell is classified as fully inside, fully outside, or on
+    the boundary.  Points in inside and outside cells are answered from the raster and only points that land in
+    boundary cells are passed to the exact (prepared) geometry test.
+
+    The buffer approximates the rounded offset around concave corners with straight segments.  The segments lie
+    slightly inside of the exact offset, so a point next to a concave corner can be closer to the edge than the
+    requested distance by up to distance*(1-cos(pi/(4*quadrantSegments))).
+    """
+    OUTSIDE  = 0
+    INSIDE   = 1
+    BOUNDARY = 2
+
+
+    def __init__(self, polygon:shapely.Polygon, minDistanceFromEdge:float=0, cellSize:float=None, maxCells:int=256, quadrantSegments:int=16):
+        """
+        Constructor.
+
+        Parameters
+        ----------
+        polygon : shapely.Polygon
+            The polygon to test points against.
+        minDistanceFromEdge : float, optional
+            The minimum distance a point must be from the edge of the polygon to be considered inside. The default is 0.
+        cellSize : float, optional
+            The size of the raster cells.  If None, the size is chosen so the raster has at most "maxCells" cells on a
+            side. The default is None.
+        maxCells : int, optional
+            The maximum number of raster cells on a side when "cellSize" is not specified. The default is 256.
+        quadrantSegments : int, optional
+            The number of segments used to approximate a quarter circle in the buffer. The default is 16.
+
+        Returns
+        -------
+        None.
+        """
+        self.region = PolygonContainment.ShrinkPolygon(polygon, minDistanceFromEdge, quadrantSegments)
+
+        # Preparing builds the spatial index used by the predicates once instead of on every call.
+        shapely.prepare(self.region)
+
+        self.minX, self.minY, maxX, maxY = polygon.bounds
+        if cellSize is None:
+            cellSize = max(maxX - self.minX, maxY - self.minY) / maxCells
+        self.cellSize = cellSize if cellSize > 0 else 1.0
+
+        self.width    = max(int(np.ceil((maxX - self.minX) / self.cellSize)), 1)
+        self.height   = max(int(np.ceil((maxY - self.minY) / self.cellSize)), 1)
+        self.raster   = self.__CreateRaster()
+
+
+    @classmethod
+    def ShrinkPolygon(cls, polygon:shapely.Geometry, minDistanceFromEdge:float, quadrantSegments:int=16) -> shapely.Geometry:
+        """
+        Shrinks a polygon inward so that every point in the result is at least the specified distance from the edges
+        (including the edges of holes) of the original polygon.
+
+        Parameters
+        ----------
+        polygon : shapely.Geometry
+            The polygon or multi-polygon.
+        minDistanceFromEdge : float
+            The distance to shrink the polygon by.
+        quadrantSegments : int, optional
+            The number of segments used to approximate a quarter circle in the buffer. The default is 16.
+
+        Returns
+        -------
+        : shapely.Geometry
+            The shrunk polygon.  It can be empty or have more parts than the original.
+        """
+        if minDistanceFromEdge > 0:
+            return polygon.buffer(-minDistanceFromEdge, quad_segs=quadrantSegments)
+        return polygon
+
+
+    @property
+    def Region(self):
+        """
+        Gets the region (polygon shrunk by the distance from the edge) that points are tested against.
+
+        Returns
+        -------
+        shapely.Geometry
+        """
+        return self.region
+
+
+    @property
+    def IsEmpty(self):
+        """
+        Gets if the region is empty.  The region is empty if no point is far enough away from the edge.
+
+        Returns
+        -------
+        bool
+        """
+        return self.region.is_empty
+
+
+    def __CreateRaster(self) -> np.ndarray:
+        """
+        Classifies every raster cell as inside, outside, or on the boundary of the region.
+        """
+        xIndices, yIndices = np.meshgrid(np.arange(self.width), np.arange(self.height), indexing="ij")
+        x0     = self.minX + xIndices.ravel()*self.cellSize
+        y0     = self.minY + yIndices.ravel()*self.cellSize
+        boxes  = shapely.box(x0, y0, x0+self.cellSize, y0+self.cellSize)
+
+        raster = np.full(boxes.shape, PolygonContainment.BOUNDARY, dtype=np.uint8)
+        raster[shapely.contains_properly(self.region, boxes)] = PolygonContainment.INSIDE
+        raster[~shapely.intersects(self.region, boxes)]       = PolygonContainment.OUTSIDE
+
+        return raster.reshape(self.width, self.height)
+
+
+    def Contains(self, x:np.ndarray, y:np.ndarray) -> np.ndarray:
+        """
+        Tests if points are inside of the region.
+
+        Parameters
+        ----------
+        x : np.ndarray
+            The x coordinates of the points.
+        y : np.ndarray
+            The y coordinates of the points.
+
+        Returns
+        -------
+        : np.ndarray
+            A boolean array that is True where the point is inside of the region.
+        """
+        x        = np.asarray(x, dtype=float)
+        y        = np.asarray(y, dtype=float)
+        xIndices = np.floor((x - self.minX) / self.cellSize).astype(int)
+        yIndices = np.floor((y - self.minY) / self.cellSize).astype(int)
+        valid    = (xIndices >= 0) & (xIndices < self.width) & (yIndices >= 0) & (yIndices < self.height)
+
+        status        = np.full(x.shape, PolygonContainment.OUTSIDE, dtype=np.uint8)
+        status[valid] = self.raster[xIndices[valid], yIndices[valid]]
+
+        # Only the points in the boundary cells need the exact test.
+        result   = status == PolygonContainment.INSIDE
+        boundary = np.flatnonzero(status == PolygonContainment.BOUNDARY)
+        if len(boundary) > 0:
+            result[boundary] = shapely.contains_xy(self.region, x[boundary], y[boundary])
+
+        return result
+
+
+    def RandomPoints(self, randomNumberGenerator:np.random.Generator, batchSize:int=64, maxBatches:int=100) -> np.ndarray:
+        """
+        Gets one random point inside of each part of the region.
+
+        Shrinking or clipping a polygon can split it into several parts.  An algorithm that grows outward from a
+        starting point needs a starting point in every part to cover the whole region.
+
+        Points are drawn uniformly over the bounds of each part until one lands inside.  Parts where no point is
+        found after "maxBatches" attempts (slivers with almost no area) are skipped.
+
+        Parameters
+        ----------
+        randomNumberGenerator : np.random.Generator
+            The random number generator.
+        batchSize : int, optional
+            The number of points drawn at a time. The default is 64.
+        maxBatches : int, optional
+            The maximum number of batches drawn for each part. The default is 100.
+
+        Returns
+        -------
+        points : np.ndarray
+            The points as an array of shape (n, 2), where n is less than or equal to the number of parts.
+        """
+        if self.IsEmpty:
+            raise Exception("The region is empty.  No point is far enough away from the edge of the polygon.")
+
+        points = []
+        for part in shapely.get_parts(self.region):
+            minX, minY, maxX, maxY = part.bounds
+            for _ in range(maxBatches):
+                candidates = randomNumberGenerator.uniform((minX, minY), (maxX, maxY), size=(batchSize, 2))
+                inside     = np.flatnonzero(shapely.contains_xy(part, candidates[:, 0], candidates[:, 1]))
+                if len(inside) > 0:
+                    points.append(candidates[inside[0]])
+                    break
+
+        return np.array(points).reshape(-1, 2)
@@ -3,6 +3,9 @@ Created on February 16, 2022
 @author: Lance A. Endres
 """
 import numpy                                     as np
+import pandas                                    as pd
+
+from   lendres.algorithms.InvertedIndex          import InvertedIndex
 
 class Search():
     """
@@ -75,11 +78,62 @@ class Search():
             return [points[first], points[last]]
 
 
+    @classmethod
+    def BoundingBinarySearchMany(cls, items, points, returnedUnits="indices"):
+        """
+        Finds the bounding values for many items in a list of points at once.
+
+        This is the vectorized version of BoundingBinarySearch.  All the items are searched for in a single
+        call to numpy.searchsorted, so it is much faster than calling BoundingBinarySearch in a loop.
+
+        Parameters
+        ----------
+        items : array like of int or float
+            Items to bound.
+        points : array like of int or float
+            A list of points to search through.  The points must be sorted in ascending order.
+        returnedUnits : string, optional
+            Specifies the context of the returned values. The default is "indices".
+                indices : Returns the indices of the "points" list.
+                values : Returns the bounding values, that is values = points[indices].
+
+        Returns
+        -------
+        : numpy.ndarray
+            An array of shape (len(items), 2) that has either the indices or the values that bound each
+            of the items.  If an item is in "points," the row contains two entries that are the same (the
+            index/value).  If "points" contains the item more than once, the first occurrence is used.
+
+            If an item is out of the range of the points, the row is [np.nan, np.nan].  Because of this, the
+            array is a float array even when indices are returned.
+        """
+        points  = np.asarray(points)
+        items   = np.atleast_1d(np.asarray(items))
+
+        upper   = np.searchsorted(points, items, side="left")
+        inRange = (items >= points[0]) & (items <= points[-1])
+
+        # Items that are in the points are bounded by themselves, all others by the point before and the point after.
+        exact   = inRange & (points[np.clip(upper, 0, len(points)-1)] == items)
+        lower   = np.where(exact, upper, upper-1)
+
+        result           = np.column_stack((lower, upper)).astype(float)
+        result[~inRange] = np.nan
+
+        if returnedUnits == "values":
+            result[inRange] = points[result[inRange].astype(int)]
+
+        return result
+
+
     @classmethod
     def FindIndicesByValues(cls, data, searchValue, maxCount=None):
         """
         Searches an array like object to find the indices of entries that match a specified value.
 
+        The data is compared in NumPy.  When a maximum count is supplied, the data is scanned in chunks of growing size
+        so the search stops shortly after the maximum count is reached instead of comparing all of the data.
+
         Parameters
         ----------
         data : array like
@@ -89,28 +143,110 @@ class Search():
         maxCount : integer
             The maximum number of entries to returned.  If maxCount is reached before the end of the data,
             the function exits and returns the found values.  This allows returning 10 items even though 100
-            are in the data, for example.
+            are in the data, for example.  If None or less than one, all the matches are returned.
         Returns
         -------
         indices : list of integers
             The indices of all matched values.
         """
-        # If no maximum was provided, we can return up to the total number.  We do it this way so we do not
-        # have to check every time in the loop if maxCount is none and then check the value of maxCount if
-        # it is not none.
-        if maxCount == None:
-            maxCount = len(data)
+        values = cls.__ToArray(data)
+
+        if maxCount == None or maxCount < 1:
+            return np.flatnonzero(cls.__Equals(values, searchValue)).tolist()
+
+        indices   = []
+        start     = 0
+        chunkSize = max(1024, 8*maxCount)
+
+        while start < len(values) and len(indices) < maxCount:
+            stop       = min(start+chunkSize, len(values))
+            indices.extend((np.flatnonzero(cls.__Equals(values[start:stop], searchValue)) + start).tolist())
+            start      = stop
+            chunkSize *= 2
+
+        return indices[:maxCount]
+
+
+    @classmethod
+    def FindIndicesByManyValues(cls, data, searchValues, maxCount=None):
+        """
+        Searches an array like object to find the indices of entries that match each of several values.
+
+        The data is only passed over once (a hash look up of every entry), no matter how many values are searched for.
+
+        Parameters
+        ----------
+        data : array like
+            Data to search through.
+        searchValues : array like of string, numeric
+            Values to match in the data.
+        maxCount : integer
+            The maximum number of entries to returned for each value.  If None or less than one, all of them are
+            returned.  The default is None.
+
+        Returns
+        -------
+        indices : dictionary
+            The keys are the search values and the values are lists of the indices of the entries that match it.
+        """
+        values       = cls.__ToArray(data)
+        searchValues = pd.unique(pd.Series(searchValues, dtype=object))
+
+        # Position of each entry in the search values, -1 if it is not one of them.
+        codes        = pd.Index(searchValues).get_indexer(values)
+        matches      = np.flatnonzero(codes >= 0)
+
+        # A stable sort groups the matches by search value and keeps the indices of each group in order.
+        matches      = matches[np.argsort(codes[matches], kind="stable")]
+        counts       = np.bincount(codes[matches], minlength=len(searchValues))
+        groups       = np.split(matches, np.cumsum(counts)[:-1])
+
+        if maxCount is not None and maxCount < 1:
+            maxCount = None
 
-        foundCount  = 0
-        indices     = []
+        return {searchValue : group[:maxCount].tolist() for searchValue, group in zip(searchValues, groups)}
 
-        for i, value in enumerate(data):
-            if value == searchValue:
-                indices.append(i)
-                foundCount += 1
 
-                # If we reach the maximum number of entries, exit loop and return.
-                if foundCount == maxCount:
-                    break
+    @classmethod
+    def CreateInvertedIndex(cls, data):
+        """
+        Creates an index from each value in the data to the indices of the entries that have that value.
 
-        return indices
\ No newline at end of file
+        Use this instead of FindIndicesByValues when the same data is searched for many different values.  The data is
+        scanned once when the index is built and every look up after that is a dictionary access.
+
+        Parameters
+        ----------
+        data : array like
+            Data to index.
+
+        Returns
+        -------
+        : InvertedIndex
+            The index.  Call InvertedIndex.GetIndices to look up a value.
+        """
+        return InvertedIndex(data)
+
+
+    @classmethod
+    def __ToArray(cls, data):
+        """
+        Converts array like data to a NumPy array.  Lists go through pandas so that lists of mixed types become object
+        arrays instead of being converted to strings.
+        """
+        if isinstance(data, np.ndarray):
+            return data
+        if isinstance(data, (pd.Series, pd.Index)):
+            return data.to_numpy()
+        return pd.Series(data, dtype=object if len(data) == 0 else None).to_numpy()
+
+
+    @classmethod
+    def __Equals(cls, values, searchValue):
+        """
+        Element wise comparison that always returns an array, even when the types cannot be compared.
+        """
+        matches = values == searchValue
+        if np.ndim(matches) == 0:
+            matches = np.full(len(values), bool(matches))
+        return matches
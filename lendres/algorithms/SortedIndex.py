@@ -0,0 +1,179 @@
+"""
+Created on October 18, 2026
+@author: Lance A. Endres
+"""
+import numpy                                     as np
+
+from   lendres.algorithms.Search                 import Search
+
+
+class SortedIndex():
+    """
+    A search index built once from sorted values (for example, the time column of a data set).
+
+    The values are copied into a contiguous NumPy array and checked for being sorted when the index is created, so
+    the queries do not have to convert or check anything.  Every query is a binary search (numpy.searchsorted) and
+    accepts either a single item or an array of items.
+
+    Queries that cannot be answered (for example, an item that is out of range) return NaN.  Because of this, the
+    indices are returned as floats.  A single item returns a scalar (or a length two array for Bound) and an array of
+    items returns an array.
+    """
+
+
+    def __init__(self, values):
+        """
+        Constructor.
+
+        Parameters
+        ----------
+        values : array like
+            The values to index.  They must be sorted in ascending order.
+
+        Returns
+        -------
+        None.
+        """
+        self.values = np.ascontiguousarray(np.asarray(values, dtype=float))
+
+        if self.values.ndim != 1 or len(self.values) == 0:
+            raise Exception("The values must be a one dimensional array that is not empty.")
+
+        if np.any(self.values[1:] < self.values[:-1]):
+            raise Exception("The values must be sorted in ascending order.")
+
+
+    def __len__(self):
+        return len(self.values)
+
+
+    @property
+    def Values(self) -> np.ndarray:
+        """
+        Gets the indexed values.
+
+        Returns
+        -------
+        np.ndarray
+        """
+        return self.values
+
+
+    def Bound(self, items, returnedUnits="indices"):
+        """
+        Finds the indices or values that bound the items.  See Search.BoundingBinarySearchMany.
+
+        Parameters
+        ----------
+        items : int, float, or array like
+            Items to bound.
+        returnedUnits : string, optional
+            Specifies the context of the returned values. The default is "indices".
+                indices : Returns the indices of the values.
+                values : Returns the bounding values.
+
+        Returns
+        -------
+        : numpy.ndarray
+            The bounds of the items with shape (2,) for a single item or (n, 2) for an array of items.
+        """
+        result = Search.BoundingBinarySearchMany(items, self.values, returnedUnits)
+        return result[0] if np.ndim(items) == 0 else result
+
+
+    def Floor(self, items):
+        """
+        Finds the index of the largest value that is less than or equal to each item.
+
+        Parameters
+        ----------
+        items : int, float, or array like
+            Items to search for.
+
+        Returns
+        -------
+        : float or numpy.ndarray
+            The indices.  NaN is returned for items that are less than the first value.
+        """
+        itemsArray = np.atleast_1d(np.asarray(items, dtype=float))
+        indices    = (np.searchsorted(self.values, itemsArray, side="right") - 1).astype(float)
+        indices[(indices < 0) | np.isnan(itemsArray)] = np.nan
+        return self.__Format(items, indices)
+
+
+    def Ceiling(self, items):
+        """
+        Finds the index of the smallest value that is greater than or equal to each item.
+
+        Parameters
+        ----------
+        items : int, float, or array like
+            Items to search for.
+
+        Returns
+        -------
+        : float or numpy.ndarray
+            The indices.  NaN is returned for items that are greater than the last value.
+        """
+        itemsArray = np.atleast_1d(np.asarray(items, dtype=float))
+        indices    = np.searchsorted(self.values, itemsArray, side="left").astype(float)
+        indices[(indices == len(self.values)) | np.isnan(itemsArray)] = np.nan
+        return self.__Format(items, indices)
+
+
+    def Nearest(self, items):
+        """
+        Finds the index of the value closest to each item.  Items out of range return the first or last index.  If
+        an item is exactly between two values, the lower index is returned.
+
+        Parameters
+        ----------
+        items : int, float, or array like
+            Items to search for.
+
+        Returns
+        -------
+        : float or numpy.ndarray
+            The indices.  NaN is returned for items that are NaN.
+        """
+        itemsArray = np.atleast_1d(np.asarray(items, dtype=float))
+        upper      = np.clip(np.searchsorted(self.values, itemsArray, side="left"), 1, len(self.values)-1)
+        lower      = upper - 1
+
+        # A single value has nothing to choose between.
+        if len(self.values) == 1:
+            upper = lower = np.zeros(len(itemsArray), dtype=int)
+
+        useUpper   = (self.values[upper] - itemsArray) < (itemsArray - self.values[lower])
+        indices    = np.where(useUpper, upper, lower).astype(float)
+        indices[np.isnan(itemsArray)] = np.nan
+        return self.__Format(items, indices)
+
+
+    def Range(self, start:float, stop:float) -> slice:
+        """
+        Finds the indices of the values that are in the closed interval [start, stop].
+
+        Parameters
+        ----------
+        start : float
+            The start of the interval.
+        stop : float
+            The end of the interval.
+
+        Returns
+        -------
+        : slice
+            A slice that selects the values in the interval, e.g., data.iloc[sortedIndex.Range(1.0, 2.0)].  It is
+            empty if no values are in the interval.
+        """
+        first = int(np.searchsorted(self.values, start, side="left"))
+        last  = int(np.searchsorted(self.values, stop, side="right"))
+        return slice(first, max(first, last))
+
+
+    def __Format(self, items, indices:np.ndarray):
+        """
+        Returns a scalar for a single item and an array for an array of items.
+        """
+        return indices[0] if np.ndim(items) == 0 else indices
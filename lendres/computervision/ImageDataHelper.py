@@ -11,7 +11,7 @@ from   lendres.io.ConsoleHelper                                      import Cons
 from   lendres.TensorFlowDataHelper                                  import TensorFlowDataHelper
 from   lendres.plotting.PlotHelper                                   import PlotHelper
 from   lendres.UnivariateAnalysis                                    import UnivariateAnalysis
-from   lendres.Algorithms                                            import FindIndicesByValues
+from   lendres.algorithms.Search                                     import Search
 from   lendres.ImageHelper                                           import ImageHelper
 from   lendres.TensorFlowDataHelperFunctions                         import TensorFlowDataHelperFunctions
 
@@ -54,6 +54,9 @@ class ImageDataHelper(TensorFlowDataHelper):
 
         self.colorConversion         = None
 
+        # Indices of the entries of each category, created when first needed.  See GetLabelIndex.
+        self.labelIndices            = {}
+
 
     def CopyFrom(self, dataHelper):
         """
@@ -75,6 +78,7 @@ class ImageDataHelper(TensorFlowDataHelper):
         self.numberOfLabelCategories = dataHelper.numberOfLabelCategories
 
         self.colorConversion         = dataHelper.colorConversion
+        self.labelIndices            = {}
 
 
     def LoadImagesFromNumpyArray(self, inputFile):
@@ -114,6 +118,7 @@ class ImageDataHelper(TensorFlowDataHelper):
 
         uniqueLabels = self.labels["Names"].unique().categories.tolist()
         self.SetLabelCategories(uniqueLabels)
+        self.InvalidateLabelIndices()
 
 
     def LoadLabelNumbersFromCsv(self, inputFile, labelCategories):
@@ -138,6 +143,7 @@ class ImageDataHelper(TensorFlowDataHelper):
 
         self.labels["Names"] = labels
         self.labels["Names"] = self.labels["Names"].astype("category")
+        self.InvalidateLabelIndices()
 
 
     def SetLabelCategories(self, labelCategories):
@@ -214,6 +220,45 @@ class ImageDataHelper(TensorFlowDataHelper):
         return xData, yData
 
 
+    def GetLabelIndex(self, dataSet="original"):
+        """
+        Gets the index of the label numbers of a data set.  The index returns the positions of all the entries
+        of a category without searching the labels again.
+
+        The index is created the first time it is requested and reused after that.
+
+        Parameters
+        ----------
+        dataSet : string
+            The data set.  See GetDataSet.
+
+        Returns
+        -------
+        : InvertedIndex
+            The index of the label numbers.
+        """
+        xData, yData = self.GetDataSet(dataSet)
+        labelIndex   = self.labelIndices.get(dataSet)
+
+        # Rebuilding is also required if labels were added or removed.
+        if labelIndex is None or len(labelIndex) != len(yData):
+            labelIndex                 = Search.CreateInvertedIndex(yData)
+            self.labelIndices[dataSet] = labelIndex
+
+        return labelIndex
+
+
+    def InvalidateLabelIndices(self):
+        """
+        Clears the indices of the label numbers.  Required if the labels are modified in place.
+
+        Returns
+        -------
+        None.
+        """
+        self.labelIndices.clear()
+
+
     def PlotImage(self, index=None, random=False, size=6):
         """
         Plot example image.
@@ -306,7 +351,7 @@ class ImageDataHelper(TensorFlowDataHelper):
         """
         # If a name was provided, convert it to a number.  Searching by number is faster.
         if categoryName != None:
-            categoryNumber = FindIndicesByValues(self.labelCategories, searchValue=categoryName, maxCount=1)
+            categoryNumber = Search.FindIndicesByValues(self.labelCategories, searchValue=categoryName, maxCount=1)
             # The find indices function returns an array, we only want one entry.
             categoryNumber = categoryNumber[0]
 
@@ -314,8 +359,7 @@ class ImageDataHelper(TensorFlowDataHelper):
         if categoryNumber == None:
             raise Exception("A valid category name or a valid category number must be provided.")
 
-        xData, yData = self.GetDataSet(dataSet)
-        indices      = FindIndicesByValues(yData, categoryNumber, numberOfExamples)
+        indices      = self.GetLabelIndex(dataSet).GetIndices(categoryNumber, numberOfExamples).tolist()
 
         if len(indices) == 0:
             categoryName = self.labelCategories[categoryNumber]
@@ -619,6 +663,7 @@ class ImageDataHelper(TensorFlowDataHelper):
         y = self.labels["Numbers"]
 
         self._SplitData(x, y, testSize, validationSize, stratify)
+        self.InvalidateLabelIndices()
 
 
     def GetSplitComparisons(self, format="countandpercentstring"):
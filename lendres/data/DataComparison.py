@@ -3,10 +3,19 @@ Created on July 20, 2023
 @author: Lance A. Endres
 """
 import pandas                                                        as pd
+import numpy                                                         as np
 import matplotlib.pyplot                                             as plt
 import os
+import time
+import functools
+from   typing                                                        import Callable
+from   concurrent.futures                                            import ThreadPoolExecutor
+from   concurrent.futures                                            import ProcessPoolExecutor
 
-from   lendres.algorithms.Search                                     import Search
+from   lendres.algorithms.SortedIndex                                import SortedIndex
+from   lendres.io.ColumnarCache                                      import ColumnarCache
+from   lendres.data.LazyDataSet                                      import LazyDataSet
+from   lendres.signalprocessing.Decimation                           import Decimation
 from   lendres.plotting.PlotHelper                                   import PlotHelper
 from   lendres.plotting.AxesHelper                                   import AxesHelper
 from   lendres.plotting.PlotMaker                                    import PlotMaker
@@ -22,7 +31,7 @@ class DataComparison():
     might be sampled at 0.1 seconds.
     """
 
-    def __init__(self, independentColumn:str, directory:str=None):
+    def __init__(self, independentColumn:str, directory:str=None, cacheDirectory:str=None):
         """
         Constructor.
 
@@ -33,6 +42,9 @@ class DataComparison():
         directory : str, optional
             The directory to load the data files from. The default is None.  If none is supplied,
             the complete path must be specified when loading files.
+        cacheDirectory : str, optional
+            A directory to cache the parsed files in.  If supplied, a file that has not changed since it was last loaded
+            is read (memory mapped) from the cache instead of being parsed again.  See ColumnarCache. The default is None.
 
         Returns
         -------
@@ -40,10 +52,18 @@ class DataComparison():
         """
         self.independentColumn  = independentColumn
         self.directory          = directory
+        self.cache              = None if cacheDirectory is None else ColumnarCache(cacheDirectory)
 
         self.dataSets           = []
         self.dataSetNames       = []
 
+        # Search indices of the independent column, created when first needed.  See GetSortedIndex.
+        self.sortedIndices      = {}
+
+        # The cache entries of the data sets loaded into memory through the cache, as (data set, path, read arguments,
+        # columns, shape) by data set index.  See ApplyParallel.
+        self.cacheSources       = {}
+
 
     @property
     def NumberOfDataSets(self):
@@ -57,7 +77,7 @@ class DataComparison():
         return len(self.dataSets)
 
 
-    def LoadFile(self, file:str, name:str):
+    def LoadFile(self, file:str, name:str, **kwargs):
         """
         Loads a data set from file.
 
@@ -68,23 +88,179 @@ class DataComparison():
             just the file name (with extension).  Otherwise, it must be the complete path.
         name : str
             The name to give to the data set.
+        **kwargs : keyword arguments
+            Keyword arguments passed to pandas.read_csv.
 
         Returns
         -------
         None.
         """
-        dataFrame       = self.ValidateFile(file)
+        dataFrame       = self.ValidateFile(file, **kwargs)
         self.AddDataSet(dataFrame, name)
+        self.__AddCacheSource(self.GetPath(file), kwargs)
+
+
+    def LoadLazyFile(self, file:str, name:str, chunkSize:int=1000000, **kwargs):
+        """
+        Adds a data set from file that is read from disk as it is needed instead of being loaded into memory.
+
+        The file is parsed into the cache in chunks the first time (a cache directory must be supplied at construction),
+        so it never has to fit in memory.  After that, the data set is memory mapped from the cache.  Use GetWindow, or the "xLimits" of the plots, to read only
+        the part of the data that is of interest.  See LazyDataSet.
+
+        Parameters
+        ----------
+        file : str
+            Path to the file to load.  See LoadFile.
+        name : str
+            The name to give to the data set.
+        chunkSize : int, optional
+            The number of rows parsed at a time when the file is cached.  See ColumnarCache.SaveCsv. The default is 1000000.
+        **kwargs : keyword arguments
+            Keyword arguments passed to pandas.read_csv.
+
+        Returns
+        -------
+        None.
+        """
+        if self.cache is None:
+            raise Exception("A cache directory must be supplied to load a lazy data set.")
+
+        path = self.GetPath(file)
+        if not self.cache.Contains(path, **kwargs):
+            self.cache.SaveCsv(path, chunkSize, **kwargs)
+
+        self.AddDataSet(LazyDataSet.FromCache(self.cache, path, self.independentColumn, **kwargs), name)
+
+
+    def LoadFiles(
+            self,
+            files:        list,
+            names:        list              = None,
+            usecols:      list              = None,
+            dtype:        dict              = None,
+            engine:       str               = None,
+            executorType: str               = "thread",
+            maxWorkers:   int               = None,
+            **kwargs
+        ) -> pd.DataFrame:
+        """
+        Loads several data sets from file at the same time.
+
+        The files are read concurrently in a pool.  Only the columns that are needed should be read ("usecols") and,
+        where possible, given compact types ("dtype") so that large files do not use more memory than required.
+
+        Parameters
+        ----------
+        files : list
+            The files to load.  See LoadFile.
+        names : list, optional
+            The names to give to the data sets.  If None, the file names (without extensions) are used. The default is None.
+        usecols : list | Callable, optional
+            The columns to read as a list of names or a function that takes a column name and returns True if the column
+            is read (see pandas.read_csv).  The independent column is always read.  If None, all the columns are read.
+            Files read with a function are not cached (see ColumnarCache.CanCache). The default is None.
+        dtype : dict, optional
+            The types of the columns.  See pandas.read_csv. The default is None.
+        engine : str, optional
+            The CSV parser used by pandas.read_csv.  "pyarrow" is multithreaded and much faster for large files, but
+            requires the pyarrow package. The default is None.
+        executorType : str, optional
+            How the files are read in parallel.
+                thread  : A pool of threads.  The data is not copied, but the default pandas parser holds the GIL for part of the read.
+                process : A pool of processes.  Each data set is copied back from the process that read it.
+            The default is "thread".
+        maxWorkers : int, optional
+            The number of threads or processes.  If None, the number of processors is used.  If 1, the files are read
+            one after the other without a pool. The default is None.
+        **kwargs : keyword arguments
+            Other keyword arguments passed to pandas.read_csv.
 
+        Returns
+        -------
+        : pandas.DataFrame
+            The load statistics with one row per file and the columns "Name," "File," "Rows," "Columns," "Memory (MB),"
+            and "Time (s)."  The times are measured in the worker, so when the files are read concurrently they overlap.
+        """
+        if names is None:
+            names = [os.path.splitext(os.path.basename(file))[0] for file in files]
+
+        if len(names) != len(files):
+            raise Exception("The number of names must equal the number of files.")
+
+        # Functions cannot be used to find a cache entry, so files read with one are always parsed.
+        cache     = None if callable(usecols) else self.cache
+        arguments = dict(kwargs)
+        if callable(usecols):
+            arguments["usecols"] = functools.partial(self._UseColumn, self.independentColumn, usecols)
+        elif usecols is not None:
+            usecols = list(usecols)
+            if self.independentColumn not in usecols:
+                usecols.insert(0, self.independentColumn)
+            arguments["usecols"] = usecols
+        if dtype is not None:
+            arguments["dtype"] = dtype
+        if engine is not None:
+            arguments["engine"] = engine
+
+        # Check all the files exist before any are read.
+        paths = [self.GetPath(file) for file in files]
+
+        if maxWorkers is None:
+            maxWorkers = os.cpu_count() or 1
 
-    def AddDataSet(self, dataFrame:pd.DataFrame, name:str):
+        if maxWorkers == 1 or len(paths) < 2:
+            results = list(map(self._ReadFile, paths, [arguments]*len(paths), [cache]*len(paths)))
+        else:
+            match executorType:
+                case "thread":
+                    executorClass = ThreadPoolExecutor
+                case "process":
+                    executorClass = ProcessPoolExecutor
+                case _:
+                    raise Exception("The 'executorType' parameter is not valid.")
+
+            with executorClass(max_workers=min(maxWorkers, len(paths))) as executor:
+                results = list(executor.map(self._ReadFile, paths, [arguments]*len(paths), [cache]*len(paths)))
+
+        statistics = []
+        for (dataFrame, seconds), name, path in zip(results, names, paths):
+            self.AddDataSet(dataFrame, name)
+            if cache is not None:
+                self.__AddCacheSource(path, arguments)
+            statistics.append([name, path, dataFrame.shape[0], dataFrame.shape[1], dataFrame.memory_usage(deep=True).sum()/2**20, seconds])
+
+        return pd.DataFrame(statistics, columns=["Name", "File", "Rows", "Columns", "Memory (MB)", "Time (s)"])
+
+
+    @classmethod
+    def _UseColumn(cls, independentColumn:str, usecols:Callable, column:str) -> bool:
+        """
+        Selects the independent column and the columns selected by a "usecols" function.  A class method so that it
+        can be sent to the worker processes.
+        """
+        return column == independentColumn or bool(usecols(column))
+
+
+    @classmethod
+    def _ReadFile(cls, path:str, arguments:dict, cache:ColumnarCache=None) -> tuple[pd.DataFrame, float]:
+        """
+        Reads a file and times the read.  This is the function run by the worker processes, so it must be accessible
+        by name (not private).
+        """
+        start     = time.perf_counter()
+        dataFrame = pd.read_csv(path, **arguments) if cache is None else cache.ReadCsv(path, **arguments)
+        return dataFrame, time.perf_counter() - start
+
+
+    def AddDataSet(self, dataFrame:pd.DataFrame|LazyDataSet, name:str):
         """
         Add a data set from an existing DataFrame.
 
         Parameters
         ----------
-        dataFrame : pd.DataFrame
-            A data set as a pandas.DataFrame.
+        dataFrame : pd.DataFrame | LazyDataSet
+            A data set as a pandas.DataFrame or a LazyDataSet.
         name : str
             The name to give to the data set.
 
@@ -97,7 +273,7 @@ class DataComparison():
         self.dataSetNames.append(name)
 
 
-    def ValidateFile(self, inputFile:str):
+    def ValidateFile(self, inputFile:str, **kwargs):
         """
         Validates that a file exists.  Combines the file path with the directory, if one was supplied.
 
@@ -105,18 +281,40 @@ class DataComparison():
         ----------
         inputFile : str
             File to load.
+        **kwargs : keyword arguments
+            Keyword arguments passed to pandas.read_csv.
 
         Returns
         -------
         : pandas.DataFrame
             The file loaded into a DataFrame.
         """
+        path = self.GetPath(inputFile)
+        if self.cache is not None:
+            return self.cache.ReadCsv(path, **kwargs)
+        return pd.read_csv(path, **kwargs)
+
+
+    def GetPath(self, inputFile:str):
+        """
+        Combines the file path with the directory, if one was supplied, and validates that the file exists.
+
+        Parameters
+        ----------
+        inputFile : str
+            File name or path.
+
+        Returns
+        -------
+        : str
+            The path to the file.
+        """
         path = inputFile
         if self.directory is not None:
             path = os.path.join(self.directory, inputFile)
         if not os.path.exists(path):
             raise Exception("The input file \"" + path + "\" does not exist.")
-        return pd.read_csv(path)
+        return path
 
 
     def GetEndTime(self):
@@ -172,9 +370,154 @@ class DataComparison():
         : int
             The index (or closest index if the time value does not exist) to the specified time.
         """
-        data            = self.dataSets[dataSet]
-        boundingIndices = Search.BoundingBinarySearch(time, data[self.independentColumn])
-        return boundingIndices[0]
+        index = self.GetSortedIndex(dataSet).Bound(time)[0]
+        return index if np.isnan(index) else int(index)
+
+
+    def GetIndices(self, dataSet:int, times):
+        """
+        Gets the indices at the specified values of the independent axis.  The indices are returned from the specified data set.
+
+        This is the vectorized version of GetIndex and should be used when many values are looked up.
+
+        Parameters
+        ----------
+        dataSet : int
+            Index of the data set to get the values from.
+        times : array like
+            Times of interest.
+
+        Returns
+        -------
+        : numpy.ndarray
+            The indices (or closest indices if the time values do not exist) of the specified times.  Times that are out
+            of the range of the data are returned as NaN.
+        """
+        return self.GetSortedIndex(dataSet).Bound(np.atleast_1d(times))[:, 0]
+
+
+    def GetWindow(self, dataSet:int, xLimits:tuple, columns:str|list=None) -> pd.DataFrame:
+        """
+        Gets the rows of a data set where the independent axis is within limits.  For a lazy data set, only these rows
+        are read from disk.
+
+        Parameters
+        ----------
+        dataSet : int
+            Index of the data set to get the rows from.
+        xLimits : tuple
+            The first and last values of the independent axis (inclusive).  Either can be None to not limit that side.
+        columns : str | list, optional
+            The column or columns to get.  The independent column is always included.  If None, all the columns are
+            returned. The default is None.
+
+        Returns
+        -------
+        : pandas.DataFrame
+            The rows in the window.
+        """
+        start = -np.inf if xLimits[0] is None else xLimits[0]
+        stop  = np.inf if xLimits[1] is None else xLimits[1]
+        rows  = self.GetSortedIndex(dataSet).Range(start, stop)
+        data  = self.dataSets[dataSet]
+
+        if isinstance(data, LazyDataSet):
+            return data.GetRows(rows, columns)
+
+        if columns is None:
+            return data.iloc[rows]
+
+        if type(columns) is str:
+            columns = [columns]
+        if self.independentColumn not in columns:
+            columns = [self.independentColumn] + list(columns)
+        return data.iloc[rows][columns]
+
+
+    def GetSortedIndex(self, dataSet:int) -> SortedIndex:
+        """
+        Gets the search index of the independent column of a data set.
+
+        The index is created the first time it is requested and reused after that.  The cached indices are cleared by
+        Apply.  If a data set is modified in any other way, call ClearSortedIndices.
+
+        Parameters
+        ----------
+        dataSet : int
+            Index of the data set.
+
+        Returns
+        -------
+        : SortedIndex
+            The search index.
+        """
+        data        = self.dataSets[dataSet]
+
+        # Lazy data sets keep their own index so the independent column is only read once.
+        if isinstance(data, LazyDataSet):
+            return data.GetSortedIndex()
+
+        sortedIndex = self.sortedIndices.get(dataSet)
+
+        # Rebuilding is also required if rows were added or removed.
+        if sortedIndex is None or len(sortedIndex) != len(data):
+            sortedIndex                 = SortedIndex(data[self.independentColumn])
+            self.sortedIndices[dataSet] = sortedIndex
+
+        return sortedIndex
+
+
+    def ClearSortedIndices(self):
+        """
+        Clears the cached search indices.  Required when the independent column of a data set is modified.
+
+        Returns
+        -------
+        None.
+        """
+        self.sortedIndices.clear()
+        for data in self.dataSets:
+            if isinstance(data, LazyDataSet):
+                data.ClearSortedIndex()
+
+
+    def __AddCacheSource(self, path:str, arguments:dict):
+        """
+        Records the cache entry the last data set was loaded from (if there is a cache).
+        """
+        if self.cache is not None:
+            dataSet = self.dataSets[-1]
+            self.cacheSources[self.NumberOfDataSets-1] = (dataSet, path, arguments, list(dataSet.columns), dataSet.shape)
+
+
+    def __GetCacheSource(self, dataSet:int) -> tuple | None:
+        """
+        Gets the cache entry of a data set as (cache directory, path, read arguments), or None if the data set did not
+        come from the cache, has been replaced or changed shape, or the entry is no longer valid.
+        """
+        source = self.cacheSources.get(dataSet)
+        if source is None:
+            return None
+
+        loaded, path, arguments, columns, shape = source
+        data = self.dataSets[dataSet]
+        if data is not loaded or list(data.columns) != columns or data.shape != shape or not self.cache.Contains(path, **arguments):
+            return None
+
+        return (self.cache.directory, path, arguments)
+
+
+    def ClearCacheSources(self):
+        """
+        Clears the record of which data sets match their cache entries, so all the data sets are copied to the
+        processes of ApplyParallel.  Required before using "useCacheReferences" when the values of a data set loaded
+        through the cache have been modified other than by Apply or ApplyParallel.
+
+        Returns
+        -------
+        None.
+        """
+        self.cacheSources.clear()
 
 
     def Apply(self, function):
@@ -193,6 +536,301 @@ class DataComparison():
         for dataSet in self.dataSets:
              function(dataSet)
 
+        # The function may have changed the independent column and the data sets no longer match the cache.
+        self.ClearSortedIndices()
+        self.ClearCacheSources()
+
+
+    def ApplyParallel(self, function, executorType:str="thread", maxWorkers:int=None, useCacheReferences:bool=False) -> list:
+        """
+        Runs a function on every data set concurrently.
+
+        Parameters
+        ----------
+        function : function
+            The function that is applied to each data set.  The function should take a pandas.DataFrame (or LazyDataSet)
+            as the input.  For the "process" executor, the function must be picklable (defined at the top level of a module).
+        executorType : str, optional
+            How the data sets are processed in parallel.
+                thread  : A pool of threads.  The data sets are shared, so the function can modify them in place.  Best
+                          when the function spends its time in NumPy/pandas operations that release the GIL.
+                process : A pool of processes.  Each data set is copied to a process, so modifications are not seen and
+                          the function should return its results instead.  Lazy data sets are always sent as references
+                          to the cache and memory mapped by the process, so their data is not copied.
+            The default is "thread".
+        maxWorkers : int, optional
+            The number of threads or processes.  If None, the number of processors is used.  If 1, the data sets are
+            processed one after the other without a pool. The default is None.
+        useCacheReferences : bool, optional
+            If True, data sets loaded through the cache are also sent to the processes as references to their cache
+            entries instead of being copied.  Only changes to the columns and shape are detected, so the values must
+            not have been modified other than by Apply or ApplyParallel (see ClearCacheSources), otherwise the
+            processes use the values in the cache. The default is False.
+
+        Returns
+        -------
+        : list
+            The values returned by the function, in the order of the data sets.
+        """
+        if maxWorkers is None:
+            maxWorkers = os.cpu_count() or 1
+
+        numberOfDataSets = self.NumberOfDataSets
+        sources          = [None] * numberOfDataSets
+        dataSets         = self.dataSets
+
+        if maxWorkers == 1 or numberOfDataSets < 2:
+            executorClass = None
+        else:
+            match executorType:
+                case "thread":
+                    executorClass = ThreadPoolExecutor
+                case "process":
+                    executorClass = ProcessPoolExecutor
+                    # Data sets in the cache are sent as a reference to their entries instead of being pickled.
+                    if useCacheReferences:
+                        sources   = [self.__GetCacheSource(dataSet) for dataSet in range(numberOfDataSets)]
+                        dataSets  = [None if source is not None else dataSet for dataSet, source in zip(self.dataSets, sources)]
+                case _:
+                    raise Exception("The 'executorType' parameter is not valid.")
+
+        if executorClass is None:
+            results = list(map(self._ApplyToDataSet, [function]*numberOfDataSets, dataSets, self.dataSetNames, sources))
+        else:
+            with executorClass(max_workers=min(maxWorkers, numberOfDataSets)) as executor:
+                results = list(executor.map(self._ApplyToDataSet, [function]*numberOfDataSets, dataSets, self.dataSetNames, sources))
+
+        # The function may have changed the independent column and the data sets no longer match the cache.  The data
+        # sets are not changed by processes.
+        self.ClearSortedIndices()
+        if executorClass is not ProcessPoolExecutor:
+            self.ClearCacheSources()
+        return results
+
+
+    @classmethod
+    def _ApplyToDataSet(cls, function, dataSet:pd.DataFrame|LazyDataSet, name:str, source:tuple=None):
+        """
+        Runs a function on a data set and adds the name of the data set to any error.  If a cache entry (source) is
+        supplied, the data set is loaded from it.  This is the function run by the worker processes, so it must be
+        accessible by name (not private).
+        """
+        if source is not None:
+            directory, path, arguments = source
+            dataSet = ColumnarCache(directory).Load(path, **arguments)
+            if dataSet is None:
+                raise Exception("The data set \"" + name + "\" is no longer in the cache.")
+            dataSet.name = name
+
+        try:
+            return function(dataSet)
+        except Exception as exception:
+            exception.add_note("Raised while applying the function to the data set \"" + name + "\".")
+            raise
+
+
+    def Resample(
+            self,
+            columns:   str | list  = None,
+            grid:      str         = "union",
+            method:    str         = "linear",
+            step:      float       = None,
+            reference: int         = 0,
+            dataSets:  list        = None
+        ) -> pd.DataFrame:
+        """
+        Aligns the data sets onto a common independent axis.
+
+        Every data set is interpolated at all the grid points at once, so this replaces looping over the points and calling
+        GetValue for each one.
+
+        Parameters
+        ----------
+        columns : str | list, optional
+            The name of the column or a list of column names to resample.  If None, all the columns (except the
+            independent column) of the first data set are used. The default is None.
+        grid : str, optional
+            The independent axis values to resample at.
+                union : All the independent axis values of all the data sets.
+                reference : The independent axis values of the "reference" data set.
+                step : Evenly spaced values, "step" apart, from the first to the last independent axis value of all the data sets.
+            The default is "union".
+        method : str, optional
+            The interpolation method.
+                linear : Linear interpolation between the values before and after.
+                nearest : The closest value.  Halfway between two values, the value before is used.
+                previous : The value before (sample and hold).
+            The default is "linear".
+        step : float, optional
+            The spacing of the grid when "grid" is "step." The default is None.
+        reference : int, optional
+            Index of the data set used when "grid" is "reference." The default is 0.
+        dataSets : list, optional
+            The indices of the data sets to resample.  If None, all the data sets are used. The default is None.
+
+        Returns
+        -------
+        : pandas.DataFrame
+            The independent column followed by a column for each data set and column, named "<data set name> <column>."
+            Values outside of the range of a data set are NaN.
+        """
+        dataSets, columns = self.__GetSelection(dataSets, columns)
+        times             = self.__GetGrid(dataSets, grid, step, reference)
+
+        resampled = {self.independentColumn : times}
+        for dataSet in dataSets:
+            values = self.__Interpolate(dataSet, columns, times, method)
+            for i, column in enumerate(columns):
+                resampled[self.dataSetNames[dataSet] + " " + column] = values[:, i]
+
+        return pd.DataFrame(resampled)
+
+
+    def Query(
+            self,
+            times,
+            columns:   str | list  = None,
+            dataSets:  list        = None,
+            method:    str         = "previous",
+            output:    str         = "array"
+        ) -> np.ndarray | pd.DataFrame:
+        """
+        Gets the values of several columns of several data sets at many values of the independent axis.
+
+        This is the vectorized version of GetValue.  Each data set is searched once for all the times and the values of
+        every column are gathered with one indexing operation.
+
+        Parameters
+        ----------
+        times : array like
+            Times (values of the independent axis) of interest.
+        columns : str | list, optional
+            The name of the column or a list of column names.  If None, all the columns (except the independent column)
+            of the first data set are used. The default is None.
+        dataSets : list, optional
+            The indices of the data sets.  If None, all the data sets are used. The default is None.
+        method : str, optional
+            How values between samples are found.  See Resample.  The default, "previous," returns the same values as
+            GetValue. The default is "previous".
+        output : str, optional
+            The format of the values.
+                array : A numpy.ndarray with the shape (data sets, times, columns).
+                dataframe : A tidy pandas.DataFrame with the columns "Data Set," the independent column, "Column," and "Value."
+            The default is "array".
+
+        Returns
+        -------
+        : numpy.ndarray | pandas.DataFrame
+            The values.  Times that are out of the range of a data set are NaN.
+        """
+        dataSets, columns = self.__GetSelection(dataSets, columns)
+        times             = np.atleast_1d(np.asarray(times, dtype=float))
+        values            = np.stack([self.__Interpolate(dataSet, columns, times, method) for dataSet in dataSets])
+
+        match output:
+            case "array":
+                return values
+
+            case "dataframe":
+                # The values are in (data set, time, column) order, so the labels are repeated and tiled to match.
+                names = np.array([self.dataSetNames[dataSet] for dataSet in dataSets], dtype=object)
+                return pd.DataFrame({
+                    "Data Set"             : np.repeat(names, len(times)*len(columns)),
+                    self.independentColumn : np.tile(np.repeat(times, len(columns)), len(dataSets)),
+                    "Column"               : np.tile(np.array(columns, dtype=object), len(dataSets)*len(times)),
+                    "Value"                : values.ravel()
+                })
+
+            case _:
+                raise Exception("The output type \"" + str(output) + "\" is not valid.")
+
+
+    def __GetSelection(self, dataSets:list, columns:str|list) -> tuple[list, list]:
+        """
+        Gets the indices of the data sets and the names of the columns, applying the defaults.
+        """
+        if dataSets is None:
+            dataSets = list(range(self.NumberOfDataSets))
+
+        if columns is None:
+            columns = [column for column in self.dataSets[dataSets[0]].columns if column != self.independentColumn]
+        elif type(columns) is str:
+            columns = [columns]
+
+        return dataSets, columns
+
+
+    def __GetGrid(self, dataSets:list, grid:str, step:float, reference:int) -> np.ndarray:
+        """
+        Gets the independent axis values to resample at.
+        """
+        match grid:
+            case "union":
+                return np.unique(np.concatenate([self.GetSortedIndex(dataSet).Values for dataSet in dataSets]))
+
+            case "reference":
+                return self.GetSortedIndex(reference).Values.copy()
+
+            case "step":
+                if step is None or step <= 0:
+                    raise Exception("A step greater than zero must be supplied to use the \"step\" grid.")
+                start = min(self.GetSortedIndex(dataSet).Values[0] for dataSet in dataSets)
+                stop  = max(self.GetSortedIndex(dataSet).Values[-1] for dataSet in dataSets)
+                # The number of steps is rounded so that floating point error does not drop the last value.
+                return start + step*np.arange(int(np.floor((stop-start)/step + 1e-9)) + 1)
+
+            case _:
+                raise Exception("The grid type \"" + str(grid) + "\" is not valid.")
+
+
+    def __Interpolate(self, dataSet:int, columns:list, times:np.ndarray, method:str) -> np.ndarray:
+        """
+        Interpolates columns of a data set at the specified times.  A single search of the independent column is shared
+        by all the columns.
+
+        Returns an array with the shape (len(times), len(columns)).  Times out of the range of the data set are NaN.
+        """
+        x       = self.GetSortedIndex(dataSet).Values
+        data    = self.dataSets[dataSet]
+        times   = np.asarray(times, dtype=float)
+        last    = len(x) - 1
+
+        # The samples before (at or below) and after each time.
+        upper   = np.searchsorted(x, times, side="right")
+        lower   = np.clip(upper-1, 0, last)
+        upper   = np.clip(upper, 0, last)
+
+        match method:
+            case "previous":
+                result = self.__GetRows(data, columns, lower)
+
+            case "nearest":
+                closest = np.where(x[upper]-times < times-x[lower], upper, lower)
+                result  = self.__GetRows(data, columns, closest)
+
+            case "linear":
+                span    = x[upper] - x[lower]
+                weight  = np.divide(times-x[lower], span, out=np.zeros(len(times)), where=span > 0)
+                before  = self.__GetRows(data, columns, lower)
+                result  = before + weight[:, None]*(self.__GetRows(data, columns, upper)-before)
+
+            case _:
+                raise Exception("The interpolation method \"" + str(method) + "\" is not valid.")
+
+        result[(times < x[0]) | (times > x[-1])] = np.nan
+        return result
+
+
+    def __GetRows(self, data:pd.DataFrame|LazyDataSet, columns:list, rows:np.ndarray) -> np.ndarray:
+        """
+        Gets the values of columns at rows as an array with the shape (len(rows), len(columns)).  Only the requested rows
+        are read, so a lazy data set is not loaded into memory.
+        """
+        values = np.empty((len(rows), len(columns)))
+        for i, column in enumerate(columns):
+            values[:, i] = data[column].to_numpy()[rows]
+        return values
+
 
     def CreateComparisonPlot(
             self,
@@ -201,9 +839,11 @@ class DataComparison():
             xLabel:        str           = None,
             yLabel:        str           = None,
             legendOptions: LegendOptions = LegendOptions(),
+            xLimits:       tuple         = None,
+            decimate:      bool          = True,
             **kwargs
         ):
-        figure, axes = self.NewComparisonPlot(columns, title, xLabel, yLabel, **kwargs)
+        figure, axes = self.NewComparisonPlot(columns, title, xLabel, yLabel, xLimits=xLimits, decimate=decimate, **kwargs)
         LegendHelper.CreateLegend(figure, axes, legendOptions=legendOptions)
         plt.show()
         return figure
@@ -216,6 +856,8 @@ class DataComparison():
             xLabel:        str        = None,
             yLabel:        str | list = None,
             labelSuffixes: str        = None,
+            xLimits:       tuple      = None,
+            decimate:      bool       = True,
             **kwargs
         ):
         """
@@ -234,6 +876,13 @@ class DataComparison():
         labelSuffixes : str, optional
             The label suffix to append for each series plotted.  If None, then the column name is used.  If supplied, the number of
             of values supplied must equal len(columns).  The default is None.
+        xLimits : tuple, optional
+            The first and last values of the independent axis to plot.  Only the data in this range is read and plotted,
+            which is required for large (lazy) data sets.  If None, all the data is plotted. The default is None.
+        decimate : bool, optional
+            If True, long series are reduced to the minimum and maximum values in each pixel column of the axes, which
+            looks the same but is much faster to draw.  The series are decimated again from the full data when the
+            x-axis limits change (e.g. when zooming).  See Decimation.MinMaxIndices. The default is True.
         **kwargs : keyword arguments
             Keyword arguments to pass to the plot function.
 
@@ -260,13 +909,25 @@ class DataComparison():
         # Convert the kwargs into individual series kwargs.
         seriesKeyWordArgs = PlotHelper.ConvertKeyWordArgumentsToSeriesSets(len(columns)*len(self.dataSets), **kwargs)
 
+        numberOfBuckets = self.__GetNumberOfBuckets(axes) if decimate else None
+        lineSources     = []
+
         i = 0
-        for dataSet, dataSetName in zip(self.dataSets, self.dataSetNames):
+        for dataSetIndex, dataSetName in enumerate(self.dataSetNames):
+            dataSet = self.__GetPlotData(dataSetIndex, columns, xLimits, numberOfBuckets)
+
             for column, labelSuffix in zip(columns, labelSuffixes):
                 label = dataSetName + " " + labelSuffix
-                axes.plot(dataSet[self.independentColumn], dataSet[column], label=label, **(seriesKeyWordArgs[i]))
+                lines = axes.plot(dataSet[self.independentColumn], dataSet[column], label=label, **(seriesKeyWordArgs[i]))
+                lineSources.append((lines[0], dataSetIndex, column))
                 i += 1
 
+        if decimate:
+            self.__ConnectDecimation(axes, lineSources)
+
+        if xLimits is not None:
+            axes.set_xlim(xLimits)
+
         # If no title is provided, create a default.
         if title is None:
             title = "Comparison of "+column
@@ -284,7 +945,15 @@ class DataComparison():
         return figure, axes
 
 
-    def CreateMultiAxisComparisonPlot(self, axesesColumnNames:list, yLabels:list, legendOptions:LegendOptions=LegendOptions(), **kwargs):
+    def CreateMultiAxisComparisonPlot(
+            self,
+            axesesColumnNames: list,
+            yLabels:           list,
+            legendOptions:     LegendOptions  = LegendOptions(),
+            xLimits:           tuple          = None,
+            decimate:          bool           = True,
+            **kwargs
+        ):
         """
         Creates a multi y-axes plot.  The columns are plotted for each data set.
 
@@ -299,6 +968,10 @@ class DataComparison():
             A list of strings to use as labels for the y-axes.
         legendOptions : LegendOptions, optional
             Options that specify if and how the legend is generated. The default is LegendOptions().
+        xLimits : tuple, optional
+            The first and last values of the independent axis to plot.  See NewComparisonPlot. The default is None.
+        decimate : bool, optional
+            If True, long series are decimated to the resolution of the axes.  See NewComparisonPlot. The default is True.
         **kwargs : keyword arguments
             Keyword arguments to pass to the plot function.
 
@@ -307,12 +980,27 @@ class DataComparison():
         figure : matplotlib.figure.Figure
             The newly created figure.
         """
-        figure, axeses = PlotHelper.NewMultiYAxesFigure(len(axesesColumnNames))
+        figure, axeses  = PlotHelper.NewMultiYAxesFigure(len(axesesColumnNames))
 
-        for dataSet in self.dataSets:
-            lines = PlotMaker.PlotMultiYAxes(axeses, dataSet, self.independentColumn, axesesColumnNames, **kwargs)
-            for line in lines:
-                line.set_label(dataSet.name + " " + line.get_label())
+        # Each element is a column name or a list (or tuple) of column names.
+        axesesColumnNames = [list(element) if isinstance(element, (list, tuple)) else [element] for element in axesesColumnNames]
+        columns           = [column for element in axesesColumnNames for column in element]
+        numberOfBuckets = self.__GetNumberOfBuckets(axeses[0]) if decimate else None
+        lineSources     = []
+
+        for dataSetIndex, dataSetName in enumerate(self.dataSetNames):
+            dataSet = self.__GetPlotData(dataSetIndex, columns, xLimits, numberOfBuckets)
+            lines   = PlotMaker.PlotMultiYAxes(axeses, dataSet, self.independentColumn, axesesColumnNames, **kwargs)
+            for line, column in zip(lines, columns):
+                line.set_label(dataSetName + " " + line.get_label())
+                lineSources.append((line, dataSetIndex, column))
+
+        # The axes share the x-axis, so updating the lines when the first axes changes updates all of them.
+        if decimate:
+            self.__ConnectDecimation(axeses[0], lineSources)
+
+        if xLimits is not None:
+            axeses[0].set_xlim(xLimits)
 
         AxesHelper.AlignYAxes(axeses)
 
@@ -322,4 +1010,54 @@ class DataComparison():
         figure.legend(loc="upper left", bbox_to_anchor=(0, -0.15), ncol=2, bbox_transform=axeses[0].transAxes)
         plt.show()
 
-        return figure
\ No newline at end of file
+        return figure
+
+
+    def __GetPlotData(self, dataSet:int, columns:list, xLimits:tuple, numberOfBuckets:int) -> pd.DataFrame:
+        """
+        Gets the data of a data set to plot.  Only the rows within the x limits (plus one on each side, so the lines
+        reach the edges of the axes) are read.  If a number of buckets is supplied, the rows are decimated so the
+        minimum and maximum of every column in each bucket are kept.
+        """
+        data   = self.dataSets[dataSet]
+        length = len(data)
+        rows   = slice(0, length)
+
+        if xLimits is not None:
+            start = -np.inf if xLimits[0] is None else xLimits[0]
+            stop  = np.inf if xLimits[1] is None else xLimits[1]
+            rows  = self.GetSortedIndex(dataSet).Range(start, stop)
+            rows  = slice(max(rows.start-1, 0), min(rows.stop+1, length))
+
+        x      = data[self.independentColumn].to_numpy()[rows]
+        values = {column : data[column].to_numpy()[rows] for column in columns}
+
+        if numberOfBuckets is not None and len(x) > 4*numberOfBuckets:
+            # The kept rows of all the columns are combined so the columns still share the independent values.
+            indices = np.unique(np.concatenate([Decimation.MinMaxIndices(y, numberOfBuckets, x) for y in values.values()]))
+            x       = x[indices]
+            values  = {column : y[indices] for column, y in values.items()}
+
+        return pd.DataFrame({self.independentColumn : x} | values)
+
+
+    def __GetNumberOfBuckets(self, axes) -> int:
+        """
+        Gets the number of decimation buckets for an axes, which is its width in pixels.
+        """
+        return max(int(axes.get_window_extent().width), 1)
+
+
+    def __ConnectDecimation(self, axes, lineSources:list):
+        """
+        Decimates the lines again, from the full data, each time the x limits of the axes change.
+        """
+        def Update(axes):
+            numberOfBuckets = self.__GetNumberOfBuckets(axes)
+            for dataSetIndex in dict.fromkeys(source[1] for source in lineSources):
+                sources = [source for source in lineSources if source[1] == dataSetIndex]
+                data    = self.__GetPlotData(dataSetIndex, [source[2] for source in sources], axes.get_xlim(), numberOfBuckets)
+                for line, _, column in sources:
+                    line.set_data(data[self.independentColumn].to_numpy(), data[column].to_numpy())
+
+        axes.callbacks.connect("xlim_changed", Update)
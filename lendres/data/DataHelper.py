@@ -16,6 +16,8 @@ import io
 from   lendres.algorithms.Search                                import Search
 from   lendres.io.ConsoleHelper                                 import ConsoleHelper
 from   lendres.data.DataHelperBase                              import DataHelperBase
+from   lendres.data.StreamingDataSummary                        import StreamingDataSummary
+from   lendres.data.DataProfile                                 import DataProfile
 
 
 class DataHelper(DataHelperBase):
@@ -51,6 +53,9 @@ class DataHelper(DataHelperBase):
         """
         super().__init__(consoleHelper)
 
+        # The last profile of the data.  See CreateProfile.
+        self.profile = None
+
         # Either load the data from file or the supplied existing data, but not both.
         if fileName is not None:
             self.LoadAndInspectData(fileName)
@@ -82,6 +87,8 @@ class DataHelper(DataHelperBase):
         To read a file that does not contain headers, use the following:
         LoadAndInspectData(inputFile, verboseLevel, header=None, names=["header1", header2", ... headerN"])
 
+        For files too large to fit in memory, use InspectDataInChunks.
+
         Parameters
         ----------
         inputFile : string
@@ -107,9 +114,12 @@ class DataHelper(DataHelperBase):
         self.consoleHelper.PrintTitle("Input File: " + inputFile, verboseLevel)
         self.data = pd.read_csv(inputFile, **kwargs)
 
+        # The summaries are all calculated together.
+        profile   = self.CreateProfile()
+
         # Data size and shape.
         self.consoleHelper.PrintTitle("Data Size", verboseLevel)
-        self.consoleHelper.Display(self.data.shape, verboseLevel)
+        self.consoleHelper.Display(profile.shape, verboseLevel)
 
         # The first few records.
         self.consoleHelper.PrintTitle("First Few Records", verboseLevel)
@@ -120,49 +130,150 @@ class DataHelper(DataHelperBase):
         self.consoleHelper.PrintTitle("Random Sampling", verboseLevel)
         self.consoleHelper.Display(self.data.sample(n=10), verboseLevel)
 
-        # Data summary (mean, min, max, et cetera.
+        # Data summary (mean, min, max, et cetera.  Without numeric columns, pandas describes the other columns.
         self.consoleHelper.PrintTitle("Data Summary", verboseLevel)
-        self.consoleHelper.Display(self.data.describe(), verboseLevel)
+        self.consoleHelper.Display(profile.numericSummary if profile.numericSummary.shape[1] > 0 else self.data.describe(), verboseLevel)
 
         # Check data types.
-        self.PrintDataTypes(verboseLevel)
+        self.PrintDataTypes(verboseLevel, profile)
 
         # Check unique value counts.
         self.consoleHelper.PrintTitle("Unique Counts", verboseLevel)
-        self.consoleHelper.Display(self.data.nunique(), verboseLevel)
+        self.consoleHelper.Display(profile.uniqueCounts, verboseLevel)
 
         # See if there are any missing entries, if so they will have to be cleaned.
-        self.PrintNotAvailableCounts(verboseLevel)
+        self.PrintNotAvailableCounts(verboseLevel, profile)
 
         return self.data
 
 
-    def PrintFinalDataSummary(self):
+    def CreateProfile(self):
         """
-        Prints a final data summary.
+        Calculates the summaries of the data (shape, data types, missing entry counts, unique counts, category value
+        counts, and summary statistics) together.  See DataProfile.
+
+        The profile can be passed to the print and display functions so they do not recalculate it.  It is also saved
+        as "self.profile."  The profile is not updated when the data changes, so create a new one after modifying the data.
 
         Parameters
         ----------
         None.
 
+        Returns
+        -------
+        profile : DataProfile
+            The profile of the data.
+        """
+        self.profile = DataProfile(self.data)
+        return self.profile
+
+
+    def InspectDataInChunks(self, inputFile, chunkSize=100000, verboseLevel=ConsoleHelper.VERBOSEREQUESTED, **kwargs):
+        """
+        Reads a data file in chunks and reports the same inspections as LoadAndInspectData without loading the data.
+
+        Only the summary is kept in memory, so this can be used for files that are too large to load.  The data is not
+        loaded into the DataHelper.  The percentiles and, for columns with many distinct values, the unique counts are
+        estimates.  See StreamingDataSummary.
+
+        Parameters
+        ----------
+        inputFile : string
+            Path and name of the file to inspect.
+        chunkSize : integer, optional
+            The number of rows read at a time. The default is 100000.
+        verboseLevel : integer, optional
+            Verbose level to use for the ConsoleHelper.  Default is ConsoleHelper.VERBOSEREQUESTED.
+        **kwargs : keyword arguments
+            These arguments are passed on to the Pandas.read_csv function.
+
+        Returns
+        -------
+        summary : StreamingDataSummary
+            The summary of the data.
+        """
+        # Validate the input file.
+        if type(inputFile) != str:
+            raise Exception("The input file is not a string.")
+
+        if not os.path.exists(inputFile):
+            raise Exception("The input file \"" + inputFile + "\" does not exist.")
+
+        # Read the file in chunks.
+        self.consoleHelper.PrintTitle("Input File: " + inputFile, verboseLevel)
+        summary = StreamingDataSummary()
+        with pd.read_csv(inputFile, chunksize=chunkSize, **kwargs) as reader:
+            for chunk in reader:
+                summary.Update(chunk)
+
+        # Data size and shape.
+        self.consoleHelper.PrintTitle("Data Size", verboseLevel)
+        self.consoleHelper.Display(summary.Shape, verboseLevel)
+
+        # The first few records.
+        self.consoleHelper.PrintTitle("First Few Records", verboseLevel)
+        self.consoleHelper.Display(summary.GetHead(), verboseLevel)
+
+        # Random records.
+        self.consoleHelper.PrintTitle("Random Sampling", verboseLevel)
+        self.consoleHelper.Display(summary.GetSample(), verboseLevel)
+
+        # Data summary (mean, min, max, et cetera.
+        self.consoleHelper.PrintTitle("Data Summary", verboseLevel)
+        self.consoleHelper.Display(summary.Describe(), verboseLevel)
+
+        # Check data types.
+        self.consoleHelper.PrintTitle("Data Types", verboseLevel)
+        self.consoleHelper.Display(summary.GetDataTypes(), verboseLevel)
+
+        # Check unique value counts.
+        self.consoleHelper.PrintTitle("Unique Counts", verboseLevel)
+        self.consoleHelper.Display(summary.GetUniqueCounts(), verboseLevel)
+
+        # See if there are any missing entries, if so they will have to be cleaned.
+        notAvailableCounts, totalNotAvailable = summary.GetNotAvailableCounts()
+        self.consoleHelper.PrintTitle("Missing Entry Counts", verboseLevel)
+        self.consoleHelper.Display(notAvailableCounts, verboseLevel)
+
+        if totalNotAvailable:
+            self.consoleHelper.PrintWarning("Some data entries are missing.")
+            self.consoleHelper.Print("Total missing: "+str(totalNotAvailable), verboseLevel)
+        else:
+            self.consoleHelper.Print("No entries are missing.", verboseLevel)
+
+        return summary
+
+
+    def PrintFinalDataSummary(self, profile=None):
+        """
+        Prints a final data summary.
+
+        Parameters
+        ----------
+        profile : DataProfile, optional
+            A profile of the current data.  If None, one is created. The default is None.
+
         Returns
         -------
         None.
         """
+        if profile is None:
+            profile = self.CreateProfile()
+
         self.consoleHelper.PrintTitle("Data Size", ConsoleHelper.VERBOSEREQUESTED)
-        self.consoleHelper.Display(self.data.shape, ConsoleHelper.VERBOSEREQUESTED)
+        self.consoleHelper.Display(profile.shape, ConsoleHelper.VERBOSEREQUESTED)
 
-        self.PrintDataTypes()
+        self.PrintDataTypes(profile=profile)
 
         self.consoleHelper.PrintTitle("Continuous Data", ConsoleHelper.VERBOSEREQUESTED)
-        self.consoleHelper.Display(self.data.describe().T, ConsoleHelper.VERBOSEREQUESTED)
+        self.consoleHelper.Display(profile.numericSummary.T, ConsoleHelper.VERBOSEREQUESTED)
 
-        if self.data.select_dtypes(include=['category']).shape[1] > 0:
+        if profile.categorySummary.shape[1] > 0:
             self.consoleHelper.PrintTitle("Categorical", ConsoleHelper.VERBOSEREQUESTED)
-            self.consoleHelper.Display(self.data.describe(include=["category"]).T, ConsoleHelper.VERBOSEREQUESTED)
+            self.consoleHelper.Display(profile.categorySummary.T, ConsoleHelper.VERBOSEREQUESTED)
 
 
-    def PrintDataTypes(self, verboseLevel=ConsoleHelper.VERBOSEREQUESTED):
+    def PrintDataTypes(self, verboseLevel=ConsoleHelper.VERBOSEREQUESTED, profile=None):
         """
         Prints the data types.
 
@@ -172,31 +283,43 @@ class DataHelper(DataHelperBase):
 
         Parameters
         ----------
-        None.
+        verboseLevel : integer, optional
+            Verbose level to use for the ConsoleHelper.  Default is ConsoleHelper.VERBOSEREQUESTED.
+        profile : DataProfile, optional
+            A profile of the current data.  If supplied, the types and non-null counts are displayed from it instead of
+            from DataFrame.info(). The default is None.
 
         Returns
         -------
         None.
         """
+        if profile is not None:
+            self.consoleHelper.PrintTitle("Data Types", verboseLevel)
+            self.consoleHelper.Display(profile.GetDataTypes(), verboseLevel)
+            return
+
         buffer = io.StringIO()
         self.data.info(buf=buffer)
         self.consoleHelper.PrintTitle("Data Types", verboseLevel)
         self.consoleHelper.Print(buffer.getvalue(), verboseLevel)
 
 
-    def PrintNotAvailableCounts(self, verboseLevel=ConsoleHelper.VERBOSEREQUESTED):
+    def PrintNotAvailableCounts(self, verboseLevel=ConsoleHelper.VERBOSEREQUESTED, profile=None):
         """
         Prints the counts of any missing (not available) entries.
 
         Parameters
         ----------
-        None.
+        verboseLevel : integer, optional
+            Verbose level to use for the ConsoleHelper.  Default is ConsoleHelper.VERBOSEREQUESTED.
+        profile : DataProfile, optional
+            A profile of the current data to take the counts from. The default is None.
 
         Returns
         -------
         None.
         """
-        notAvailableCounts, totalNotAvailable = self.GetNotAvailableCounts()
+        notAvailableCounts, totalNotAvailable = self.GetNotAvailableCounts(profile)
 
         self.consoleHelper.PrintTitle("Missing Entry Counts", verboseLevel)
         self.consoleHelper.Display(notAvailableCounts, verboseLevel)
@@ -208,18 +331,22 @@ class DataHelper(DataHelperBase):
             self.consoleHelper.Print("No entries are missing.", verboseLevel)
 
 
-    def GetNotAvailableCounts(self):
+    def GetNotAvailableCounts(self, profile=None):
         """
         Gets the counts of any missing (not available) entries.
 
         Parameters
         ----------
-        None.
+        profile : DataProfile, optional
+            A profile of the current data to take the counts from. The default is None.
 
         Returns
         -------
         None.
         """
+        if profile is not None:
+            return profile.notAvailableCounts, profile.TotalNotAvailable
+
         notAvailableCounts = self.data.isna().sum()
         totalNotAvailable  = sum(notAvailableCounts)
         return notAvailableCounts, totalNotAvailable
@@ -246,7 +373,7 @@ class DataHelper(DataHelperBase):
             self.consoleHelper.Display(values, ConsoleHelper.VERBOSEREQUESTED)
 
 
-    def DisplayCategoryCounts(self, columns):
+    def DisplayCategoryCounts(self, columns, profile=None):
         """
         Displays all the values counts for the specified columns columns.
 
@@ -256,6 +383,8 @@ class DataHelper(DataHelperBase):
         ----------
         columns : list, array of strings
             Names of the columns to operate on.
+        profile : DataProfile, optional
+            A profile of the current data to take the value counts of category columns from. The default is None.
 
         Returns
         -------
@@ -265,10 +394,13 @@ class DataHelper(DataHelperBase):
             title  = "Category counts in \"" + column + "\":"
             self.consoleHelper.PrintTitle(title, ConsoleHelper.VERBOSEREQUESTED)
 
-            self.consoleHelper.Display(self.data[column].value_counts(), ConsoleHelper.VERBOSEREQUESTED)
+            if profile is not None and column in profile.valueCounts:
+                self.consoleHelper.Display(profile.valueCounts[column], ConsoleHelper.VERBOSEREQUESTED)
+            else:
+                self.consoleHelper.Display(self.data[column].value_counts(), ConsoleHelper.VERBOSEREQUESTED)
 
 
-    def DisplayAllCategoriesValueCounts(self):
+    def DisplayAllCategoriesValueCounts(self, profile=None):
         """
         Displays the value counts of all columns of type "category."
 
@@ -276,14 +408,18 @@ class DataHelper(DataHelperBase):
 
         Parameters
         ----------
-        None.
+        profile : DataProfile, optional
+            A profile of the current data.  If None, one is created. The default is None.
 
         Returns
         -------
         None.
         """
+        if profile is None:
+            profile = self.CreateProfile()
+
         # Find all the category types in the DataFrame and passes them to the display function.
-        self.DisplayCategoryCounts(self.data.dtypes[self.data.dtypes == "category"].index)
+        self.DisplayCategoryCounts(list(profile.valueCounts.keys()), profile)
 
 
     def ApplyTo(self, columns, function):
@@ -375,6 +511,102 @@ class DataHelper(DataHelperBase):
         self.data[columnNames] = self.data[columnNames].astype("int")
 
 
+    def OptimizeMemory(self, categoryFraction=0.5, stringType=None, downcastFloats=True, verboseLevel=ConsoleHelper.VERBOSEREQUESTED):
+        """
+        Changes the data type of each column to one that uses less memory without changing the values.
+            Integers : Downcast to the smallest signed integer type that holds the values (unsigned types are not used so
+                subtracting values cannot wrap around).
+            Floats : Downcast to float32 (Float32 for nullable floats) if every value is exactly the same as a float32.
+            Text (object) : Changed to "category" if the number of unique values is at most "categoryFraction" of the number
+                of rows.  Otherwise, changed to "stringType" (a nullable string type).
+        Other columns (Boolean, category, dates, et cetera) are not changed.  Except for strings, a column is only changed
+        if it uses less memory.
+
+        Parameters
+        ----------
+        categoryFraction : float, optional
+            The largest fraction of unique values a text column can have to be changed to a category. The default is 0.5.
+        stringType : string, optional
+            The data type for the other text columns.  If None, "string[pyarrow]" is used if pyarrow is installed, which
+            uses much less memory than "object."  Otherwise, "string" is used, which uses about the same memory as "object"
+            but is a true text type with missing values (pd.NA). The default is None.
+        downcastFloats : bool, optional
+            If True, floats are downcast. The default is True.
+        verboseLevel : integer, optional
+            Verbose level to use for the ConsoleHelper.  Default is ConsoleHelper.VERBOSEREQUESTED.
+
+        Returns
+        -------
+        report : pandas.DataFrame
+            The data types and memory used (bytes) before and after of each column and the totals.
+        """
+        if stringType is None:
+            stringType = self.__GetDefaultStringType()
+
+        report = pd.DataFrame(index=self.data.columns, columns=["Before Type", "After Type", "Before (bytes)", "After (bytes)"])
+
+        for column in self.data.columns:
+            values    = self.data[column]
+            optimized = self.__OptimizeColumn(values, categoryFraction, stringType, downcastFloats)
+
+            before    = values.memory_usage(index=False, deep=True)
+            after     = optimized.memory_usage(index=False, deep=True)
+            if optimized.dtype != values.dtype and (after < before or isinstance(optimized.dtype, pd.StringDtype)):
+                self.data[column] = optimized
+            else:
+                optimized, after  = values, before
+
+            report.loc[column] = [values.dtype, optimized.dtype, before, after]
+
+        report.loc["Total"] = ["", "", report["Before (bytes)"].sum(), report["After (bytes)"].sum()]
+
+        self.consoleHelper.PrintTitle("Memory Optimization", verboseLevel)
+        self.consoleHelper.Display(report, verboseLevel)
+        return report
+
+
+    def __GetDefaultStringType(self):
+        """
+        Gets the string type used by OptimizeMemory.  The pyarrow string type is used if pyarrow can be imported.
+        """
+        try:
+            import pyarrow
+        except ImportError:
+            return "string"
+        return "string[pyarrow]"
+
+
+    def __OptimizeColumn(self, values, categoryFraction, stringType, downcastFloats):
+        """
+        Gets a column converted to the data type that uses the least memory.  See OptimizeMemory.
+        """
+        if pd.api.types.is_bool_dtype(values) or not (pd.api.types.is_numeric_dtype(values) or values.dtype == object):
+            return values
+
+        if pd.api.types.is_integer_dtype(values):
+            return pd.to_numeric(values, downcast="integer")
+
+        if pd.api.types.is_float_dtype(values):
+            if not downcastFloats or values.dtype.itemsize <= 4:
+                return values
+            # Nullable floats stay nullable, so their missing values (NA) are not changed to NaN.
+            downcast = values.astype("Float32" if pd.api.types.is_extension_array_dtype(values) else np.float32)
+
+            # pandas.to_numeric only checks that the downcast values are close, so check that they are the same.
+            if np.array_equal(downcast.to_numpy(dtype=float, na_value=np.nan), values.to_numpy(dtype=float, na_value=np.nan), equal_nan=True):
+                return downcast
+            return values
+
+        if len(values) > 0 and values.nunique() <= categoryFraction*len(values):
+            return values.astype("category")
+
+        # Only columns of text are changed to strings, a column of mixed types would have its values changed.
+        if pd.api.types.infer_dtype(values, skipna=True) == "string":
+            return values.astype(stringType)
+
+        return values
+
+
     def GetDuplicates(self, column):
         """
         Returns entries which occur more than one time in a column.
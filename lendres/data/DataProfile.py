@@ -0,0 +1,173 @@
+"""
+Created on October 18, 2026
+@author: Lance A. Endres
+"""
+import pandas                                                        as pd
+import numpy                                                         as np
+
+
+class DataProfile():
+    """
+    A summary of a DataFrame (shape, data types, missing entry counts, unique counts, value counts of categories, and
+    summary statistics) calculated together.
+
+    Calculating the items separately with pandas (info, isna, nunique, value_counts, and describe) passes over the data
+    once for each.  Here, the columns are grouped by type and each group is processed once:
+        Numeric columns : The columns are copied into one array and sorted.  The missing values, unique counts,
+            minimums, maximums, and percentiles are all read from the sorted array.  The unique counts of integer
+            columns are counted from the integers (hashed), since large integers are not exact as floats.
+        Category columns : The counts of the category codes give the missing values, unique counts, and value counts.
+        Other columns : The values are factorized (hashed into codes) and then handled like categories.
+
+    The results are the same as the pandas functions, except that percentiles next to infinite values are infinite
+    instead of NaN.  The profile is not updated if the data changes.
+    """
+
+
+    def __init__(self, data:pd.DataFrame):
+        """
+        Constructor.  Calculates the profile.
+
+        Parameters
+        ----------
+        data : pandas.DataFrame
+            The data to profile.
+
+        Returns
+        -------
+        None.
+        """
+        self.shape              = data.shape
+        self.dataTypes          = data.dtypes
+        self.notAvailableCounts = pd.Series(0, index=data.columns, dtype=np.int64)
+        self.uniqueCounts       = pd.Series(0, index=data.columns, dtype=np.int64)
+
+        # The value counts of each category column.
+        self.valueCounts        = {}
+
+        numericColumns          = data.select_dtypes(include="number").columns
+        categoryColumns         = data.select_dtypes(include="category").columns
+        otherColumns            = data.columns.difference(numericColumns.union(categoryColumns), sort=False)
+
+        self.numericSummary     = self.__ProfileNumeric(data, numericColumns)
+        self.categorySummary    = self.__ProfileCategories(data, categoryColumns)
+
+        for column in otherColumns:
+            codes, uniques = pd.factorize(data[column])
+            self.__CountCodes(column, codes, len(uniques))
+
+
+    @property
+    def TotalNotAvailable(self) -> int:
+        """
+        Gets the total number of missing entries.
+
+        Returns
+        -------
+        int
+        """
+        return int(self.notAvailableCounts.sum())
+
+
+    def GetDataTypes(self) -> pd.DataFrame:
+        """
+        Gets the data type and the number of entries that are not missing of each column.
+
+        Returns
+        -------
+        : pandas.DataFrame
+            The columns "Non-Null Count" and "Dtype" with one row for each column of the data.
+        """
+        return pd.DataFrame({"Non-Null Count" : self.shape[0] - self.notAvailableCounts, "Dtype" : self.dataTypes})
+
+
+    def __ProfileNumeric(self, data:pd.DataFrame, columns:pd.Index) -> pd.DataFrame:
+        """
+        Profiles the numeric columns and returns the summary statistics (the same as pandas.DataFrame.describe).
+        """
+        # Sorting puts the missing values (NaN) at the end of each column.
+        values   = np.sort(data[columns].to_numpy(dtype=float), axis=0)
+        count    = np.count_nonzero(~np.isnan(values), axis=0)
+        rows     = np.arange(len(values))[:, None]
+        valid    = rows < count
+
+        self.notAvailableCounts[columns] = len(values) - count
+
+        # The number of times the sorted values change, plus one for the first value.  The values are compared instead
+        # of differenced because the difference of equal infinities is NaN.
+        changes  = np.count_nonzero((values[1:] != values[:-1]) & valid[1:], axis=0)
+        self.uniqueCounts[columns] = np.where(count > 0, changes + 1, 0)
+
+        # Integers larger than 2**53 are not exact as floats, so distinct integers can become equal.  Integer columns
+        # are counted from the integers instead.
+        for column in columns:
+            if pd.api.types.is_integer_dtype(data[column]):
+                self.uniqueCounts[column] = len(pd.unique(data[column].dropna()))
+
+        with np.errstate(invalid="ignore", divide="ignore"):
+            mean     = np.where(valid, values, 0).sum(axis=0) / count
+            variance = np.where(valid, (values - mean)**2, 0).sum(axis=0) / (count - 1)
+            std      = np.where(count > 1, np.sqrt(variance), np.nan)
+
+        summary = {"count" : count.astype(float), "mean" : mean, "std" : std, "min" : self.__GetQuantile(values, count, 0.0)}
+        for quantile in (0.25, 0.5, 0.75):
+            summary[f"{quantile:.0%}"] = self.__GetQuantile(values, count, quantile)
+        summary["max"] = self.__GetQuantile(values, count, 1.0)
+
+        return pd.DataFrame(summary, index=columns).T
+
+
+    def __GetQuantile(self, values:np.ndarray, count:np.ndarray, quantile:float) -> np.ndarray:
+        """
+        Gets a quantile (with linear interpolation) of each column of sorted values.  Columns with no values return NaN.
+        """
+        position = quantile * np.maximum(count-1, 0)
+        lower    = np.floor(position).astype(np.int64)
+        upper    = np.ceil(position).astype(np.int64)
+        columns  = np.arange(values.shape[1])
+
+        if values.shape[0] == 0:
+            return np.full(values.shape[1], np.nan)
+
+        # Positions on a value are not interpolated, so infinite values are returned instead of NaN (inf - inf).  pandas
+        # (numpy) interpolates them, so its quantiles next to an infinite value are NaN.
+        lowerValues = values[lower, columns]
+        upperValues = values[upper, columns]
+        with np.errstate(invalid="ignore"):
+            result  = np.where(upper == lower, lowerValues, lowerValues + (position-lower)*(upperValues - lowerValues))
+        return np.where(count > 0, result, np.nan)
+
+
+    def __ProfileCategories(self, data:pd.DataFrame, columns:pd.Index) -> pd.DataFrame:
+        """
+        Profiles the category columns and returns the summary (the same as pandas.DataFrame.describe(include=["category"])).
+        """
+        summary = {}
+        for column in columns:
+            counts = self.__CountCodes(column, data[column].cat.codes.to_numpy(), len(data[column].cat.categories))
+
+            # The same as pandas.Series.value_counts, except that equal counts stay in the order of the categories.
+            index       = pd.CategoricalIndex(data[column].cat.categories, dtype=data[column].dtype, name=column)
+            valueCounts = pd.Series(counts, index=index, name="count").sort_values(ascending=False, kind="stable")
+            self.valueCounts[column] = valueCounts
+
+            hasValues = len(valueCounts) > 0 and valueCounts.iloc[0] > 0
+            summary[column] = [
+                int(counts.sum()),
+                int(self.uniqueCounts[column]),
+                valueCounts.index[0] if hasValues else np.nan,
+                int(valueCounts.iloc[0]) if hasValues else np.nan
+            ]
+
+        return pd.DataFrame(summary, index=["count", "unique", "top", "freq"], dtype=object)
+
+
+    def __CountCodes(self, column:str, codes:np.ndarray, numberOfValues:int) -> np.ndarray:
+        """
+        Counts the codes of a factorized or category column (-1 is a missing value) and records the missing entry and
+        unique counts.  Returns the count of each value.
+        """
+        counts = np.bincount(np.asarray(codes, dtype=np.int64)+1, minlength=numberOfValues+1)
+        self.notAvailableCounts[column] = counts[0]
+        self.uniqueCounts[column]       = np.count_nonzero(counts[1:])
+        return counts[1:]
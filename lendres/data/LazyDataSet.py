@@ -0,0 +1,213 @@
+"""
+Created on October 18, 2026
+@author: Lance A. Endres
+"""
+import numpy                                                         as np
+import pandas                                                        as pd
+
+from   lendres.algorithms.SortedIndex                                import SortedIndex
+from   lendres.io.ColumnarCache                                      import ColumnarCache
+
+
+class LazyDataSet():
+    """
+    A data set whose columns stay on disk (memory mapped) and are only read when they are used.
+
+    Only the independent column is searched, through a SortedIndex over its memory map.  A window of the data (the rows
+    between two values of the independent column) is read with GetWindow, so the memory used grows with the size of the
+    window, not the size of the file.
+
+    The data set supports the parts of the pandas.DataFrame interface used by DataComparison: the "name" attribute,
+    the "columns" property, len, and selecting a column (which returns a pandas.Series over the memory map).  Columns
+    added with "dataSet[column] = values" are kept in memory.
+
+    The columns are usually loaded from a ColumnarCache (see FromCache and DataComparison.LoadLazyFile).  A data set
+    loaded from a cache is pickled as a reference to the cache entry instead of its data, so sending it to another
+    process (for example, a process pool) is cheap and the process memory maps the same files.
+    """
+
+
+    def __init__(self, columns:dict, independentColumn:str, name:str=None):
+        """
+        Constructor.
+
+        Parameters
+        ----------
+        columns : dict
+            The column names as keys and the columns (array like, usually memory mapped) as values.
+        independentColumn : str
+            The column name of the independent data.  The values must be sorted in ascending order.
+        name : str, optional
+            The name of the data set. The default is None.
+
+        Returns
+        -------
+        None.
+        """
+        if independentColumn not in columns:
+            raise Exception("The independent column \"" + independentColumn + "\" is not in the data set.")
+
+        self.data              = {column : pd.Series(values, copy=False) for column, values in columns.items()}
+        self.independentColumn = independentColumn
+        self.name              = name
+        self.sortedIndex       = None
+
+        # The cache entry the columns were loaded from as (cache directory, path, read arguments).  See FromCache.
+        self.source            = None
+
+
+    @classmethod
+    def FromCache(cls, cache:ColumnarCache, path:str, independentColumn:str, name:str=None, **kwargs):
+        """
+        Creates a data set from a file that is in a cache.
+
+        Parameters
+        ----------
+        cache : ColumnarCache
+            The cache.
+        path : str
+            The path of the source file.
+        independentColumn : str
+            The column name of the independent data.
+        name : str, optional
+            The name of the data set. The default is None.
+        **kwargs : keyword arguments
+            The arguments the source file was read with.
+
+        Returns
+        -------
+        : LazyDataSet
+            The data set.
+        """
+        columns = cache.LoadColumns(path, **kwargs)
+        if columns is None:
+            raise Exception("The file \"" + path + "\" is not in the cache or has changed.")
+
+        dataSet        = LazyDataSet(columns, independentColumn, name)
+        dataSet.source = (cache.directory, path, kwargs)
+        return dataSet
+
+
+    @classmethod
+    def _FromCacheDirectory(cls, directory:str, path:str, arguments:dict, independentColumn:str, name:str):
+        """
+        Recreates a data set that was pickled as a reference to a cache entry.
+        """
+        return cls.FromCache(ColumnarCache(directory), path, independentColumn, name, **arguments)
+
+
+    def __reduce_ex__(self, protocol):
+        # Data sets that match a cache entry are pickled as a reference to it.  Others are pickled with their data.
+        if self.source is None:
+            return super().__reduce_ex__(protocol)
+        directory, path, arguments = self.source
+        return (LazyDataSet._FromCacheDirectory, (directory, path, arguments, self.independentColumn, self.name))
+
+
+    def __len__(self):
+        return len(self.data[self.independentColumn])
+
+
+    def __getitem__(self, column:str) -> pd.Series:
+        return self.data[column]
+
+
+    def __setitem__(self, column:str, values):
+        values = pd.Series(np.asarray(values)) if np.ndim(values) > 0 else pd.Series(np.full(len(self), values))
+        if len(values) != len(self):
+            raise Exception("The length of the values does not match the length of the data set.")
+        self.data[column] = values
+
+        # The data set no longer matches the cache entry.
+        self.source       = None
+        if column == self.independentColumn:
+            self.ClearSortedIndex()
+
+
+    @property
+    def columns(self) -> list:
+        """
+        Gets the column names.  Named to match pandas.DataFrame.
+
+        Returns
+        -------
+        list
+        """
+        return list(self.data.keys())
+
+
+    def GetSortedIndex(self) -> SortedIndex:
+        """
+        Gets the search index of the independent column.  It is created the first time it is requested.
+
+        Returns
+        -------
+        : SortedIndex
+            The search index.
+        """
+        if self.sortedIndex is None:
+            self.sortedIndex = SortedIndex(self.data[self.independentColumn].to_numpy())
+        return self.sortedIndex
+
+
+    def ClearSortedIndex(self):
+        """
+        Clears the search index of the independent column.  It is created again the next time it is requested.
+
+        Returns
+        -------
+        None.
+        """
+        self.sortedIndex = None
+
+
+    def GetRows(self, rows:slice, columns:str|list=None) -> pd.DataFrame:
+        """
+        Reads a range of rows into memory.
+
+        Parameters
+        ----------
+        rows : slice
+            The rows to read.
+        columns : str | list, optional
+            The column or columns to read.  The independent column is always read.  If None, all the columns are read.
+            The default is None.
+
+        Returns
+        -------
+        : pandas.DataFrame
+            The rows.  The index is the row numbers in the data set.
+        """
+        if columns is None:
+            columns = self.columns
+        elif type(columns) is str:
+            columns = [columns]
+
+        if self.independentColumn not in columns:
+            columns = [self.independentColumn] + list(columns)
+
+        index = pd.RangeIndex(len(self))[rows]
+        return pd.DataFrame({column : self.data[column].to_numpy()[rows] for column in columns}, index=index)
+
+
+    def GetWindow(self, start:float=None, stop:float=None, columns:str|list=None) -> pd.DataFrame:
+        """
+        Reads the rows where the independent column is between two values (inclusive) into memory.
+
+        Parameters
+        ----------
+        start : float, optional
+            The first value of the independent column.  If None, the window starts at the beginning of the data. The default is None.
+        stop : float, optional
+            The last value of the independent column.  If None, the window ends at the end of the data. The default is None.
+        columns : str | list, optional
+            The column or columns to read.  See GetRows. The default is None.
+
+        Returns
+        -------
+        : pandas.DataFrame
+            The rows in the window.
+        """
+        start = -np.inf if start is None else start
+        stop  = np.inf if stop is None else stop
+        return self.GetRows(self.GetSortedIndex().Range(start, stop), columns)
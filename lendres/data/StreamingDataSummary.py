@@ -0,0 +1,322 @@
+"""
+Created on October 18, 2026
+@author: Lance A. Endres
+"""
+import pandas                                                        as pd
+import numpy                                                         as np
+
+from   lendres.algorithms.HyperLogLog                                import HyperLogLog
+
+
+class StreamingDataSummary():
+    """
+    Builds the summary reported by DataHelper.LoadAndInspectData from data that arrives in chunks (for example, a file
+    too large to fit in memory that is read with pandas.read_csv(..., chunksize=...)).  Only the summary is kept, not
+    the data.
+
+    The parts of the summary are calculated as follows:
+        Shape, first records, missing entry counts, and data types : Exact.
+        Random sampling : Reservoir sampling, so every row has the same chance of being in the sample.
+        Data summary (describe) : The count, mean, standard deviation, minimum, and maximum are exact (the moments of the
+            chunks are merged).  The percentiles are calculated from a random sample of "quantileSampleSize" rows, so
+            they are exact when the data has fewer rows than that and estimates otherwise.
+        Unique counts : Exact until a column has more than "maximumUniqueValues" distinct values, then estimated with
+            HyperLogLog.  See GetEstimatedColumns.
+
+    Example:
+        summary = StreamingDataSummary()
+        for chunk in pd.read_csv(file, chunksize=100000):
+            summary.Update(chunk)
+        summary.Describe()
+    """
+
+
+    def __init__(
+            self,
+            numberOfHeadRows:    int    = 5,
+            numberOfSamples:     int    = 10,
+            quantileSampleSize:  int    = 100000,
+            maximumUniqueValues: int    = 100000,
+            seed:                int    = 1
+        ):
+        """
+        Constructor.
+
+        Parameters
+        ----------
+        numberOfHeadRows : int, optional
+            The number of first records to keep. The default is 5.
+        numberOfSamples : int, optional
+            The number of random records to return from GetSample. The default is 10.
+        quantileSampleSize : int, optional
+            The number of random rows used to calculate the percentiles. The default is 100000.
+        maximumUniqueValues : int, optional
+            The number of distinct values of a column that are kept to count them exactly. The default is 100000.
+        seed : int, optional
+            The random number generator seed. The default is 1.
+
+        Returns
+        -------
+        None.
+        """
+        self.numberOfHeadRows    = numberOfHeadRows
+        self.numberOfSamples     = numberOfSamples
+        self.reservoirSize       = max(numberOfSamples, quantileSampleSize)
+        self.maximumUniqueValues = maximumUniqueValues
+        self.seed                = seed
+        self.random              = np.random.default_rng(seed)
+
+        self.numberOfRows        = 0
+        self.head                = None
+        self.reservoir           = None
+        self.dataTypes           = {}
+        self.notAvailableCounts  = None
+
+        # The count, mean, sum of squared differences from the mean, minimum, and maximum of each numeric column.
+        self.moments             = pd.DataFrame(columns=["count", "mean", "m2", "min", "max"], dtype=float)
+
+        # The distinct values of each column (None once there are too many) and the estimates of their counts.
+        self.uniqueValues        = {}
+        self.uniqueEstimates     = {}
+
+
+    @property
+    def Shape(self) -> tuple:
+        """
+        Gets the shape (rows, columns) of the data.
+
+        Returns
+        -------
+        tuple
+        """
+        return (self.numberOfRows, len(self.dataTypes))
+
+
+    def Update(self, chunk:pd.DataFrame):
+        """
+        Adds the next chunk of data to the summary.
+
+        Parameters
+        ----------
+        chunk : pandas.DataFrame
+            The chunk.  All the chunks must have the same columns.
+
+        Returns
+        -------
+        None.
+        """
+        if self.head is None:
+            self.head               = chunk.iloc[:self.numberOfHeadRows]
+            self.notAvailableCounts = pd.Series(0, index=chunk.columns)
+        elif len(self.head) < self.numberOfHeadRows:
+            self.head               = pd.concat([self.head, chunk.iloc[:self.numberOfHeadRows-len(self.head)]])
+
+        self.__UpdateDataTypes(chunk)
+        self.__UpdateReservoir(chunk)
+        self.__UpdateMoments(chunk)
+        self.__UpdateUniqueValues(chunk)
+
+        self.notAvailableCounts += chunk.isna().sum()
+        self.numberOfRows       += len(chunk)
+
+
+    def GetHead(self) -> pd.DataFrame:
+        """
+        Gets the first records.
+
+        Returns
+        -------
+        : pandas.DataFrame
+            The first records.
+        """
+        return self.head
+
+
+    def GetSample(self) -> pd.DataFrame:
+        """
+        Gets a random sample of records.
+
+        Returns
+        -------
+        : pandas.DataFrame
+            The records.  The index is the row numbers of the records.
+        """
+        return self.reservoir.sample(n=min(self.numberOfSamples, len(self.reservoir)), random_state=self.seed)
+
+
+    def GetDataTypes(self) -> pd.DataFrame:
+        """
+        Gets the data type and the number of entries that are not missing of each column.
+
+        Returns
+        -------
+        : pandas.DataFrame
+            The columns "Non-Null Count" and "Dtype" with one row for each column of the data.
+        """
+        dataTypes = pd.Series(self.dataTypes)
+        return pd.DataFrame({"Non-Null Count" : self.numberOfRows - self.notAvailableCounts, "Dtype" : dataTypes})
+
+
+    def Describe(self) -> pd.DataFrame:
+        """
+        Gets the summary statistics of the numeric columns.  The same as pandas.DataFrame.describe.
+
+        Returns
+        -------
+        : pandas.DataFrame
+            The statistics (rows) of each numeric column (columns).
+        """
+        columns   = [column for column, dataType in self.dataTypes.items() if self.__IsNumeric(dataType)]
+        moments   = self.moments.reindex(columns)
+        count     = moments["count"]
+        quantiles = self.reservoir[columns].astype(float).quantile([0.25, 0.5, 0.75])
+
+        return pd.DataFrame({
+            "count" : count,
+            "mean"  : moments["mean"].where(count > 0),
+            "std"   : np.sqrt(moments["m2"] / (count-1)).where(count > 1),
+            "min"   : moments["min"],
+            "25%"   : quantiles.loc[0.25],
+            "50%"   : quantiles.loc[0.5],
+            "75%"   : quantiles.loc[0.75],
+            "max"   : moments["max"]
+        }).T
+
+
+    def GetUniqueCounts(self) -> pd.Series:
+        """
+        Gets the number of distinct values (not including missing values) of each column.
+
+        Returns
+        -------
+        : pandas.Series
+            The counts.  See GetEstimatedColumns.
+        """
+        counts = {}
+        for column, values in self.uniqueValues.items():
+            counts[column] = len(values) if values is not None else int(round(self.uniqueEstimates[column].Count()))
+        return pd.Series(counts)
+
+
+    def GetEstimatedColumns(self) -> list:
+        """
+        Gets the columns that had too many distinct values to count exactly, so their unique counts are estimates.
+
+        Returns
+        -------
+        list
+        """
+        return [column for column, values in self.uniqueValues.items() if values is None]
+
+
+    def GetNotAvailableCounts(self) -> tuple[pd.Series, int]:
+        """
+        Gets the counts of any missing (not available) entries.
+
+        Returns
+        -------
+        notAvailableCounts, totalNotAvailable : pandas.Series, int
+            The counts of each column and the total.
+        """
+        return self.notAvailableCounts, int(self.notAvailableCounts.sum())
+
+
+    def __UpdateDataTypes(self, chunk:pd.DataFrame):
+        """
+        Merges the data types of a chunk.  Chunks can be read with different types, for example, a column of integers
+        becomes floats in a chunk that has missing values.
+        """
+        for column, dataType in chunk.dtypes.items():
+            current = self.dataTypes.get(column)
+            if current is None or current == dataType:
+                self.dataTypes[column] = dataType
+            elif self.__IsNumeric(current) and self.__IsNumeric(dataType):
+                self.dataTypes[column] = np.result_type(current, dataType)
+            else:
+                self.dataTypes[column] = np.dtype(object)
+
+
+    def __UpdateReservoir(self, chunk:pd.DataFrame):
+        """
+        Updates the random sample of rows (reservoir sampling).  Row i (counting from zero) replaces a random entry of
+        the full reservoir with the probability size/(i+1).
+        """
+        # Fill the reservoir.
+        fill = min(self.reservoirSize - (0 if self.reservoir is None else len(self.reservoir)), len(chunk))
+        if self.reservoir is None:
+            self.reservoir = chunk.iloc[:fill]
+        elif fill > 0:
+            self.reservoir = pd.concat([self.reservoir, chunk.iloc[:fill]])
+
+        rest = chunk.iloc[fill:]
+        if len(rest) == 0:
+            return
+
+        # Each row draws a position from zero to its row number.  If the position is in the reservoir, the row replaces
+        # the entry there.  Later rows replace earlier ones, as if the rows were processed one at a time.
+        rowNumbers = self.numberOfRows + fill + np.arange(len(rest))
+        positions  = (self.random.random(len(rest)) * (rowNumbers+1)).astype(np.int64)
+        selected   = np.flatnonzero(positions < self.reservoirSize)
+        if len(selected) == 0:
+            return
+
+        entries                      = np.arange(self.reservoirSize)
+        entries[positions[selected]] = self.reservoirSize + np.arange(len(selected))
+        self.reservoir               = pd.concat([self.reservoir, rest.iloc[selected]]).iloc[entries]
+
+
+    def __UpdateMoments(self, chunk:pd.DataFrame):
+        """
+        Merges the moments of the numeric columns of a chunk (the parallel algorithm of Chan et al.).
+        """
+        numeric  = chunk.select_dtypes(include="number").astype(float)
+        count    = numeric.count()
+        mean     = numeric.mean()
+        moments  = pd.DataFrame({
+            "count" : count,
+            "mean"  : mean,
+            "m2"    : ((numeric - mean)**2).sum(),
+            "min"   : numeric.min(),
+            "max"   : numeric.max()
+        })
+
+        columns  = self.moments.index.union(moments.index, sort=False)
+        a        = self.moments.reindex(columns)
+        b        = moments.reindex(columns)
+        a["count"] = a["count"].fillna(0)
+        b["count"] = b["count"].fillna(0)
+
+        total    = a["count"] + b["count"]
+        delta    = b["mean"].fillna(0) - a["mean"].fillna(0)
+        weight   = (b["count"] / total).fillna(0)
+
+        self.moments = pd.DataFrame({
+            "count" : total,
+            "mean"  : (a["mean"].fillna(0) + delta*weight).where(total > 0),
+            "m2"    : a["m2"].fillna(0) + b["m2"].fillna(0) + delta**2 * a["count"] * weight,
+            "min"   : np.fmin(a["min"], b["min"]),
+            "max"   : np.fmax(a["max"], b["max"])
+        })
+
+
+    def __UpdateUniqueValues(self, chunk:pd.DataFrame):
+        """
+        Adds the distinct values of each column of a chunk.
+        """
+        for column in chunk.columns:
+            values   = chunk[column].dropna().unique()
+            estimate = self.uniqueEstimates.setdefault(column, HyperLogLog())
+            estimate.Add(values)
+
+            uniqueValues = self.uniqueValues.setdefault(column, set())
+            if uniqueValues is not None:
+                uniqueValues.update(values.tolist())
+                if len(uniqueValues) > self.maximumUniqueValues:
+                    self.uniqueValues[column] = None
+
+
+    def __IsNumeric(self, dataType) -> bool:
+        """
+        Checks if a data type is included in the data summary (numeric, but not Boolean).
+        """
+        return pd.api.types.is_numeric_dtype(dataType) and not pd.api.types.is_bool_dtype(dataType)
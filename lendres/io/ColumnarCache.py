@@ -0,0 +1,592 @@
+"""
+Created on October 18, 2026
+@author: Lance A. Endres
+"""
+import numpy                                                         as np
+import pandas                                                        as pd
+import hashlib
+import json
+import os
+import shutil
+import uuid
+
+
+class ColumnarCache():
+    """
+    An on-disk cache of parsed data files (for example, large CSV files).
+
+    Each cached data set is stored in its own folder as one NumPy (.npy) file per column and a JSON manifest.  The
+    manifest records the source file's path, size, and modification time and the arguments used to read it.  If the
+    source file changes, the entry is out of date and the file is parsed again.
+
+    Numeric columns are memory mapped when they are loaded, so loading is nearly instant and only the parts of the data
+    that are used are read from disk.  The memory maps are copy on write: modifying a loaded data set does not change
+    the cache.  Text (object) and category columns are stored as integer codes and an array of their values, so no
+    pickled data is ever loaded, and are read into memory.  Data with other object values (for example, a column that
+    mixes numbers and text) is not cached.
+
+    The entries are found by the read arguments, so only arguments that can be written exactly (text, numbers, lists,
+    dictionaries, and data types) can be cached.  A file read with other arguments, for example a function for
+    "usecols," is always parsed.  See CanCache.
+
+    Files that are too large to read into memory can be cached with SaveCsv, which parses the file in chunks and appends
+    each chunk to the column files.
+
+    Saving an entry writes the columns to a new folder and then replaces the manifest, so the files of an earlier
+    version, which may be memory mapped by data sets that are still in use, are never written over.
+
+    Example:
+        cache     = ColumnarCache("cache")
+        dataFrame = cache.ReadCsv("run1.csv", usecols=["time", "speed"])
+    """
+
+
+    def __init__(self, directory:str):
+        """
+        Constructor.
+
+        Parameters
+        ----------
+        directory : str
+            The folder the cache is stored in.  It is created if it does not exist.
+
+        Returns
+        -------
+        None.
+        """
+        self.directory = directory
+        os.makedirs(directory, exist_ok=True)
+
+
+    def ReadCsv(self, path:str, **kwargs) -> pd.DataFrame:
+        """
+        Reads a CSV file from the cache or, if it is not cached or has changed, parses it and adds it to the cache.
+
+        Parameters
+        ----------
+        path : str
+            The path to the CSV file.
+        **kwargs : keyword arguments
+            Keyword arguments passed to pandas.read_csv.  Reading the same file with different arguments creates separate
+            entries.  If the arguments cannot be cached (see CanCache), the file is parsed every time.
+
+        Returns
+        -------
+        : pandas.DataFrame
+            The data.
+        """
+        if not self.CanCache(**kwargs):
+            return pd.read_csv(path, **kwargs)
+
+        dataFrame = self.Load(path, **kwargs)
+        if dataFrame is None:
+            dataFrame = pd.read_csv(path, **kwargs)
+            if self.CanSave(dataFrame):
+                self.Save(dataFrame, path, **kwargs)
+        return dataFrame
+
+
+    def CanCache(self, **kwargs) -> bool:
+        """
+        Checks if a file read with a set of arguments can be cached.  The arguments must be text, numbers, None, data
+        types, or lists, tuples, sets, and dictionaries of them.  Functions and other objects cannot be cached because
+        there is no way to tell if two of them give the same data.
+
+        Parameters
+        ----------
+        **kwargs : keyword arguments
+            The arguments the file is read with.
+
+        Returns
+        -------
+        bool
+        """
+        return self.__GetArgumentsKey(kwargs) is not None
+
+
+    def Load(self, path:str, **kwargs) -> pd.DataFrame | None:
+        """
+        Loads a data set from the cache.
+
+        Parameters
+        ----------
+        path : str
+            The path of the source file.
+        **kwargs : keyword arguments
+            The arguments the source file was read with.
+
+        Returns
+        -------
+        : pandas.DataFrame | None
+            The data or None if it is not in the cache or the source file has changed.
+        """
+        columns = self.LoadColumns(path, **kwargs)
+        if columns is None:
+            return None
+
+        dataFrame = pd.DataFrame(columns, copy=False)
+        index     = self.__ReadManifest(self.__GetEntryDirectory(path, kwargs))["index"]
+        if len(index) > 0:
+            dataFrame = dataFrame.set_index(index)
+        return dataFrame
+
+
+    def Contains(self, path:str, **kwargs) -> bool:
+        """
+        Checks if a data set is in the cache and the source file has not changed since it was cached.
+
+        Parameters
+        ----------
+        path : str
+            The path of the source file.
+        **kwargs : keyword arguments
+            The arguments the source file was read with.
+
+        Returns
+        -------
+        bool
+        """
+        manifest = self.__ReadManifest(self.__GetEntryDirectory(path, kwargs))
+        return manifest is not None and "folder" in manifest and manifest["source"] == self.__GetSourceStamp(path)
+
+
+    def LoadColumns(self, path:str, **kwargs) -> dict | None:
+        """
+        Loads the columns of a data set from the cache without combining them into a DataFrame.  The numeric columns
+        are memory mapped, so no data is read until it is used.
+
+        Parameters
+        ----------
+        path : str
+            The path of the source file.
+        **kwargs : keyword arguments
+            The arguments the source file was read with.
+
+        Returns
+        -------
+        : dict | None
+            The column names as keys and the columns (pandas.Series) as values, or None if the data set is not in the
+            cache or the source file has changed.  A stored index is returned as columns.
+        """
+        entry    = self.__GetEntryDirectory(path, kwargs)
+        manifest = self.__ReadManifest(entry)
+
+        # Entries written by earlier versions (without a data folder) are parsed again.
+        if manifest is None or "folder" not in manifest or manifest["source"] != self.__GetSourceStamp(path):
+            return None
+
+        folder  = os.path.join(entry, manifest["folder"])
+        columns = {}
+        try:
+            for i, (column, dtype) in enumerate(zip(manifest["columns"], manifest["dtypes"])):
+                file = os.path.join(folder, str(i) + ".npy")
+                if manifest["encoded"][i]:
+                    values = self.__Decode(np.load(file), np.load(os.path.join(folder, str(i) + ".values.npy")), dtype, manifest["ordered"][i])
+                else:
+                    # A plain array view of the memory map, so operations on the data return ordinary arrays.
+                    values = np.load(file, mmap_mode="c").view(np.ndarray)
+                columns[column] = pd.Series(values, copy=False) if str(values.dtype) == dtype else pd.Series(values).astype(dtype)
+        except FileNotFoundError:
+            # The entry was replaced while it was being read.
+            return None
+
+        return columns
+
+
+    def Save(self, dataFrame:pd.DataFrame, path:str, **kwargs):
+        """
+        Adds a data set to the cache.  An existing entry for the same source and arguments is replaced.
+
+        Parameters
+        ----------
+        dataFrame : pandas.DataFrame
+            The data read from the source file.
+        path : str
+            The path of the source file.
+        **kwargs : keyword arguments
+            The arguments the source file was read with.
+
+        Returns
+        -------
+        None.
+        """
+        if not self.CanSave(dataFrame):
+            raise Exception("The data has object values that are not text, so it cannot be cached.")
+
+        # The columns are stored, so an index that is not the default one is stored as columns.
+        index = []
+        if not isinstance(dataFrame.index, pd.RangeIndex):
+            index     = [f"level_{i}" if name is None else name for i, name in enumerate(dataFrame.index.names)]
+            dataFrame = dataFrame.rename_axis(index).reset_index()
+
+        # Each version of the entry is written to a new folder.
+        entry, folderName = self.__CreateFolder(path, kwargs)
+        folder            = os.path.join(entry, folderName)
+
+        encoded = []
+        ordered = []
+        for i, column in enumerate(dataFrame.columns):
+            file          = os.path.join(folder, str(i) + ".npy")
+            codes, values = self.__Encode(dataFrame[column])
+            if codes is None:
+                np.save(file, values, allow_pickle=False)
+            else:
+                np.save(file, codes, allow_pickle=False)
+                np.save(os.path.join(folder, str(i) + ".values.npy"), values, allow_pickle=False)
+            encoded.append(codes is not None)
+            ordered.append(isinstance(dataFrame[column].dtype, pd.CategoricalDtype) and bool(dataFrame[column].cat.ordered))
+
+        manifest = {
+            "path"      : os.path.abspath(path),
+            "source"    : self.__GetSourceStamp(path),
+            "arguments" : json.loads(self.__GetArgumentsKey(kwargs)),
+            "folder"    : folderName,
+            "columns"   : dataFrame.columns.tolist(),
+            "dtypes"    : [str(dtype) for dtype in dataFrame.dtypes],
+            "encoded"   : encoded,
+            "ordered"   : ordered,
+            "index"     : index
+        }
+        self.__WriteManifest(entry, folderName, manifest)
+
+
+    def SaveCsv(self, path:str, chunkSize:int=1000000, **kwargs):
+        """
+        Parses a CSV file into the cache in chunks, so the file never has to fit in memory.  Each chunk is appended to
+        the column files as it is read.  An existing entry for the same source and arguments is replaced.
+
+        The type of a column can change between chunks only if it stays numeric (for example, integers in the first
+        chunk and floats in a later one that has missing values).  Otherwise, supply the column's type with "dtype."
+
+        Parameters
+        ----------
+        path : str
+            The path of the source file.
+        chunkSize : int, optional
+            The number of rows read at a time. The default is 1000000.
+        **kwargs : keyword arguments
+            Keyword arguments passed to pandas.read_csv.  The "pyarrow" engine cannot read in chunks.
+
+        Returns
+        -------
+        None.
+        """
+        # The source is stamped before it is read, so a change made during the read makes the entry out of date.
+        source            = self.__GetSourceStamp(path)
+        entry, folderName = self.__CreateFolder(path, kwargs)
+        folder            = os.path.join(entry, folderName)
+
+        try:
+            columns = None
+            index   = []
+            with pd.read_csv(path, chunksize=chunkSize, **kwargs) as reader:
+                for chunk in reader:
+                    if not isinstance(chunk.index, pd.RangeIndex):
+                        index = [f"level_{i}" if name is None else name for i, name in enumerate(chunk.index.names)]
+                        chunk = chunk.rename_axis(index).reset_index()
+                    if columns is None:
+                        columns = [{"name" : name, "dtypes" : [], "segments" : [], "uniques" : {}} for name in chunk.columns]
+                    for i, column in enumerate(columns):
+                        self.__AppendChunk(column, chunk.iloc[:, i], os.path.join(folder, str(i) + ".part"))
+
+            # No chunks are read when no rows are requested, so the (empty) data is saved in one step.
+            if columns is None:
+                shutil.rmtree(folder, ignore_errors=True)
+                self.Save(pd.read_csv(path, **kwargs), path, **kwargs)
+                return
+
+            dtypes  = []
+            encoded = []
+            ordered = []
+            for i, column in enumerate(columns):
+                dtype, isEncoded, isOrdered = self.__FinishColumn(column, folder, i)
+                dtypes.append(dtype)
+                encoded.append(isEncoded)
+                ordered.append(isOrdered)
+        except Exception:
+            shutil.rmtree(folder, ignore_errors=True)
+            raise
+
+        manifest = {
+            "path"      : os.path.abspath(path),
+            "source"    : source,
+            "arguments" : json.loads(self.__GetArgumentsKey(kwargs)),
+            "folder"    : folderName,
+            "columns"   : [column["name"] for column in columns],
+            "dtypes"    : dtypes,
+            "encoded"   : encoded,
+            "ordered"   : ordered,
+            "index"     : index
+        }
+        self.__WriteManifest(entry, folderName, manifest)
+
+
+    def CanSave(self, dataFrame:pd.DataFrame) -> bool:
+        """
+        Checks if a data set can be cached.  Object columns must only contain text (or missing values) and category
+        columns must have text or numeric categories.
+
+        Parameters
+        ----------
+        dataFrame : pandas.DataFrame
+            The data.
+
+        Returns
+        -------
+        bool
+        """
+        if not isinstance(dataFrame.index, pd.RangeIndex):
+            dataFrame = dataFrame.reset_index()
+
+        for column in dataFrame.columns:
+            values = dataFrame[column]
+            if isinstance(values.dtype, pd.CategoricalDtype):
+                values = values.cat.categories
+            values = values.to_numpy()
+            if values.dtype.hasobject and pd.api.types.infer_dtype(values, skipna=True) not in ("string", "empty"):
+                return False
+        return True
+
+
+    def Clear(self):
+        """
+        Removes all the entries from the cache.
+
+        Returns
+        -------
+        None.
+        """
+        for name in os.listdir(self.directory):
+            entry = os.path.join(self.directory, name)
+            if os.path.isdir(entry):
+                shutil.rmtree(entry)
+
+
+    def __Encode(self, values:pd.Series) -> tuple[np.ndarray | None, np.ndarray]:
+        """
+        Converts a column to arrays that can be saved without pickling.  Object and category columns are returned as
+        codes (-1 for missing values) and their values.  Other columns are returned as (None, values).
+        """
+        if isinstance(values.dtype, pd.CategoricalDtype):
+            codes, uniques = values.cat.codes.to_numpy(), values.cat.categories
+        elif values.to_numpy().dtype.hasobject:
+            codes, uniques = pd.factorize(values)
+        else:
+            return None, values.to_numpy()
+
+        # Text is stored as fixed width unicode.
+        uniques = np.asarray(uniques)
+        uniques = np.array(uniques.tolist(), dtype=str) if uniques.dtype.hasobject else uniques
+        return np.asarray(codes, dtype=np.int64), uniques
+
+
+    def __Decode(self, codes:np.ndarray, uniques:np.ndarray, dtype:str, ordered:bool) -> np.ndarray | pd.Categorical:
+        """
+        Converts the codes and values of an object or category column back to the column's values.
+        """
+        if dtype == "category":
+            categories = uniques.tolist() if uniques.dtype.kind == "U" else uniques
+            return pd.Categorical.from_codes(codes, categories=categories, ordered=ordered)
+
+        # The last entry is the missing value, which is selected by the code -1.
+        return np.array(uniques.tolist() + [np.nan], dtype=object)[codes]
+
+
+    def __GetEntryDirectory(self, path:str, arguments:dict) -> str | None:
+        """
+        Gets the folder of the entry for a source file and the arguments it was read with.  Returns None if the
+        arguments cannot be cached.
+        """
+        key = self.__GetArgumentsKey(arguments)
+        if key is None:
+            return None
+        key = os.path.abspath(path) + "\n" + key
+        return os.path.join(self.directory, hashlib.sha1(key.encode("utf-8")).hexdigest())
+
+
+    def __GetArgumentsKey(self, arguments:dict) -> str | None:
+        """
+        Converts the read arguments to a string that is the same every time for the same arguments.  Returns None if an
+        argument cannot be written exactly.
+        """
+        try:
+            return json.dumps(self.__ToKeyValue(arguments))
+        except TypeError:
+            return None
+
+
+    def __ToKeyValue(self, value):
+        """
+        Converts an argument to values that JSON writes exactly.  Raises a TypeError for values that cannot be converted.
+        """
+        if value is None or isinstance(value, (str, bool, int, float)):
+            return value
+        if isinstance(value, np.generic):
+            return value.item()
+        if isinstance(value, (list, tuple)):
+            return [self.__ToKeyValue(item) for item in value]
+        if isinstance(value, (set, frozenset)):
+            return {"set" : sorted((self.__ToKeyValue(item) for item in value), key=json.dumps)}
+        if isinstance(value, dict):
+            # The keys are kept with their types (JSON only has text keys, so 0 and "0" would be the same).
+            return {"dict" : sorted(([self.__ToKeyValue(key), self.__ToKeyValue(item)] for key, item in value.items()), key=json.dumps)}
+        if isinstance(value, (np.dtype, pd.api.extensions.ExtensionDtype, type)):
+            return {"dtype" : str(pd.api.types.pandas_dtype(value))}
+        raise TypeError("The value cannot be used in a cache key.")
+
+
+    def __CreateFolder(self, path:str, arguments:dict) -> tuple[str, str]:
+        """
+        Creates a new folder for a version of an entry.  Returns the entry and the name of the folder.
+        """
+        entry = self.__GetEntryDirectory(path, arguments)
+        if entry is None:
+            raise Exception("The read arguments cannot be cached.  See ColumnarCache.CanCache.")
+        folderName = uuid.uuid4().hex
+        os.makedirs(os.path.join(entry, folderName))
+        return entry, folderName
+
+
+    def __WriteManifest(self, entry:str, folderName:str, manifest:dict):
+        """
+        Switches an entry to a new folder by writing its manifest and removes the earlier versions.
+        """
+        # Replacing the manifest switches the entry to the new folder in one step.
+        manifestFile  = os.path.join(entry, "manifest.json")
+        temporaryFile = os.path.join(entry, folderName + ".tmp")
+        with open(temporaryFile, "w") as file:
+            json.dump(manifest, file, indent=4)
+        os.replace(temporaryFile, manifestFile)
+
+        # Remove the earlier versions.  On Windows, files that are still memory mapped cannot be removed, so they are
+        # left for a later save.
+        for name in os.listdir(entry):
+            if name != folderName and os.path.isdir(os.path.join(entry, name)):
+                shutil.rmtree(os.path.join(entry, name), ignore_errors=True)
+
+
+    def __AppendChunk(self, column:dict, values:pd.Series, file:str):
+        """
+        Appends a chunk of a column to the column's data file.  Text and category chunks are appended as codes into the
+        values of all the chunks read so far.
+        """
+        if isinstance(values.dtype, pd.CategoricalDtype):
+            codes, uniques = values.cat.codes.to_numpy(), values.cat.categories
+        elif values.to_numpy().dtype.hasobject:
+            codes, uniques = pd.factorize(values)
+        else:
+            codes, uniques = None, None
+
+        if uniques is not None:
+            uniques = np.asarray(uniques)
+            if uniques.dtype.hasobject and pd.api.types.infer_dtype(uniques, skipna=True) not in ("string", "empty"):
+                raise Exception("The data has object values that are not text, so it cannot be cached.")
+
+            # The last entry maps the missing value code (-1) to itself.
+            allUniques = column["uniques"]
+            mapping    = np.array([allUniques.setdefault(value, len(allUniques)) for value in uniques.tolist()] + [-1], dtype=np.int64)
+            data       = mapping[np.asarray(codes)]
+        else:
+            data       = values.to_numpy()
+
+        # A chunk where a text column only has missing values is read as floats.  Those chunks are stored as missing
+        # value codes.
+        isEncoded = codes is not None
+        dtype     = values.dtype
+        segments  = column["segments"]
+        if len(segments) > 0 and isEncoded != segments[0][0]:
+            if isEncoded and all(segment[3] for segment in segments):
+                with open(file, "wb") as output:
+                    for segment in segments:
+                        np.full(segment[2], -1, dtype=np.int64).tofile(output)
+                column["dtypes"]   = [dtype] * len(segments)
+                column["segments"] = segments = [(True, np.dtype(np.int64), segment[2], True) for segment in segments]
+            elif not isEncoded and values.isna().all():
+                isEncoded = True
+                dtype     = column["dtypes"][0]
+                data      = np.full(len(data), -1, dtype=np.int64)
+            else:
+                raise Exception(f"The type of the column \"{column['name']}\" changes between chunks.  Supply its type with \"dtype.\"")
+
+        column["dtypes"].append(dtype)
+        segments.append((isEncoded, data.dtype, len(data), not isEncoded and bool(values.isna().all())))
+        with open(file, "ab") as output:
+            data.tofile(output)
+
+
+    def __FinishColumn(self, column:dict, folder:str, i:int) -> tuple[str, bool, bool]:
+        """
+        Converts the data file of a column written by SaveCsv to a NumPy file.  Returns the column's type, if it is
+        encoded, and if its categories are ordered.
+        """
+        dtypes    = column["dtypes"]
+        segments  = column["segments"]
+        isEncoded = segments[0][0]
+        same      = all(dtype == dtypes[0] for dtype in dtypes)
+        ordered   = same and isinstance(dtypes[0], pd.CategoricalDtype) and bool(dtypes[0].ordered)
+        mapping   = None
+
+        if isEncoded:
+            outputType = np.dtype(np.int64)
+            dtype      = "category" if isinstance(dtypes[0], pd.CategoricalDtype) else str(dtypes[0]) if same else "object"
+            uniques    = list(column["uniques"].keys())
+
+            # Categories that differ between chunks are sorted, as pandas does when it reads a file in one step.
+            if dtype == "category" and not same:
+                order          = np.argsort(np.array(uniques), kind="stable")
+                uniques        = [uniques[j] for j in order]
+                mapping        = np.empty(len(order) + 1, dtype=np.int64)
+                mapping[order] = np.arange(len(order))
+                mapping[-1]    = -1
+
+            uniques = np.array(uniques)
+            uniques = np.array(uniques.tolist(), dtype=str) if uniques.dtype.hasobject else uniques
+            np.save(os.path.join(folder, str(i) + ".values.npy"), uniques, allow_pickle=False)
+        else:
+            try:
+                outputType = np.result_type(*[segment[1] for segment in segments])
+            except TypeError:
+                raise Exception(f"The type of the column \"{column['name']}\" changes between chunks.  Supply its type with \"dtype.\"")
+            dtype = str(dtypes[0]) if same else str(outputType)
+
+        # Copy the chunks into the NumPy file one at a time, converting them to the type of the column.
+        partFile = os.path.join(folder, str(i) + ".part")
+        file     = os.path.join(folder, str(i) + ".npy")
+        length   = sum(segment[2] for segment in segments)
+        if length == 0:
+            np.save(file, np.empty(0, dtype=outputType), allow_pickle=False)
+        else:
+            output = np.lib.format.open_memmap(file, mode="w+", dtype=outputType, shape=(length,))
+            start  = 0
+            offset = 0
+            for encoded, segmentType, count, missing in segments:
+                data = np.fromfile(partFile, dtype=segmentType, count=count, offset=offset)
+                output[start:start+count] = data if mapping is None else mapping[data]
+                start  += count
+                offset += count * segmentType.itemsize
+            output.flush()
+            del output
+
+        os.remove(partFile)
+        return dtype, isEncoded, ordered
+
+
+    def __GetSourceStamp(self, path:str) -> dict:
+        """
+        Gets the size and modification time of the source file.  If either changes, the cache entry is out of date.
+        """
+        status = os.stat(path)
+        return {"size" : status.st_size, "mtime" : status.st_mtime_ns}
+
+
+    def __ReadManifest(self, entry:str | None) -> dict | None:
+        """
+        Reads the manifest of an entry.  Returns None if the entry does not exist.
+        """
+        if entry is None:
+            return None
+        manifestFile = os.path.join(entry, "manifest.json")
+        if not os.path.exists(manifestFile):
+            return None
+        with open(manifestFile, "r") as file:
+            return json.load(file)
@@ -0,0 +1,111 @@
+"""
+Created on October 18, 2026
+@author: Lance A. Endres
+"""
+import numpy                                                         as np
+
+
+class Decimation():
+    """
+    Reduces long signals to a small number of values that preserve their extremes.
+    """
+
+
+    @classmethod
+    def MinMaxEnvelope(cls, y, blockSize:int) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Splits a signal into blocks and gets the minimum and maximum of each block.
+
+        Parameters
+        ----------
+        y : array like
+            The signal.
+        blockSize : int
+            The number of samples in a block.  The last block can be shorter.
+
+        Returns
+        -------
+        minimums, maximums : np.ndarray, np.ndarray
+            The minimum and maximum of each block.
+        """
+        y               = np.asarray(y)
+        blockSize       = max(int(blockSize), 1)
+        numberOfFull    = len(y) // blockSize
+
+        # The full blocks are reshaped so the reductions run in a single NumPy call.  The partial block is added after.
+        full            = y[:numberOfFull*blockSize].reshape(numberOfFull, blockSize)
+        minimums        = full.min(axis=1) if numberOfFull > 0 else np.zeros(0)
+        maximums        = full.max(axis=1) if numberOfFull > 0 else np.zeros(0)
+
+        if numberOfFull*blockSize < len(y):
+            remainder   = y[numberOfFull*blockSize:]
+            minimums    = np.append(minimums, remainder.min())
+            maximums    = np.append(maximums, remainder.max())
+
+        return minimums, maximums
+
+
+    @classmethod
+    def MinMaxIndices(cls, y, numberOfBuckets:int, x=None) -> np.ndarray:
+        """
+        Gets the indices of the samples that preserve the shape of a signal when it is drawn with a limited resolution
+        (for example, a plot that is a few thousand pixels wide).
+
+        The signal is split into buckets and the minimum and maximum of each bucket are kept, along with the first and
+        last samples.  Drawing a line through the kept samples gives the same picture as drawing every sample when there
+        is one bucket per pixel, so peaks are never lost.
+
+        Parameters
+        ----------
+        y : array like
+            The signal.
+        numberOfBuckets : int
+            The number of buckets (usually the width of the plot in pixels).
+        x : array like, optional
+            The independent values of the signal, sorted in ascending order.  If supplied, the buckets have equal widths
+            in x (so uneven sampling is handled), otherwise they have equal numbers of samples. The default is None.
+
+        Returns
+        -------
+        : np.ndarray
+            The indices of the kept samples in ascending order.  At most 2*numberOfBuckets+2 indices are returned.
+        """
+        y               = np.asarray(y, dtype=float)
+        length          = len(y)
+        numberOfBuckets = max(int(numberOfBuckets), 1)
+
+        if length <= 2*numberOfBuckets + 2:
+            return np.arange(length)
+
+        if x is None:
+            starts = np.linspace(0, length, numberOfBuckets+1).astype(np.int64)[:-1]
+        else:
+            x      = np.asarray(x, dtype=float)
+            edges  = np.linspace(x[0], x[-1], numberOfBuckets+1)[:-1]
+            starts = np.searchsorted(x, edges, side="left")
+
+        # Buckets with no samples (possible for uneven sampling) are removed.
+        starts          = np.unique(starts)
+        ends            = np.append(starts[1:], length)
+
+        # The buckets are processed in groups of about blockSize samples, so the temporary arrays are no longer than a
+        # group (or a single bucket, if it is larger).
+        blockSize       = 2**20
+        groups          = np.unique(np.searchsorted(starts, np.arange(0, length, blockSize), side="right") - 1)
+        groupEnds       = np.append(groups[1:], len(starts))
+
+        indices         = [np.array([0, length-1])]
+        for first, last in zip(groups, groupEnds):
+            segment     = y[starts[first]:ends[last-1]]
+            localStarts = starts[first:last] - starts[first]
+            counts      = ends[first:last] - starts[first:last]
+            bucket      = np.repeat(np.arange(len(localStarts)), counts)
+
+            # The reductions ignore NaN values.  The first sample of each bucket equal to the extreme is used.
+            for reduction in (np.fmin, np.fmax):
+                extremes = np.repeat(reduction.reduceat(segment, localStarts), counts)
+                matches  = np.flatnonzero(segment == extremes)
+                firsts   = np.unique(bucket[matches], return_index=True)[1]
+                indices.append(matches[firsts] + starts[first])
+
+        return np.unique(np.concatenate(indices))
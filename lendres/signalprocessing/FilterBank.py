@@ -0,0 +1,194 @@
+"""
+Created on October 18, 2026
+@author: Lance A. Endres
+"""
+import numpy                                                         as np
+import pandas                                                        as pd
+import scipy.signal
+
+
+class FilterBank():
+    """
+    A set of digital (Butterworth) filters that can be applied to a signal that arrives in chunks.
+
+    The filters are stored as second-order sections, which are numerically stable for high orders and low cutoff
+    frequencies.  The state of every filter is kept between calls, so filtering a signal chunk by chunk gives the same
+    result as filtering it all at once.  All the channels of a chunk are filtered in one vectorized call.
+
+    Example:
+        filterBank = FilterBank(sampleRate=1000, independentColumn="time")
+        filterBank.AddFilter("low", "lowpass", 50)
+        filterBank.AddFilter("band", "bandpass", (10, 100))
+        for filtered in filterBank.Stream(pd.read_csv(file, chunksize=100000), "low"):
+            ...
+    """
+
+
+    def __init__(self, sampleRate:float, independentColumn:str=None, initialCondition:str="steady"):
+        """
+        Constructor.
+
+        Parameters
+        ----------
+        sampleRate : float
+            The number of samples per unit of time.
+        independentColumn : str, optional
+            The column of a DataFrame that is not filtered (for example, time). The default is None.
+        initialCondition : str, optional
+            The state of the filters at the start of a signal.
+                steady : The filter starts as if the first sample had always been the input.  This avoids a jump at the start.
+                zero : The filter starts at rest (scipy.signal.sosfilt's default).
+            The default is "steady".
+
+        Returns
+        -------
+        None.
+        """
+        if initialCondition not in ["steady", "zero"]:
+            raise Exception("The 'initialCondition' parameter is not valid.")
+
+        self.sampleRate        = sampleRate
+        self.independentColumn = independentColumn
+        self.initialCondition  = initialCondition
+
+        self.filters           = {}
+        self.states            = {}
+
+
+    @property
+    def Names(self) -> list:
+        """
+        Gets the names of the filters.
+
+        Returns
+        -------
+        list
+        """
+        return list(self.filters.keys())
+
+
+    def AddFilter(self, name:str, filterType:str, cutoff:float|tuple, order:int=4):
+        """
+        Adds a Butterworth filter.
+
+        Parameters
+        ----------
+        name : str
+            The name used to refer to the filter.
+        filterType : str
+            The type of filter.
+                lowpass : Passes frequencies below the cutoff.
+                highpass : Passes frequencies above the cutoff.
+                bandpass : Passes frequencies between the two cutoffs.
+                bandstop : Removes frequencies between the two cutoffs.
+        cutoff : float | tuple
+            The cutoff frequency (in the units of the sample rate).  A tuple of the low and high frequencies for the band filters.
+        order : int, optional
+            The order of the filter. The default is 4.
+
+        Returns
+        -------
+        None.
+        """
+        match filterType:
+            case "lowpass" | "highpass" | "bandpass" | "bandstop":
+                self.filters[name] = scipy.signal.butter(order, cutoff, btype=filterType, fs=self.sampleRate, output="sos")
+            case _:
+                raise Exception("The 'filterType' parameter is not valid.")
+
+        self.states.pop(name, None)
+
+
+    def Reset(self, name:str=None):
+        """
+        Clears the state of the filters so a new signal can be filtered.
+
+        Parameters
+        ----------
+        name : str, optional
+            The filter to reset.  If None, all the filters are reset. The default is None.
+
+        Returns
+        -------
+        None.
+        """
+        if name is None:
+            self.states.clear()
+        else:
+            self.states.pop(name, None)
+
+
+    def Process(self, chunk:pd.DataFrame|np.ndarray, name:str=None) -> pd.DataFrame | np.ndarray | dict:
+        """
+        Filters the next chunk of a signal.
+
+        Parameters
+        ----------
+        chunk : pd.DataFrame | np.ndarray
+            The next samples.  For an array, each column is a channel.  For a DataFrame, every column except the
+            independent column is filtered.
+        name : str, optional
+            The filter to apply.  If None, all the filters are applied. The default is None.
+
+        Returns
+        -------
+        : pd.DataFrame | np.ndarray | dict
+            The filtered chunk (the same type and shape as the input) or, if no name was supplied, a dictionary with the
+            filter names as keys and the filtered chunks as values.
+        """
+        if name is None:
+            return {filterName : self.Process(chunk, filterName) for filterName in self.filters}
+
+        if isinstance(chunk, pd.DataFrame):
+            columns  = [column for column in chunk.columns if column != self.independentColumn]
+            filtered = chunk.copy()
+            filtered[columns] = self.__Filter(name, chunk[columns].to_numpy(dtype=float))
+            return filtered
+
+        values   = np.asarray(chunk, dtype=float)
+        filtered = self.__Filter(name, values.reshape(len(values), -1))
+        return filtered.reshape(values.shape)
+
+
+    def Stream(self, chunks, name:str=None):
+        """
+        Filters a sequence of chunks (for example, a chunked CSV reader) as they are needed.
+
+        Parameters
+        ----------
+        chunks : iterable
+            The chunks of the signal.  See Process.
+        name : str, optional
+            The filter to apply.  If None, all the filters are applied.  See Process. The default is None.
+
+        Yields
+        ------
+        : pd.DataFrame | np.ndarray | dict
+            The filtered chunks.
+        """
+        for chunk in chunks:
+            yield self.Process(chunk, name)
+
+
+    def __Filter(self, name:str, values:np.ndarray) -> np.ndarray:
+        """
+        Filters a 2-D block (samples, channels) and updates the state of the filter.
+        """
+        sos   = self.filters[name]
+        state = self.states.get(name)
+
+        if state is not None and state.shape[2] != values.shape[1]:
+            raise Exception("The number of channels changed.  Call Reset to filter a new signal.")
+
+        # The state is created from the first sample, so it is not created until a chunk with samples arrives.
+        if len(values) == 0:
+            return values.astype(float)
+
+        if state is None:
+            # The state has the shape (sections, 2, channels).
+            state = np.zeros((len(sos), 2, values.shape[1]))
+            if self.initialCondition == "steady":
+                state = scipy.signal.sosfilt_zi(sos)[:, :, None] * values[0][None, None, :]
+
+        filtered, self.states[name] = scipy.signal.sosfilt(sos, values, axis=0, zi=state)
+        return filtered
@@ -3,7 +3,14 @@ Created on March 23, 2024
 @author: lance.endres
 """
 from   scipy.signal                                                  import find_peaks
-import heapq
+from   scipy.signal                                                  import peak_prominences
+import numpy                                                         as np
+import pandas                                                        as pd
+import os
+from   concurrent.futures                                            import ThreadPoolExecutor
+from   concurrent.futures                                            import ProcessPoolExecutor
+
+from   lendres.signalprocessing.Decimation                           import Decimation
 
 
 class SignalProcessing():
@@ -34,15 +41,333 @@ class SignalProcessing():
         largestPeaksIndices, largestYValues : list, list
             The indices of the largest peaks and the largest peaks.
         """
-        # Create default arguments, then override/update with any specified arguments.
+        largestPeaksIndices, largestLocalHeights = self.__GetLargestPeaks(y, number, sortBy, kwargs)
+
+        # Extract the y (absolute heights) from the sorted results.
+        largestPeaksIndices = largestPeaksIndices.tolist()
+        largestYValues      = y[largestPeaksIndices]
+
+        return largestPeaksIndices, largestYValues
+
+
+    @classmethod
+    def GetPeaksDecimated(self, y, number:int=6, sortBy:str="localheight", wlen:int=None, blockSize:int=None, **kwargs) -> tuple[list, list]:
+        """
+        Finds the largest 'peaks' of a very long signal.  Returns the same peaks as GetPeaks, but only searches the
+        parts of the signal that can contain them.
+
+        The signal is reduced to the minimum and maximum of each block of samples.  From these, an upper limit of the
+        prominence (or height) of any peak in each block is calculated.  Blocks are then searched exactly, starting
+        with the highest limit, until the requested number of peaks is found and no block that was not searched can
+        contain a larger peak.
+
+        Each block is searched with enough of the surrounding signal (wlen/2 + distance samples, more if required) that
+        the peaks, the distance selection, and the prominences are the same as for the whole signal.  The results are the
+        same as GetPeaks called with the same "wlen" when:
+            - The "height," "distance," and "prominence" arguments, if used, are single numbers.
+            - No two peaks within "distance" of each other have exactly the same height.  See StreamingPeakDetector.
+
+        Parameters
+        ----------
+        y : sequence
+            A signal with peaks.
+        number : int optional
+            The number of peaks to return. The default is 6.
+        sortBy : str, optional
+            The method used to sort the peaks.  See GetPeaks. The default is "localheight".
+        wlen : int
+            The window length, in samples, used to calculate the prominences.  Required, because without it the
+            prominence of a peak depends on the entire signal.
+        blockSize : int, optional
+            The number of samples in a block.  Smaller blocks give tighter limits, but more blocks to check.  If None,
+            wlen/16 (but at least 32) is used. The default is None.
+        **kwargs : keyword arguments
+            Keyword arguments passed to the 'find_peaks' algorithm.
+
+        Returns
+        -------
+        largestPeaksIndices, largestYValues : list, list
+            The indices of the largest peaks and the largest peaks.
+        """
+        if wlen is None or wlen <= 1:
+            raise Exception("The window length (wlen) must be greater than 1.")
+
+        if number == "all":
+            return self.GetPeaks(y, number, sortBy, wlen=wlen, **kwargs)
+
         arguments = {"distance" : 4, "prominence" : 0.1}
         arguments.update(kwargs)
+        arguments["wlen"] = int(np.ceil(wlen))
+
+        halfWindow = arguments["wlen"] // 2
+        blockSize  = max(halfWindow//8, 32) if blockSize is None else int(blockSize)
+        x          = np.asarray(y, dtype=float)
+
+        # Upper limits of the sort values of the peaks in each block.  A peak's prominence is its height less the
+        # higher of the lowest points on either side within wlen/2.  The lowest block minimums covering those ranges
+        # are lower than (or equal to) the lowest points, so they give an upper limit.
+        minimums, maximums = Decimation.MinMaxEnvelope(x, blockSize)
+        reach              = int(np.ceil(halfWindow / blockSize))
+        padded             = np.pad(minimums, reach, mode="edge")
+        windows            = np.lib.stride_tricks.sliding_window_view(padded, reach+1).min(axis=1)
+        prominenceLimits   = maximums - np.maximum(windows[:len(minimums)], windows[reach:])
+
+        match sortBy:
+            case "localheight":
+                limits = prominenceLimits.copy()
+            case "globalheight":
+                limits = maximums.copy()
+            case _:
+                raise Exception("The 'sortBy' parameter is not valid.")
+
+        # Blocks that cannot contain a peak that passes the filters are never searched.
+        if arguments.get("prominence") is not None:
+            limits[prominenceLimits < arguments["prominence"]] = -np.inf
+        if arguments.get("height") is not None:
+            limits[maximums < arguments["height"]] = -np.inf
+
+        order      = np.argsort(limits, kind="stable")[::-1]
+        order      = order[limits[order] > -np.inf]
+
+        peaks      = []
+        sortValues = []
+        position   = 0
+        batchSize  = max(number, 16)
+
+        while position < len(order):
+            # Stop when enough peaks are found and the next block cannot contain a larger one.
+            found = np.concatenate(sortValues) if sortValues else np.zeros(0)
+            if number <= len(found) and np.partition(found, len(found)-number)[len(found)-number] > limits[order[position]]:
+                break
+
+            # Adjacent blocks are searched together.
+            blocks    = np.sort(order[position:position+batchSize])
+            position += batchSize
+            batchSize *= 2
+
+            for run in np.split(blocks, np.flatnonzero(np.diff(blocks) > 1) + 1):
+                runPeaks, runProminences = self.__GetPeaksInRange(x, run[0]*blockSize, min((run[-1]+1)*blockSize, len(x)), arguments)
+                peaks.append(runPeaks)
+                sortValues.append(runProminences if sortBy == "localheight" else x[runPeaks])
+
+        peaks      = np.concatenate(peaks) if peaks else np.zeros(0, dtype=np.int64)
+        sortValues = np.concatenate(sortValues) if sortValues else np.zeros(0)
+
+        largest             = self.__GetLargest(sortValues, peaks, number)
+        largestPeaksIndices = peaks[largest].tolist()
+        largestYValues      = y[largestPeaksIndices]
+
+        return largestPeaksIndices, largestYValues
+
+
+    @classmethod
+    def SelectByPeakDistance(cls, positions:np.ndarray, heights:np.ndarray, distance:int, undecided:np.ndarray=None) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Selects peaks so that no two are closer than a distance.  This is the same selection as the "distance" argument
+        of find_peaks: the highest peak is kept and all the peaks closer than "distance" to it are removed, then the
+        next highest remaining peak is kept, and so on.  For equal heights, the later peak is kept.
+
+        The selection can be made on part of a signal.  Whether a peak is kept only depends on the higher peaks within
+        "distance" of it.  Peaks that could be affected by peaks outside of the part are marked as undecided by the caller
+        and any peak that depends on an undecided peak is also marked as undecided.  The results for the other peaks are
+        the same as for the whole signal.
+
+        Parameters
+        ----------
+        positions : np.ndarray
+            The indices of the peaks in ascending order.
+        heights : np.ndarray
+            The heights of the peaks.
+        distance : int
+            The minimum distance between peaks.
+        undecided : np.ndarray, optional
+            True for the peaks whose result could be changed by peaks that are not included. The default is None.
+
+        Returns
+        -------
+        kept, undecided : np.ndarray, np.ndarray
+            True for the kept peaks and True for the peaks whose results are not final.
+        """
+        count     = len(positions)
+        kept      = np.ones(count, dtype=bool)
+        undecided = np.zeros(count, dtype=bool) if undecided is None else np.array(undecided, dtype=bool)
+
+        if distance <= 1 or count < 2:
+            return kept, undecided
+
+        # Only peaks that have a neighbor within "distance" can be removed or be affected by other peaks.
+        close       = np.diff(positions) < distance
+        linked      = np.zeros(count, dtype=bool)
+        linked[:-1] = close
+        linked[1:] |= close
+
+        # Process the peaks from highest to lowest.  For equal heights, the later peak is first.  A peak is removed
+        # if a higher peak within "distance" is kept.  It is undecided if any higher peak within "distance" is undecided.
+        order         = np.lexsort((positions, heights))[::-1]
+        order         = order[linked[order]].tolist()
+        positionsList = np.asarray(positions).tolist()
+        keptList      = kept.tolist()
+        undecidedList = undecided.tolist()
+        processed     = [False]*count
+
+        for j in order:
+            position = positionsList[j]
+            for step in (-1, 1):
+                k = j + step
+                while 0 <= k < count and abs(position - positionsList[k]) < distance:
+                    if processed[k]:
+                        if keptList[k]:
+                            keptList[j] = False
+                        if undecidedList[k]:
+                            undecidedList[j] = True
+                    k += step
+            processed[j] = True
+
+        return np.array(keptList, dtype=bool), np.array(undecidedList, dtype=bool)
+
+
+    @classmethod
+    def GetPeaksForChannels(
+            cls,
+            data:         pd.DataFrame | np.ndarray,
+            number:       int | str                    = 6,
+            sortBy:       str                          = "localheight",
+            executorType: str                          = "thread",
+            maxWorkers:   int                          = None,
+            **kwargs
+        ) -> pd.DataFrame:
+        """
+        Finds the 'peaks' of every channel (column) of a data set.  See GetPeaks.
+
+        The channels are processed in parallel and the results are returned in one table instead of a pair of lists
+        for each channel.
+
+        Parameters
+        ----------
+        data : pd.DataFrame | np.ndarray
+            The signals.  Each column is a channel.  A 1-D array is treated as a single channel.
+        number : int|str optional
+            The number of peaks to return for each channel or 'all'. The default is 6.
+        sortBy : str, optional
+            The method used to sort the peaks of each channel.  See GetPeaks. The default is "localheight".
+        executorType : str, optional
+            How the channels are processed in parallel.
+                thread  : A pool of threads.  Best for a moderate number of channels as the data is not copied.
+                process : A pool of processes.  Each channel is copied to a process.
+            The default is "thread".
+        maxWorkers : int, optional
+            The number of threads or processes.  If None, the number of processors is used.  If 1, the channels are
+            processed one after the other without a pool. The default is None.
+        **kwargs : keyword arguments
+            Keyword arguments passed to the 'find_peaks' algorithm.
+
+        Returns
+        -------
+        : pd.DataFrame
+            A table with the columns "Channel," "Index," "Height," and "Prominence."  Each channel has one row per peak
+            in the order of "sortBy."  "Channel" is the column name for a DataFrame and the column number for an array.
+        """
+        if isinstance(data, pd.DataFrame):
+            channels = data.columns.tolist()
+            signals  = [data[channel].to_numpy() for channel in channels]
+        else:
+            data     = np.asarray(data)
+            data     = data.reshape(-1, 1) if data.ndim == 1 else data
+            channels = list(range(data.shape[1]))
+            signals  = [data[:, i] for i in range(data.shape[1])]
+
+        if maxWorkers is None:
+            maxWorkers = os.cpu_count() or 1
+
+        arguments = (signals, [number]*len(signals), [sortBy]*len(signals), [kwargs]*len(signals))
+
+        if maxWorkers == 1 or len(signals) < 2:
+            results = list(map(cls._GetChannelPeaks, *arguments))
+        else:
+            match executorType:
+                case "thread":
+                    executorClass = ThreadPoolExecutor
+                case "process":
+                    executorClass = ProcessPoolExecutor
+                case _:
+                    raise Exception("The 'executorType' parameter is not valid.")
+
+            with executorClass(max_workers=maxWorkers) as executor:
+                results = list(executor.map(cls._GetChannelPeaks, *arguments))
+
+        counts = [len(result[0]) for result in results]
+        return pd.DataFrame({
+            "Channel"    : np.repeat(np.array(channels, dtype=object), counts),
+            "Index"      : np.concatenate([result[0] for result in results]).astype(np.int64),
+            "Height"     : np.concatenate([result[1] for result in results]).astype(float),
+            "Prominence" : np.concatenate([result[2] for result in results]).astype(float)
+        })
+
+
+    @classmethod
+    def _GetChannelPeaks(cls, y:np.ndarray, number:int|str, sortBy:str, arguments:dict) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Finds the peaks of one channel.  This is the function run by the worker processes, so it must be accessible
+        by name (not private).
+        """
+        indices, localHeights = cls.__GetLargestPeaks(y, number, sortBy, arguments)
+        return indices, y[indices], localHeights
+
+
+    @classmethod
+    def __GetPeaksInRange(cls, x:np.ndarray, start:int, stop:int, arguments:dict) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Finds the peaks (with the same results as for the whole signal) in x[start:stop] and their prominences.
+        """
+        distance = 1 if arguments.get("distance") is None else int(np.ceil(arguments["distance"]))
+        margin   = arguments["wlen"]//2 + distance
+
+        while True:
+            segmentStart = max(start-margin, 0)
+            segmentStop  = min(stop+margin, len(x))
+            segment      = x[segmentStart:segmentStop]
+
+            # A flat run at a cut end of the segment can hide a peak (a plateau is only a peak if the signal falls after
+            # it).  Peaks not found could also affect the distance selection of the peaks within "distance."  Nothing is
+            # hidden at the ends of the signal.
+            changes      = np.flatnonzero(np.diff(segment) != 0)
+            leftHidden   = -distance if segmentStart == 0 else (changes[0] if len(changes) > 0 else len(segment))
+            rightHidden  = len(segment)+distance if segmentStop == len(x) else (changes[-1]+1 if len(changes) > 0 else -1)
+
+            localMaxima, properties = find_peaks(segment, height=arguments.get("height"))
+            undecided               = (localMaxima < leftHidden + distance) | (localMaxima > rightHidden - distance)
+            kept, undecided         = cls.SelectByPeakDistance(localMaxima, segment[localMaxima], distance, undecided)
+
+            inside = (localMaxima >= start-segmentStart) & (localMaxima < stop-segmentStart)
+            if segmentStart + leftHidden < start and segmentStart + rightHidden >= stop and not np.any(undecided & inside):
+                break
+            margin *= 2
+
+        peaks       = localMaxima[kept & inside]
+        prominences = peak_prominences(segment, peaks, wlen=arguments["wlen"])[0]
+
+        if arguments.get("prominence") is not None:
+            keep        = prominences >= arguments["prominence"]
+            peaks       = peaks[keep]
+            prominences = prominences[keep]
+
+        return peaks + segmentStart, prominences
+
+
+    @classmethod
+    def __GetLargestPeaks(cls, y, number:int|str, sortBy:str, arguments:dict) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Finds the peaks and returns the indices and local heights (prominences) of the largest ones.
+        """
+        # Create default arguments, then override/update with any specified arguments.
+        findPeaksArguments = {"distance" : 4, "prominence" : 0.1}
+        findPeaksArguments.update(arguments)
 
         # We find the peaks.
         # The distance argument is provided to group values that are extremely close together.  I.e., a shallow slow with small local peaks is not of interest.
         # The height argument is provided only to get the algorithm to return the relative peak prominences.  The relative heights/prominences are used as an 'importance' factor in sorting.
         # The indices of the peaks are the first firsted value from find_peaks.
-        peakResults  = find_peaks(y, **arguments)
+        peakResults  = find_peaks(y, **findPeaksArguments)
 
         # Extract the top values from the results.  The prominances are the local heights and the first entry returned in peakResults are the y values.
         # The output of find_peaks is [[y_values], dict{}]
@@ -57,14 +382,29 @@ class SignalProcessing():
         # The top values are defined as those with the largest local peak height.
         match sortBy:
             case "localheight":
-                largestPeaks = heapq.nlargest(number, zip(localHeights, peakIndices))
+                sortValues = localHeights
             case "globalheight":
-                largestPeaks = heapq.nlargest(number, zip(y[peakIndices], peakIndices))
+                sortValues = np.asarray(y[peakIndices])
             case _:
                 raise Exception("The 'sortBy' parameter is not valid.")
 
-        # Extract the y (absolute heights) from the sorted results.
-        largestPeaksIndices = [peakCouple[1] for peakCouple in largestPeaks]
-        largestYValues      = y[largestPeaksIndices]
+        largest = cls.__GetLargest(sortValues, peakIndices, number)
+        return peakIndices[largest], localHeights[largest]
+
+
+    @classmethod
+    def __GetLargest(cls, values:np.ndarray, indices:np.ndarray, number:int) -> np.ndarray:
+        """
+        Gets the positions of the largest values, largest first.  Equal values are ordered by the largest index first.
+        """
+        number = max(min(number, len(values)), 0)
+        if number == 0:
+            return np.zeros(0, dtype=np.int64)
+
+        # Only the values that can be in the result are sorted.  Every value equal to the smallest of them is included so
+        # that the ties are broken by index, not by the order argpartition leaves them in.
+        smallest   = values[np.argpartition(values, len(values)-number)[len(values)-number]]
+        candidates = np.flatnonzero(values >= smallest)
+        order      = np.lexsort((indices[candidates], values[candidates]))[::-1]
 
-        return largestPeaksIndices, largestYValues
\ No newline at end of file
+        return candidates[order[:number]]
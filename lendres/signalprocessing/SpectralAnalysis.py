@@ -0,0 +1,292 @@
+"""
+Created on October 18, 2026
+@author: Lance A. Endres
+"""
+import numpy                                                         as np
+import pandas                                                        as pd
+import scipy.fft
+import scipy.signal
+import functools
+
+from   lendres.signalprocessing.SignalProcessing                     import SignalProcessing
+
+
+class SpectralAnalysis():
+    """
+    Frequency analysis of signals (FFT amplitude spectrum, Welch power spectral density, and spectrogram).
+
+    The functions take a pandas.DataFrame (for example, a data set from DataComparison or FunctionGenerator) or a NumPy
+    array where each column is a channel.  All the channels are transformed in a single, batched call.  Real input
+    FFTs are used and the FFT length is padded to a length that factors well (scipy.fft.next_fast_len).
+
+    The sample rate is either supplied or calculated from the independent (time) column, which must be evenly spaced.
+
+    Windows are cached so repeated calls with the same window and length do not recalculate them.  The FFT plans are
+    cached by scipy.fft.
+    """
+
+
+    @classmethod
+    @functools.lru_cache(maxsize=64)
+    def GetWindow(cls, window:str|tuple, length:int) -> np.ndarray:
+        """
+        Gets a window (taper).  The windows are cached, so the returned array is read only.
+
+        Parameters
+        ----------
+        window : str | tuple
+            The window name (and parameters).  See scipy.signal.get_window.
+        length : int
+            The number of samples in the window.
+
+        Returns
+        -------
+        : np.ndarray
+            The window.
+        """
+        values = scipy.signal.get_window(window, length)
+        values.flags.writeable = False
+        return values
+
+
+    @classmethod
+    def FFT(
+            cls,
+            data:              pd.DataFrame | np.ndarray,
+            columns:           str | list                     = None,
+            independentColumn: str                            = None,
+            sampleRate:        float                          = None,
+            window:            str | tuple                    = "hann",
+            detrend:           str                            = "constant"
+        ) -> pd.DataFrame:
+        """
+        Calculates the single sided amplitude spectrum.  A sine wave of amplitude A at one of the frequencies has an
+        amplitude of A in the spectrum (for the rectangular window "boxcar," and approximately for other windows).
+
+        Parameters
+        ----------
+        data : pd.DataFrame | np.ndarray
+            The signals.  Each column is a channel.
+        columns : str | list, optional
+            The columns to transform.  If None, all the columns except the independent column are used. The default is None.
+        independentColumn : str, optional
+            The column of time values used to calculate the sample rate.  Not required if "sampleRate" is supplied. The default is None.
+        sampleRate : float, optional
+            The number of samples per unit of time. The default is None.
+        window : str | tuple, optional
+            The window applied before the transform.  See scipy.signal.get_window. The default is "hann".
+        detrend : str, optional
+            The trend removed before the transform.  See scipy.signal.detrend.
+                constant : The mean is removed.
+                linear : A least squares line is removed.
+                None : Nothing is removed.
+            The default is "constant".
+
+        Returns
+        -------
+        : pd.DataFrame
+            A "Frequency" column followed by the amplitudes of each channel.
+        """
+        signals, channels, sampleRate = cls.__GetSignals(data, columns, independentColumn, sampleRate)
+        length                        = signals.shape[0]
+
+        if detrend is not None:
+            signals = scipy.signal.detrend(signals, axis=0, type=detrend)
+
+        windowValues = cls.GetWindow(window, length)
+        fftLength    = scipy.fft.next_fast_len(length, real=True)
+        transform    = scipy.fft.rfft(signals*windowValues[:, None], n=fftLength, axis=0)
+
+        # Single sided amplitude.  The zero frequency and (for even lengths) the Nyquist frequency are not doubled.
+        amplitudes   = 2*np.abs(transform) / windowValues.sum()
+        amplitudes[0] /= 2
+        if fftLength % 2 == 0:
+            amplitudes[-1] /= 2
+
+        return cls.__ToDataFrame(scipy.fft.rfftfreq(fftLength, 1/sampleRate), amplitudes, channels)
+
+
+    @classmethod
+    def Welch(
+            cls,
+            data:              pd.DataFrame | np.ndarray,
+            columns:           str | list                     = None,
+            independentColumn: str                            = None,
+            sampleRate:        float                          = None,
+            segmentLength:     int                            = 256,
+            overlap:           int                            = None,
+            window:            str | tuple                    = "hann",
+            detrend:           str                            = "constant"
+        ) -> pd.DataFrame:
+        """
+        Calculates the power spectral density with Welch's method (averaged periodograms of overlapping segments).
+
+        Parameters
+        ----------
+        data : pd.DataFrame | np.ndarray
+            The signals.  Each column is a channel.
+        columns : str | list, optional
+            The columns to use.  See FFT. The default is None.
+        independentColumn : str, optional
+            The column of time values used to calculate the sample rate. The default is None.
+        sampleRate : float, optional
+            The number of samples per unit of time. The default is None.
+        segmentLength : int, optional
+            The number of samples in each segment.  Limited to the length of the signals. The default is 256.
+        overlap : int, optional
+            The number of samples segments overlap.  If None, half of the segment length is used. The default is None.
+        window : str | tuple, optional
+            The window applied to each segment. The default is "hann".
+        detrend : str, optional
+            The trend removed from each segment.  See FFT. The default is "constant".
+
+        Returns
+        -------
+        : pd.DataFrame
+            A "Frequency" column followed by the power spectral density of each channel.
+        """
+        signals, channels, sampleRate = cls.__GetSignals(data, columns, independentColumn, sampleRate)
+        segmentLength                 = min(segmentLength, signals.shape[0])
+
+        frequencies, densities = scipy.signal.welch(
+            signals,
+            fs       = sampleRate,
+            window   = cls.GetWindow(window, segmentLength),
+            nperseg  = segmentLength,
+            noverlap = overlap,
+            nfft     = scipy.fft.next_fast_len(segmentLength, real=True),
+            detrend  = False if detrend is None else detrend,
+            axis     = 0
+        )
+
+        return cls.__ToDataFrame(frequencies, densities, channels)
+
+
+    @classmethod
+    def Spectrogram(
+            cls,
+            data:              pd.DataFrame | np.ndarray,
+            columns:           str | list                     = None,
+            independentColumn: str                            = None,
+            sampleRate:        float                          = None,
+            segmentLength:     int                            = 256,
+            overlap:           int                            = None,
+            window:            str | tuple                    = "hann",
+            detrend:           str                            = "constant"
+        ) -> tuple[np.ndarray, np.ndarray, dict]:
+        """
+        Calculates the short time power spectral density (spectrogram) of each channel.
+
+        Parameters
+        ----------
+        data : pd.DataFrame | np.ndarray
+            The signals.  Each column is a channel.
+        columns : str | list, optional
+            The columns to use.  See FFT. The default is None.
+        independentColumn : str, optional
+            The column of time values used to calculate the sample rate.  The times returned start at the first value
+            of this column. The default is None.
+        sampleRate : float, optional
+            The number of samples per unit of time. The default is None.
+        segmentLength : int, optional
+            The number of samples in each segment.  Limited to the length of the signals. The default is 256.
+        overlap : int, optional
+            The number of samples segments overlap.  If None, one eighth of the segment length is used. The default is None.
+        window : str | tuple, optional
+            The window applied to each segment. The default is "hann".
+        detrend : str, optional
+            The trend removed from each segment.  See FFT. The default is "constant".
+
+        Returns
+        -------
+        frequencies, times, spectrograms : np.ndarray, np.ndarray, dict
+            The frequencies, the times at the middle of the segments, and a dictionary with the channels as keys and the
+            spectrograms, with shape (frequencies, times), as values.
+        """
+        signals, channels, sampleRate = cls.__GetSignals(data, columns, independentColumn, sampleRate)
+        segmentLength                 = min(segmentLength, signals.shape[0])
+
+        frequencies, times, spectrograms = scipy.signal.spectrogram(
+            signals,
+            fs       = sampleRate,
+            window   = cls.GetWindow(window, segmentLength),
+            nperseg  = segmentLength,
+            noverlap = overlap,
+            nfft     = scipy.fft.next_fast_len(segmentLength, real=True),
+            detrend  = False if detrend is None else detrend,
+            axis     = 0
+        )
+
+        if independentColumn is not None and isinstance(data, pd.DataFrame):
+            times = times + data[independentColumn].iloc[0]
+
+        # The output has the shape (frequencies, channels, times).
+        return frequencies, times, {channel : spectrograms[:, i, :] for i, channel in enumerate(channels)}
+
+
+    @classmethod
+    def GetDominantFrequencies(cls, spectrum:pd.DataFrame, number:int=3, **kwargs) -> pd.DataFrame:
+        """
+        Finds the largest peaks of each channel of a spectrum returned by FFT or Welch.
+
+        Parameters
+        ----------
+        spectrum : pd.DataFrame
+            A spectrum with a "Frequency" column.
+        number : int, optional
+            The number of frequencies to return for each channel. The default is 3.
+        **kwargs : keyword arguments
+            Keyword arguments passed to SignalProcessing.GetPeaksForChannels and the 'find_peaks' algorithm.
+
+        Returns
+        -------
+        : pd.DataFrame
+            A table with the columns "Channel," "Frequency," "Value," and "Prominence," largest peaks first.
+        """
+        arguments = {"sortBy" : "globalheight", "distance" : 1, "prominence" : 0}
+        arguments.update(kwargs)
+
+        peaks = SignalProcessing.GetPeaksForChannels(spectrum.drop(columns="Frequency"), number, **arguments)
+        peaks.insert(1, "Frequency", spectrum["Frequency"].to_numpy()[peaks["Index"].to_numpy()])
+
+        return peaks.drop(columns="Index").rename(columns={"Height" : "Value"})
+
+
+    @classmethod
+    def __GetSignals(cls, data, columns, independentColumn:str, sampleRate:float) -> tuple[np.ndarray, list, float]:
+        """
+        Gets the signals as a 2-D array (samples, channels), the channel names, and the sample rate.
+        """
+        if isinstance(data, pd.DataFrame):
+            if columns is None:
+                columns = [column for column in data.columns if column != independentColumn]
+            elif isinstance(columns, str):
+                columns = [columns]
+            signals  = data[columns].to_numpy(dtype=float)
+            channels = list(columns)
+        else:
+            signals  = np.asarray(data, dtype=float)
+            signals  = signals.reshape(-1, 1) if signals.ndim == 1 else signals
+            channels = list(range(signals.shape[1]))
+
+        if sampleRate is None:
+            if independentColumn is None:
+                raise Exception("Either the sample rate or the independent column must be supplied.")
+
+            steps = np.diff(np.asarray(data[independentColumn], dtype=float))
+            step  = np.median(steps)
+            if step <= 0 or np.max(np.abs(steps - step)) > 1e-6*step:
+                raise Exception("The independent column must be evenly spaced.  Resample the data first.")
+            sampleRate = 1.0 / step
+
+        return signals, channels, sampleRate
+
+
+    @classmethod
+    def __ToDataFrame(cls, frequencies:np.ndarray, values:np.ndarray, channels:list) -> pd.DataFrame:
+        """
+        Creates a DataFrame with a frequency column followed by one column per channel.
+        """
+        dataFrame = pd.DataFrame(values, columns=channels)
+        dataFrame.insert(0, "Frequency", frequencies)
+        return dataFrame
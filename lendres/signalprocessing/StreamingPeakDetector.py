@@ -0,0 +1,253 @@
+"""
+Created on October 18, 2026
+@author: Lance A. Endres
+"""
+import numpy                                                         as np
+from   scipy.signal                                                  import peak_prominences
+
+from   lendres.signalprocessing.SignalProcessing                     import SignalProcessing
+
+
+class StreamingPeakDetector():
+    """
+    Finds the peaks of a signal that arrives in chunks (for example, an endless stream from a sensor).
+
+    The results are the same as running scipy.signal.find_peaks with the same "height," "distance," "prominence,"
+    and "wlen" arguments on the complete signal.  The steps of find_peaks are carried out incrementally:
+        1. Local maxima are found as each chunk arrives.  A flat peak (plateau) is located at its middle sample.  A
+           plateau that is still rising or flat at the end of the data is kept until the samples after it arrive.
+        2. Peaks lower than "height" are removed.
+        3. The "distance" selection keeps the highest peak and removes all the peaks closer than "distance" to it,
+           then repeats with the next highest remaining peak.  Whether a peak is kept only depends on the higher peaks
+           within "distance" of it, so a peak is decided once none of those can be changed by samples still to come.
+        4. The prominence of a kept peak is calculated once the samples "wlen"/2 after it have arrived and peaks
+           less prominent than "prominence" are removed.
+
+    The window length (wlen) is required.  Without it, the prominence of a peak depends on the entire signal and the
+    peaks could never be reported before the stream ends.
+
+    Peaks are reported in index order.  The memory used is bounded by the window length and the distance, except for
+    signals where long runs of peaks closer than "distance" keep rising (each one removes the one before it).  The
+    peaks of such a run cannot be decided until the run ends.
+
+    Ties: if two peaks closer than "distance" have exactly the same height, the later peak is kept.  find_peaks sorts
+    the heights with an unstable sort, so for exactly equal heights its choice depends on the sorting algorithm NumPy
+    uses.  For peaks of different heights the results are identical.
+
+    Example:
+        detector = StreamingPeakDetector(wlen=201, distance=10, prominence=0.5)
+        for chunk in stream:
+            peaks, properties = detector.Process(chunk)
+        peaks, properties = detector.Finish()
+    """
+
+
+    def __init__(self, wlen:int, distance:float=None, prominence:float=None, height:float=None):
+        """
+        Constructor.
+
+        Parameters
+        ----------
+        wlen : int
+            The window length, in samples, used to calculate the prominences.  See scipy.signal.peak_prominences.
+        distance : float, optional
+            The minimum horizontal distance, in samples, between neighboring peaks. The default is None.
+        prominence : float, optional
+            The minimum prominence of the peaks. The default is None.
+        height : float, optional
+            The minimum height of the peaks. The default is None.
+
+        Returns
+        -------
+        None.
+        """
+        if wlen is None or wlen <= 1:
+            raise Exception("The window length (wlen) must be greater than 1.")
+
+        if distance is not None and distance < 1:
+            raise Exception("The distance must be greater than or equal to 1.")
+
+        self.wlen           = int(np.ceil(wlen))
+        self.halfWindow     = self.wlen // 2
+        self.distance       = 1 if distance is None else int(np.ceil(distance))
+        self.prominence     = prominence
+        self.height         = height
+
+        self.Reset()
+
+
+    def Reset(self):
+        """
+        Clears the state so a new signal can be processed.
+
+        Returns
+        -------
+        None.
+        """
+        # Samples that are still needed.  The first sample is at index "bufferStart" of the complete signal.
+        self.buffer         = np.zeros(0)
+        self.bufferStart    = 0
+        self.length         = 0
+
+        # Index where the search for local maxima continues and the lowest index a peak not yet found can have.
+        self.scanStart      = 0
+        self.frontier       = 0
+        self.finished       = False
+
+        # Peaks that were found, but were not reported or are still needed to decide the peaks after them.
+        self.positions      = np.zeros(0, dtype=np.int64)
+        self.heights        = np.zeros(0)
+        self.decided        = np.zeros(0, dtype=bool)
+        self.emitted        = np.zeros(0, dtype=bool)
+
+
+    def Process(self, chunk) -> tuple[np.ndarray, dict]:
+        """
+        Adds the next chunk of the signal and returns the peaks that are complete.
+
+        Parameters
+        ----------
+        chunk : array like
+            The next samples of the signal.
+
+        Returns
+        -------
+        peaks, properties : np.ndarray, dict
+            The indices of the new peaks (relative to the start of the signal) and their properties.  The properties
+            are the same as those returned by find_peaks: "peak_heights," "prominences," "left_bases," and "right_bases."
+            The bases are also relative to the start of the signal.
+        """
+        if self.finished:
+            raise Exception("The stream is finished.  Call Reset to process a new signal.")
+
+        chunk        = np.asarray(chunk, dtype=float).ravel()
+        self.buffer  = np.concatenate((self.buffer, chunk))
+        self.length += len(chunk)
+
+        self.__FindLocalMaxima()
+        self.__SelectByDistance()
+        return self.__Emit()
+
+
+    def Finish(self) -> tuple[np.ndarray, dict]:
+        """
+        Ends the stream and returns the remaining peaks.
+
+        Returns
+        -------
+        peaks, properties : np.ndarray, dict
+            The indices of the remaining peaks and their properties.  See Process.
+        """
+        # A plateau that reaches the end of the signal is not a peak, so no more peaks can be found.
+        self.finished = True
+        self.frontier = np.iinfo(np.int64).max
+        self.__SelectByDistance()
+        return self.__Emit()
+
+
+    def __FindLocalMaxima(self):
+        """
+        Finds the local maxima in the new samples.  A local maximum is a sample (or plateau of samples) that has a lower
+        sample on both sides.  The middle (rounded down) of a plateau is used as the peak.
+        """
+        x       = self.buffer[self.scanStart-self.bufferStart:]
+        changes = np.flatnonzero(np.diff(x) != 0)
+        signs   = np.sign(x[changes+1] - x[changes])
+
+        # A peak is a rise followed, after any number of equal samples, by a fall.
+        peaks   = np.flatnonzero((signs[:-1] > 0) & (signs[1:] < 0))
+        middles = (changes[peaks] + 1 + changes[peaks+1]) // 2
+        heights = x[middles]
+
+        if self.height is not None:
+            keep    = heights >= self.height
+            middles = middles[keep]
+            heights = heights[keep]
+
+        self.positions = np.concatenate((self.positions, middles + self.scanStart))
+        self.heights   = np.concatenate((self.heights, heights))
+        self.decided   = np.concatenate((self.decided, np.zeros(len(middles), dtype=bool)))
+        self.emitted   = np.concatenate((self.emitted, np.zeros(len(middles), dtype=bool)))
+
+        # If the data ends on a rise (possibly followed by equal samples), the search has to continue from the rise.
+        if len(signs) > 0 and signs[-1] > 0:
+            self.scanStart += int(changes[-1])
+            self.frontier   = self.scanStart + 1
+        else:
+            self.scanStart  = max(self.length-1, 0)
+            self.frontier   = self.length
+
+
+    def __SelectByDistance(self):
+        """
+        Applies the distance selection to the peaks that have not been decided yet.
+        """
+        positions       = self.positions
+
+        # Peaks that a peak not found yet could be within "distance" of are undecided.
+        kept, undecided = SignalProcessing.SelectByPeakDistance(positions, self.heights, self.distance, positions > self.frontier - self.distance)
+
+        # The removed peaks cannot affect any other peak, so they are discarded once they are decided.
+        keep           = undecided | kept
+        self.positions = positions[keep]
+        self.heights   = self.heights[keep]
+        self.decided   = ~undecided[keep]
+        self.emitted   = self.emitted[keep]
+
+
+    def __Emit(self) -> tuple[np.ndarray, dict]:
+        """
+        Calculates the prominences of the peaks that are ready and returns the peaks in index order.
+        """
+        # Peaks can only be reported once every peak before them is decided and the samples needed for their
+        # prominence have arrived.
+        undecided = np.flatnonzero(~self.decided)
+        limit     = self.frontier if len(undecided) == 0 else min(self.frontier, self.positions[undecided[0]])
+        if not self.finished:
+            limit = min(limit, self.length - self.halfWindow)
+
+        ready     = ~self.emitted & self.decided & (self.positions < limit)
+        peaks     = self.positions[ready]
+
+        prominences, leftBases, rightBases = peak_prominences(self.buffer, peaks-self.bufferStart, wlen=self.wlen)
+        properties = {
+            "peak_heights" : self.heights[ready],
+            "prominences"  : prominences,
+            "left_bases"   : leftBases + self.bufferStart,
+            "right_bases"  : rightBases + self.bufferStart
+        }
+
+        if self.prominence is not None:
+            keep       = prominences >= self.prominence
+            peaks      = peaks[keep]
+            properties = {key : value[keep] for key, value in properties.items()}
+
+        self.emitted[ready] = True
+        self.__DiscardUnneeded()
+
+        return peaks, properties
+
+
+    def __DiscardUnneeded(self):
+        """
+        Removes the peaks and samples that are no longer needed.
+        """
+        # A reported peak is only needed while a later peak could be within "distance" of it.
+        start = self.frontier
+        if not np.all(self.decided):
+            start = min(start, self.positions[~self.decided][0])
+
+        keep           = ~self.emitted | (self.positions > start - self.distance)
+        self.positions = self.positions[keep]
+        self.heights   = self.heights[keep]
+        self.decided   = self.decided[keep]
+        self.emitted   = self.emitted[keep]
+
+        # The samples are needed for the prominences of the peaks that have not been reported (including peaks not found
+        # yet) and for continuing the search for local maxima.
+        notEmitted = self.positions[~self.emitted]
+        first      = min(self.scanStart, notEmitted[0]) if len(notEmitted) > 0 else self.scanStart
+        first      = max(first - self.halfWindow, self.bufferStart)
+
+        self.buffer      = self.buffer[first-self.bufferStart:]
+        self.bufferStart = first